@@ -1,13 +1,28 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 import httpx
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from textwrap import dedent
-from instruments import Variable
+from app.functions._catalog import (
+    CatalogArgument,
+    CatalogFunction,
+    CatalogOption,
+    catalog_header,
+    read_catalog,
+)
+import hashlib
+import io
+import json
+import os
+import random
 import re
+import shutil
+import subprocess
+import time
 
-from typing import NewType
+from urllib.parse import urlsplit
 
 ALL_FUNCTIONS = [
     "ACPower",
@@ -444,11 +459,28 @@ NAME_REMAPPER = {
 }
 
 URL = "https://help.campbellsci.com/crbasic/cr1000x"
-Constant = NewType("Constant", int)
-Expression = NewType("Expression", str)
-Array = NewType("Array", Variable)
-Integer = NewType("Integer", int)
-ConstantInteger = NewType("ConstantInteger", int)
+
+CRAWL_CONCURRENCY = 8
+CRAWL_RATE = 20
+CRAWL_RETRIES = 5
+CRAWL_BACKOFF = 0.5
+TRANSIENT_STATUS = {429, 500, 502, 503, 504}
+PAGE_CACHE = "./.help_cache"
+MANIFEST = "_manifest.json"
+URL_MANIFEST = "_urls.json"
+OVERRIDES = "_overrides.json"
+# Overrides that only shape the generated module, everything else is a
+# field of the catalog entry.
+MODULE_OVERRIDES = {"extra_types", "omit_if_none"}
+
+
+def default_parser() -> str:
+    """lxml if it's installed, otherwise the much slower built-in parser."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
 
 
 TYPES = ["Variable", "Constant", "Expression", "Array", "Integer", "ConstantInteger"]
@@ -458,13 +490,7 @@ class ArgEnum(Enum):
     pass
 
 
-@dataclass
-class ArgOptions:
-    choices: str | int
-    description: str
-
-
-def parse_table(table_soup: BeautifulSoup) -> list[ArgOptions]:
+def parse_table(table_soup: BeautifulSoup) -> list[CatalogOption] | None:
     rows = table_soup.find_all("tr")[1:]
 
     if len(rows) == 0:
@@ -476,29 +502,12 @@ def parse_table(table_soup: BeautifulSoup) -> list[ArgOptions]:
         cols = row.find_all("td")
         if len(cols) > 0:
             options.append(
-                ArgOptions(cols[0].text.strip().split(" ")[0], cols[1].text.strip())
+                CatalogOption(cols[0].text.strip().split(" ")[0], cols[1].text.strip())
             )
 
     return options
 
 
-@dataclass
-class FunctionArgument:
-    name: str
-    short_name: str
-    description: str
-    type: list[str] = None
-    options: list[ArgOptions] | None = None
-
-    def __post_init__(self):
-        if self.type is None:
-            self.type = TYPES
-
-        if isinstance(self.type, list):
-            if len(self.type) == 0:
-                self.type = TYPES
-
-
 def clean_string(s: str):
     s = s.replace("\xa0", " ")
     s = s.replace("\r", "")
@@ -506,51 +515,6 @@ def clean_string(s: str):
     return s
 
 
-class CSIFunction:
-    def __init__(self, *args: FunctionArgument, name: str, source: str, remarks: str):
-        self.name = name
-        self.source = source
-        self.remarks = remarks
-        self.args = args
-
-    def __str__(self):
-        args = ", ".join(
-            f"{obj.short_name.replace(' ', '').replace('"', '').replace('/', '').replace(':', '').replace('Argument1..Argument10', '*args')}: {'Literal[' + ', '.join(f'"{x.choices.replace('"', '"')}"' for x in obj.options) + ']' if obj.options is not None else ' | '.join(obj.type)}"
-            if hasattr(obj, "type")
-            else obj.short_name
-            for obj in self.args
-        )
-        return_args = f"{','.join([f'{{{x.short_name.replace(" ", "").replace('"', "").replace("/", "").replace(":", "")}}}' for x in self.args])}"
-        arg_descriptions = "\n        ".join(
-            f"{obj.short_name} ({' | '.join(obj.type)}): {obj.description}"
-            + (
-                f"\n  Must be one of following options: {', '.join(f'{x.choices} ({x.description})' for x in obj.options)}\n"
-                if obj.options is not None
-                else "\n"
-            )
-            for obj in self.args
-        )
-        if "*args" in args:
-            return_stmt = (
-                f'return f"{self.name}({return_args},{{",".join(x for x in args)}})"'
-            )
-        else:
-            return_stmt = f'return f"{self.name}({return_args})"'
-        return dedent(f'''
-        def {self.name}({args}) -> str:
-            """For a full description of this function, visit [{self.source}]({self.source}).
-            
-            {self.remarks}
-            
-            Args:
-                {arg_descriptions}
-            Returns:
-                str: A string of the CRBasic function call.
-            """
-            {return_stmt}
-        ''')
-
-
 def get_meta(description: Tag) -> str:
     meta = {"table": None, "type": None, "description": []}
 
@@ -598,7 +562,12 @@ def get_remarks(soup: BeautifulSoup):
     return "\n".join(out)
 
 
-def get_function_def(function):
+def function_urls(function: str) -> list[str]:
+    """Candidate help page URLs for a function, most likely first.
+
+    Some pages only exist with a numeric suffix (``foo1.htm``), so the plain
+    URL is followed by up to ten numbered fallbacks.
+    """
     if "Therm10" in (url_str := function):
         strs = ["therm107", "therm108", "therm109"]
         if "CDM" in url_str:
@@ -608,22 +577,268 @@ def get_function_def(function):
         url_str = "setstatussetsetting"
 
     url_str = NAME_REMAPPER.get(url_str.lower(), url_str)
-    url = f"{URL}/Content/Instructions/{url_str.lower().replace('_', '')}.htm"
+    names = [url_str] + [f"{url_str}{i}" for i in range(1, 11)]
+    return [
+        f"{URL}/Content/Instructions/{x.lower().replace('_', '')}.htm" for x in names
+    ]
+
+
+class RateLimiter:
+    """Space requests at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class PageCache:
+    """Help pages saved on disk along with their ETag and Last-Modified.
+
+    Every help page lives in the same directory on the site, so pages are
+    stored by file name: the body in ``<page>`` and the status and validators
+    in ``<page>.json``. Missing pages (404s) are kept too, so the numbered URL
+    fallbacks can be replayed offline.
+    """
 
-    retries = 0
-    request = httpx.get(url, follow_redirects=True)
-    while request.status_code == 404 and retries < 10:
-        new_url = f"{url_str}{retries + 1}"
-        url = f"{URL}/Content/Instructions/{new_url.lower().replace('_', '')}.htm"
-        request = httpx.get(url, follow_redirects=True)
-        retries += 1
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.root, os.path.basename(urlsplit(url).path))
+
+    def get(self, url: str) -> tuple[dict, httpx.Response] | None:
+        path = self._path(url)
+        try:
+            with open(f"{path}.json") as f:
+                meta = json.load(f)
+            body = b""
+            if meta["status_code"] != 404:
+                with open(path, "rb") as f:
+                    body = f.read()
+        except FileNotFoundError:
+            return None
+
+        response = httpx.Response(
+            meta["status_code"],
+            content=body,
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            request=httpx.Request("GET", url),
+        )
+        return meta, response
+
+    def put(self, url: str, response: httpx.Response) -> None:
+        path = self._path(url)
+        if response.status_code != 404:
+            with open(path, "wb") as f:
+                f.write(response.content)
+        meta = {
+            "url": url,
+            "status_code": response.status_code,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        with open(f"{path}.json", "w") as f:
+            json.dump(meta, f, indent=2)
+
+
+@dataclass
+class Crawler:
+    """Fetches help pages over one pooled client.
+
+    At most ``concurrency`` requests are in flight, no more than ``rate``
+    start per second, and timeouts, connection errors, 429s and 5xxs are
+    retried with exponential backoff.
+
+    With a ``cache``, cached pages are revalidated with If-None-Match and
+    If-Modified-Since and a 304 is served from disk. ``offline`` never touches
+    the network and treats pages missing from the cache as missing pages.
+    """
+
+    client: httpx.AsyncClient
+    concurrency: int = CRAWL_CONCURRENCY
+    rate: float = CRAWL_RATE
+    retries: int = CRAWL_RETRIES
+    backoff: float = CRAWL_BACKOFF
+    cache: PageCache | None = None
+    offline: bool = False
+
+    def __post_init__(self):
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._limiter = RateLimiter(self.rate)
+        self._responses: dict[str, asyncio.Task[httpx.Response]] = {}
+
+    async def get(self, url: str) -> httpx.Response:
+        """Fetch a URL, at most once per crawl.
+
+        Functions documented on the same page (``Int`` and ``Fix``) and the
+        numbered fallbacks they probe share one request, even when they ask
+        for it at the same time.
+        """
+        if url not in self._responses:
+            self._responses[url] = asyncio.ensure_future(self._get(url))
+        return await self._responses[url]
+
+    async def _get(self, url: str) -> httpx.Response:
+        cached = self.cache.get(url) if self.cache is not None else None
+        if self.offline:
+            if cached is None:
+                print(f"Not cached: {url}")
+                return httpx.Response(404, request=httpx.Request("GET", url))
+            return cached[1]
+
+        headers = {}
+        if cached is not None:
+            meta, _ = cached
+            if meta["etag"]:
+                headers["If-None-Match"] = meta["etag"]
+            if meta["last_modified"]:
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = await self._request(url, headers)
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        if self.cache is not None and response.status_code in (200, 404):
+            self.cache.put(url, response)
+        return response
+
+    async def _request(self, url: str, headers: dict[str, str]) -> httpx.Response:
+        for attempt in range(self.retries + 1):
+            async with self._semaphore:
+                await self._limiter.wait()
+                try:
+                    response = await self.client.get(
+                        url, headers=headers, follow_redirects=True
+                    )
+                    if response.status_code not in TRANSIENT_STATUS:
+                        return response
+                    error = f"{response.status_code} Status Code"
+                except httpx.TransportError as e:
+                    error = repr(e)
+            if attempt == self.retries:
+                raise RuntimeError(f"Giving up on {url}: {error}")
+            await asyncio.sleep(self.backoff * 2**attempt * (1 + random.random()))
+
+    async def resolve(self, function: str) -> str | None:
+        """Find the URL of a function's help page by probing its candidates."""
+        for url in function_urls(function):
+            response = await self.get(url)
+            if response.status_code != 404:
+                response.raise_for_status()
+                return url
 
-    if request.status_code == 404:
         print(f"404 Status Code: {url}")
         return None
 
+
+@dataclass
+class Page:
+    """A crawled help page. ``fdef`` is None when the page wasn't parsed
+    because it hasn't changed, or when it doesn't describe a callable
+    instruction."""
+
+    function: str
+    hash: str
+    fdef: CatalogFunction | None = None
+    parsed: bool = False
+
+
+async def crawl(
+    functions: list[str],
+    concurrency: int = CRAWL_CONCURRENCY,
+    rate: float = CRAWL_RATE,
+    cache: PageCache | None = None,
+    offline: bool = False,
+    parser: str | None = None,
+    parse_workers: int | None = None,
+    known: dict[str, str] | None = None,
+    urls: dict[str, str | None] | None = None,
+) -> list[Page]:
+    """Fetch and parse every function's help page concurrently.
+
+    ``urls`` is the name to URL manifest. Functions missing from it are
+    resolved first and added to it, and a function whose page has moved is
+    resolved again. Functions are then grouped by page, so a page shared by
+    several functions is fetched and parsed once and split into an entry for
+    each of them.
+
+    Parsing is CPU bound, so each page is handed to a process pool as soon as
+    it arrives and downloads carry on in the meantime. Pages whose hash
+    matches the one in ``known`` for all of their functions are not parsed
+    again. Results keep the order of ``functions``, and functions without a
+    help page are left out.
+    """
+    known = known or {}
+    urls = {} if urls is None else urls
+    parser = parser or default_parser()
+    loop = asyncio.get_running_loop()
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        crawler = Crawler(
+            client, concurrency=concurrency, rate=rate, cache=cache, offline=offline
+        )
+        with ProcessPoolExecutor(parse_workers) as pool:
+
+            async def resolve(function: str) -> None:
+                if function not in urls:
+                    urls[function] = await crawler.resolve(function)
+                elif (url := urls[function]) is not None:
+                    if (await crawler.get(url)).status_code == 404:
+                        urls[function] = await crawler.resolve(function)
+
+            await asyncio.gather(*(resolve(x) for x in functions))
+
+            shared: dict[str, list[str]] = {}
+            for function in functions:
+                if (url := urls[function]) is not None:
+                    shared.setdefault(url, []).append(function)
+
+            async def fetch_and_parse(url: str, names: list[str]) -> list[Page]:
+                response = await crawler.get(url)
+                response.raise_for_status()
+                html = response.text
+                page_hash = hashlib.sha256(html.encode()).hexdigest()
+                if all(known.get(x) == page_hash for x in names):
+                    return [Page(x, page_hash) for x in names]
+                fdefs = await loop.run_in_executor(
+                    pool, parse_page, names, url, html, parser
+                )
+                return [
+                    Page(x, page_hash, fdef, parsed=True)
+                    for x, fdef in zip(names, fdefs)
+                ]
+
+            grouped = await asyncio.gather(
+                *(fetch_and_parse(url, names) for url, names in shared.items())
+            )
+
+    pages = {x.function: x for group in grouped for x in group}
+    return [pages[x] for x in functions if x in pages]
+
+
+def parse_function_def(
+    function: str, url: str, html: str, parser: str = "html.parser"
+) -> CatalogFunction | None:
+    return parse_page([function], url, html, parser)[0]
+
+
+def parse_page(
+    functions: list[str], url: str, html: str, parser: str = "html.parser"
+) -> list[CatalogFunction | None]:
+    """Parse a help page into an entry for each function it documents."""
     print(url)
-    soup = BeautifulSoup(request.text, "html.parser")
+    soup = BeautifulSoup(html, parser)
     args = soup.find_all(class_="PopupHeadingTopic")
     function_args = []
 
@@ -632,26 +847,14 @@ def get_function_def(function):
         name = clean_string(arg.text)
         short_name = re.sub(r" \(.*\)$", "", name)
 
-        if "," in short_name:
-            new_args = short_name.split(", ")
-            for n in new_args:
-                function_args.append(
-                    FunctionArgument(
-                        name=n,
-                        short_name=n,
-                        description=" ".join(meta["description"]),
-                        type=meta["type"],
-                        options=meta["table"],
-                    )
-                )
-        else:
+        options = meta["table"]
+        for n in short_name.split(", "):
             function_args.append(
-                FunctionArgument(
-                    name=clean_string(arg.text),
-                    short_name=short_name,
+                CatalogArgument(
+                    name=n,
                     description=" ".join(meta["description"]),
-                    type=meta["type"],
-                    options=meta["table"],
+                    types=tuple(meta["type"] or TYPES),
+                    options=None if options is None else tuple(options),
                 )
             )
 
@@ -661,43 +864,355 @@ def get_function_def(function):
             fun_args = re.findall(r"\((.*?)\)", syntax)[0].replace(" ", "").split(",")
         except IndexError:
             # This happens when there are no args (it is a declaration rather than a function).
-            return None
+            return [None for _ in functions]
         for x in fun_args:
             function_args.append(
-                FunctionArgument(
+                CatalogArgument(
                     name=x,
-                    short_name=x,
                     description=f"{x} (No description provided)",
-                    type=TYPES,
+                    types=tuple(TYPES),
                 )
             )
 
-    csi_function = CSIFunction(
-        *function_args,
-        name=function,
-        remarks=get_remarks(soup),
-        source=url,
+    remarks = get_remarks(soup)
+    return [
+        CatalogFunction(
+            name=function, source=url, remarks=remarks, args=tuple(function_args)
+        )
+        for function in functions
+    ]
+
+
+MODULE_HEADER = """# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+"""
+
+
+def module_name(function: str) -> str:
+    return f"_{function.lower()}"
+
+
+def annotation(arg: CatalogArgument, extra_types: list[str] | None = None) -> str:
+    if arg.options is not None:
+        ann = f"Literal[{', '.join(json.dumps(x.value, ensure_ascii=False) for x in arg.options)}]"
+    else:
+        ann = " | ".join(arg.types)
+    for t in extra_types or []:
+        ann = f"{ann} | {t}"
+    if arg.default == "None":
+        ann = f"{ann} | None"
+    return ann
+
+
+def module_source(fun: CatalogFunction, overrides: dict | None = None) -> str:
+    """Generate the module for a function from its catalog entry.
+
+    ``overrides`` are the function's entry in ``_overrides.json``. Arguments
+    with ``extra_types`` accept those types on top of their annotation, and
+    trailing arguments with ``omit_if_none`` are left out of the call when
+    they're None.
+    """
+    arg_overrides = (overrides or {}).get("args", {})
+    params, call, optional = [], [], []
+    for arg in fun.args:
+        if arg.variadic:
+            params.append(f"*args: {annotation(arg)}")
+            call.append("{','.join(str(x) for x in args)}")
+            continue
+
+        name = re.sub(r'[ "/:]', "", arg.name)
+        override = arg_overrides.get(arg.name, {})
+        default = "" if arg.default is None else f" = {arg.default}"
+        ann = annotation(arg, override.get("extra_types"))
+        params.append(f"{name}: {ann}{default}")
+        if override.get("omit_if_none"):
+            optional.append((name, len(call)))
+        elif optional:
+            raise ValueError(
+                f"{fun.name}: only trailing arguments can be omit_if_none, "
+                f"{arg.name} follows {optional[-1][0]}."
+            )
+        call.append(f"{{{name}}}")
+
+    body = [
+        f'    if {name} is None:\n        return f"{fun.name}({",".join(call[:n])})"\n'
+        for name, n in optional
+    ]
+    return (
+        f"{MODULE_HEADER}\n\n"
+        f"def {fun.name}({', '.join(params)}) -> str:\n"
+        + "".join(body)
+        + f'    return f"{fun.name}({",".join(call)})"\n'
     )
-    return csi_function
 
 
-if __name__ == "__main__":
-    import pickle
+def load_overrides(path: str) -> dict[str, dict]:
+    """Hand corrections to parsed entries, from ``_overrides.json``."""
+    try:
+        with open(os.path.join(path, OVERRIDES)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def apply_overrides(fun: CatalogFunction, overrides: dict | None) -> CatalogFunction:
+    """Merge the catalog fields of a function's overrides into its entry.
+
+    Raises:
+        ValueError: If an override names an argument the function doesn't have.
+    """
+    if not overrides:
+        return fun
+    arg_overrides = dict(overrides.get("args", {}))
+    args = []
+    for arg in fun.args:
+        fields = arg_overrides.pop(arg.name, {})
+        fields = {k: v for k, v in fields.items() if k not in MODULE_OVERRIDES}
+        if "types" in fields:
+            fields["types"] = tuple(fields["types"])
+        if fields.get("options") is not None:
+            fields["options"] = tuple(CatalogOption(**x) for x in fields["options"])
+        args.append(replace(arg, **fields))
+    if arg_overrides:
+        raise ValueError(
+            f"Overrides for {fun.name} name unknown arguments: {', '.join(arg_overrides)}."
+        )
+    return replace(fun, args=tuple(args))
+
+
+def load_manifest(path: str) -> dict[str, str]:
+    try:
+        with open(os.path.join(path, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load_urls(path: str) -> dict[str, str | None]:
+    """The name to help page URL manifest, None for functions without one."""
+    try:
+        with open(os.path.join(path, URL_MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def write_urls(urls: dict[str, str | None], path: str) -> None:
+    write_if_changed(
+        os.path.join(path, URL_MANIFEST), (json.dumps(urls, indent=2) + "\n").encode()
+    )
+
+
+def load_catalog(path: str) -> dict[str, CatalogFunction]:
+    try:
+        catalog = read_catalog(os.path.join(path, "catalog.jsonl"))
+    except FileNotFoundError:
+        return {}
+    return {x.name: x for x in catalog}
+
+
+@dataclass
+class Changes:
+    added: list[str]
+    changed: list[str]
+    removed: list[str]
+
+    def report(self) -> str:
+        return "\n".join(
+            f"{label} ({len(names)}): {', '.join(names) or '-'}"
+            for label, names in [
+                ("Added", self.added),
+                ("Changed", self.changed),
+                ("Removed", self.removed),
+            ]
+        )
+
+
+def write_package(
+    pages: list[Page], functions: list[str], path: str, rewrite: bool = False
+) -> Changes:
+    """Update the lazily loaded ``app.functions`` package from crawled pages.
+
+    ``catalog.jsonl`` gets every function's catalog entry and each function
+    gets a module generated from its entry. ``_index.py`` maps function names
+    to their module and to the byte offset and length of their catalog entry.
+    The hand-written ``__init__.py``, ``_core.py`` and ``_catalog.py`` are
+    left alone.
+
+    The help pages don't say everything, e.g. which arguments are optional,
+    so ``_overrides.json`` holds hand corrections and is merged into every
+    parsed entry. Fix functions there, never in their modules or in the
+    catalog, and run with ``rewrite`` after changing it.
+
+    ``_manifest.json`` records a hash of the help page each entry was parsed
+    from, so unchanged pages can be skipped next time. Only modules whose
+    entry changed are rewritten (all of them with ``rewrite``), modules for
+    functions in ``functions`` that no longer exist are deleted, and
+    functions that weren't crawled are kept as they are.
+    """
+    old = load_manifest(path)
+    old_catalog = load_catalog(path)
+    overrides = load_overrides(path)
+    manifest: dict[str, str] = {}
+    catalog: dict[str, CatalogFunction] = {}
+    changes = Changes([], [], [])
+    written = []
+
+    for page in pages:
+        name = page.function
+        if not page.parsed:
+            manifest[name] = page.hash
+            catalog[name] = old_catalog[name]
+            continue
+        if (fun := page.fdef) is None:
+            continue
+
+        if page.hash:
+            manifest[name] = page.hash
+        fun = catalog[name] = apply_overrides(fun, overrides.get(name))
+
+        if name not in old_catalog:
+            changes.added.append(name)
+        elif old_catalog[name] != fun:
+            changes.changed.append(name)
+        elif not rewrite:
+            continue
+        written.append(os.path.join(path, f"{module_name(name)}.py"))
+        with open(written[-1], "w") as file:
+            file.write(module_source(fun, overrides.get(name)))
+
+    for name in old_catalog:
+        if name in catalog:
+            continue
+        if name in functions:
+            changes.removed.append(name)
+            os.remove(os.path.join(path, f"{module_name(name)}.py"))
+        else:
+            catalog[name] = old_catalog[name]
+            if name in old:
+                manifest[name] = old[name]
+
+    # The generated code is long lines, tidy it up if ruff is around.
+    if written and shutil.which("ruff"):
+        subprocess.run(["ruff", "format", "--quiet", *written], check=False)
+
+    order = list(dict.fromkeys([*old_catalog, *functions]))
+    names = sorted(catalog, key=order.index)
+    write_catalog([catalog[x] for x in names], path)
+    manifest = {x: manifest[x] for x in names if x in manifest}
+    write_if_changed(
+        os.path.join(path, MANIFEST), (json.dumps(manifest, indent=2) + "\n").encode()
+    )
 
-    fun_defs = []
-    for fun in ALL_FUNCTIONS:
-        fdef = get_function_def(fun)
-        if fdef is not None:
-            fun_defs.append(fdef)
+    return changes
 
-    with open("./data.pickle", "wb") as p:
-        pickle.dump(fun_defs, p)
 
-    # with open("./data.pickle", "rb") as p:
-    #     fun_defs = pickle.load(p)
+def write_catalog(catalog: list[CatalogFunction], path: str) -> None:
+    """Write ``catalog.jsonl`` and the ``_index.py`` that points into it."""
+    offsets = {}
+    store = io.BytesIO()
+    store.write((json.dumps(catalog_header()) + "\n").encode())
+    for fun in catalog:
+        line = (json.dumps(fun.to_json(), ensure_ascii=False) + "\n").encode()
+        offsets[fun.name] = (store.tell(), len(line))
+        store.write(line)
+
+    index = io.StringIO()
+    index.write("# Generated by app/_get_functions.py, do not edit.\n")
+    index.write("FUNCTIONS: dict[str, str] = {\n")
+    for fun in catalog:
+        index.write(f'    "{fun.name}": "{module_name(fun.name)}",\n')
+    index.write("}\n")
+    index.write("CATALOG: dict[str, tuple[int, int]] = {\n")
+    for name, (offset, length) in offsets.items():
+        index.write(f'    "{name}": ({offset}, {length}),\n')
+    index.write("}\n")
+
+    write_if_changed(os.path.join(path, "catalog.jsonl"), store.getvalue())
+    write_if_changed(os.path.join(path, "_index.py"), index.getvalue().encode())
+
+
+def write_if_changed(path: str, data: bytes) -> None:
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape the CRBasic help pages.")
+    parser.add_argument("--concurrency", type=int, default=CRAWL_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=CRAWL_RATE, help="Requests/s.")
+    parser.add_argument(
+        "--cache", default=PAGE_CACHE, help="Directory of cached help pages."
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Only use pages in the cache."
+    )
+    parser.add_argument(
+        "--functions", nargs="+", default=ALL_FUNCTIONS, help="Only these functions."
+    )
+    parser.add_argument("--out", default="./functions", help="Package to write.")
+    parser.add_argument(
+        "--parser",
+        choices=["lxml", "html.parser"],
+        default=default_parser(),
+        help="BeautifulSoup backend.",
+    )
+    parser.add_argument(
+        "--parse-workers", type=int, default=None, help="Parser processes."
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-resolve URLs, re-parse every page and rewrite every module.",
+    )
+    parser.add_argument(
+        "--from-catalog",
+        metavar="CATALOG",
+        help="Generate the package from a catalog.jsonl instead of crawling.",
+    )
+    args = parser.parse_args()
+
+    manifest = {} if args.full else load_manifest(args.out)
+    if args.from_catalog:
+        catalog = read_catalog(args.from_catalog)
+        functions = [x.name for x in catalog]
+        pages = [Page(x.name, manifest.get(x.name, ""), x, True) for x in catalog]
+    else:
+        functions = args.functions
+        known = load_catalog(args.out)
+        urls = {} if args.full else load_urls(args.out)
+        pages = asyncio.run(
+            crawl(
+                functions,
+                args.concurrency,
+                args.rate,
+                cache=PageCache(args.cache),
+                offline=args.offline,
+                parser=args.parser,
+                parse_workers=args.parse_workers,
+                known={k: v for k, v in manifest.items() if k in known},
+                urls=urls,
+            )
+        )
+        write_urls(urls, args.out)
 
-    with open("./all_functions.py", "w") as file:
-        for fun in fun_defs:
-            fun = str(fun)
-            fun = re.sub(r"\n\s+(def)", r"\n\1", fun)
-            file.write(str(fun) + "\n")
+    changes = write_package(pages, functions, args.out, rewrite=args.full)
+    print(changes.report())
@@ -0,0 +1,239 @@
+"""Program builds, run off the event loop.
+
+Instantiating instruments, wiring them and constructing a program is pure
+Python and can take long enough to stall every other request, so builds run
+in a bounded pool of threads and the event loop only waits on them. Builds
+past the queue limit are rejected instead of piling up. A program can be
+streamed too: each chunk is made in the pool, as the client reads it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+BUILD_CONCURRENCY = int(os.environ.get("BUILD_CONCURRENCY", os.cpu_count() or 1))
+BUILD_QUEUE_LIMIT = int(os.environ.get("BUILD_QUEUE_LIMIT", 32))
+# How many recent builds the latency percentiles are taken over.
+BUILD_LATENCY_WINDOW = int(os.environ.get("BUILD_LATENCY_WINDOW", 256))
+
+T = TypeVar("T")
+# Marks the end of a streamed iterator, see `BuildPool.stream`.
+_DONE = object()
+
+
+class BuildPoolFull(Exception):
+    pass
+
+
+class Latency:
+    """Count, mean and percentiles of the most recent durations, in seconds."""
+
+    def __init__(self, window: int = BUILD_LATENCY_WINDOW):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    def stats(self) -> dict[str, int | float]:
+        recent = sorted(self._recent)
+        if len(recent) > 1:
+            p50, p95 = (
+                statistics.quantiles(recent, n=100, method="inclusive")[i]
+                for i in (49, 94)
+            )
+        else:
+            p50 = p95 = recent[0] if recent else 0.0
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": p50,
+            "p95": p95,
+            "max": self.max,
+        }
+
+
+class BuildPool:
+    """Runs program builds in a thread pool with bounded concurrency.
+
+    A build holds its slot until its last call in the pool returns, even if
+    the request waiting on it has gone away, so ``running`` never undercounts
+    the threads actually building. A streamed build holds it until the
+    stream ends, and the stream has to be iterated or closed to free it.
+
+    Args:
+        concurrency (int): Maximum number of builds running at once.
+        queue_limit (int): Maximum number of builds waiting for a free slot.
+            Further submissions raise ``BuildPoolFull``.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = BUILD_CONCURRENCY,
+        queue_limit: int = BUILD_QUEUE_LIMIT,
+    ):
+        self.concurrency = concurrency
+        self.queue_limit = queue_limit
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.wait_time = Latency()
+        self.build_time = Latency()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def start(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="build"
+        )
+
+    async def close(self) -> None:
+        if self._executor is not None:
+            # Let the running builds finish, drop the ones that haven't started.
+            await asyncio.to_thread(self._executor.shutdown, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Call ``fn(*args)`` in the pool once a slot is free.
+
+        Raises:
+            BuildPoolFull: If ``queue_limit`` builds are already waiting.
+        """
+        build = await self._start()
+        try:
+            result = await build.call(fn, *args)
+        except BaseException as e:
+            build.finish(e)
+            raise
+        build.finish(None)
+        return result
+
+    async def stream(self, fn: Callable[..., Iterator[T]], *args) -> AsyncIterator[T]:
+        """Call ``fn(*args)`` in the pool, then pull every item of the
+        iterator it returns in the pool too.
+
+        Errors from ``fn`` itself are raised here, before anything is
+        streamed. The build keeps its slot until the iterator is exhausted or
+        the stream is closed.
+
+        Raises:
+            BuildPoolFull: If ``queue_limit`` builds are already waiting.
+        """
+        build = await self._start()
+        try:
+            iterator = await build.call(fn, *args)
+        except BaseException as e:
+            build.finish(e)
+            raise
+        return self._stream(build, iterator)
+
+    async def _stream(self, build: _Build, iterator: Iterator[T]) -> AsyncIterator[T]:
+        error = None
+        try:
+            while (item := await build.call(next, iterator, _DONE)) is not _DONE:
+                yield item
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            build.finish(error)
+
+    async def _start(self) -> _Build:
+        if self._executor is None:
+            raise RuntimeError("The build pool hasn't been started.")
+        if self.waiting >= self.queue_limit and self._semaphore.locked():
+            self.rejected += 1
+            raise BuildPoolFull(
+                f"{self.running} builds running and {self.waiting} queued."
+            )
+
+        queued = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.wait_time.add(time.perf_counter() - queued)
+        self.running += 1
+        return _Build(self, self._executor, asyncio.get_running_loop())
+
+    def _finish(self, build: _Build, error: BaseException | None) -> None:
+        if error is None:
+            self.completed += 1
+        elif isinstance(error, Exception):
+            self.failed += 1
+        else:
+            self.cancelled += 1
+        self.build_time.add(build.elapsed)
+        self.running -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "concurrency": self.concurrency,
+            "queue_limit": self.queue_limit,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "wait_seconds": self.wait_time.stats(),
+            "build_seconds": self.build_time.stats(),
+        }
+
+
+class _Build:
+    """One build's slot in a ``BuildPool``, held across all of its calls.
+
+    ``elapsed`` is the time spent running in the pool, not waiting on the
+    client in between.
+    """
+
+    def __init__(
+        self,
+        pool: BuildPool,
+        executor: ThreadPoolExecutor,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self.pool = pool
+        self.executor = executor
+        self.loop = loop
+        self.elapsed = 0.0
+        self._pending: Future | None = None
+
+    async def call(self, fn: Callable[..., T], *args) -> T:
+        self._pending = self.executor.submit(self._timed, fn, *args)
+        return await asyncio.wrap_future(self._pending)
+
+    def _timed(self, fn: Callable[..., T], *args) -> T:
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    def finish(self, error: BaseException | None) -> None:
+        pending = self._pending
+        if pending is None or pending.done():
+            self.pool._finish(self, error)
+            return
+        # The request went away mid-call, the slot is only free once the
+        # thread returns.
+        pending.add_done_callback(
+            lambda _: self.loop.call_soon_threadsafe(self.pool._finish, self, error)
+        )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.instruments import INSTRUMENTS, Instrument
+
+CATALOG_MAX_AGE = int(os.environ.get("CATALOG_MAX_AGE", 300))
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_content(cls, content: Any) -> CatalogEntry:
+        # Serialised the same way as fastapi's default JSONResponse.
+        body = json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return cls(body, f'"{hashlib.sha256(body).hexdigest()}"')
+
+    def response(self, request: Request) -> Response:
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={CATALOG_MAX_AGE}",
+        }
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+class InstrumentCatalog:
+    """The ``GET /instruments`` responses, serialised once.
+
+    The catalog only changes between deployments, so every instrument is
+    instantiated and encoded a single time when the app starts.
+    """
+
+    def __init__(self, instruments: dict[str, type[Instrument]] = INSTRUMENTS):
+        described = {
+            instrument._id: jsonable_encoder(
+                instrument(elevation=1, sdi12_address=1).to_json()
+            )
+            for instrument in instruments.values()
+        }
+        self.names = CatalogEntry.from_content({"instruments": list(instruments)})
+        self.all = CatalogEntry.from_content(described)
+        self.instruments = {
+            name: CatalogEntry.from_content(content)
+            for name, content in described.items()
+        }
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison.
+    candidates = (x.strip().removeprefix("W/") for x in header.split(","))
+    return etag.removeprefix("W/") in candidates
@@ -0,0 +1,166 @@
+"""Long-lived compile worker used by ``CompileDaemonPool``.
+
+The worker keeps its own Xvfb display, wine prefix and persistent wineserver
+alive so individual compiles don't pay the wine start-up cost. Jobs are read
+from stdin and results written to stdout, one JSON object per line:
+
+    -> {"path": "/tmp/compile-xxxx/program.CR1X"}
+    <- {"returncode": 0, "output": "... Compiled in 0.2 seconds ..."}
+
+A single ``{"ready": true}`` line is written once the worker is warm.
+
+Run with ``--fake`` to use ``FakeCompiler`` instead of wine, e.g. when working
+on the pool somewhere without LoggerNet installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+from app.compiler import COMPILER_PATH
+
+
+class WineCompiler:
+    def __init__(self, prefix: str, workdir: str, display: int):
+        self.prefix = prefix
+        self.workdir = workdir
+        self.display = display
+        self.env = {
+            **os.environ,
+            "WINEPREFIX": prefix,
+            "DISPLAY": f":{display}",
+            "WINEDEBUG": "-all",
+        }
+        self._xvfb: subprocess.Popen | None = None
+
+    def start(self) -> None:
+        self._xvfb = subprocess.Popen(
+            ["Xvfb", f":{self.display}", "-screen", "0", "1024x768x16"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        if not os.path.exists(self.prefix):
+            # Copying an initialised prefix is much faster than booting a new one.
+            base = os.path.expanduser("~/.wine")
+            if os.path.isdir(base):
+                shutil.copytree(base, self.prefix, symlinks=True)
+            else:
+                self._quiet(["wineboot", "--init"])
+
+        # A persistent wineserver is what keeps subsequent `wine` calls cheap.
+        self._quiet(["wineserver", "--persistent"], wait=False)
+        self._quiet(["wine", "cmd", "/c", "exit"])
+
+    def compile(self, path: str) -> tuple[int, str]:
+        proc = subprocess.run(
+            ["wine", COMPILER_PATH, path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            cwd=self.workdir,
+            env=self.env,
+        )
+        output = "\n".join(
+            x for x in proc.stdout.splitlines() if "X connection to" not in x
+        )
+        return proc.returncode, output
+
+    def stop(self) -> None:
+        self._quiet(["wineserver", "--kill"])
+        if self._xvfb is not None:
+            self._xvfb.kill()
+
+    def _quiet(self, cmd: list[str], wait: bool = True) -> None:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=self.workdir,
+            env=self.env,
+        )
+        if wait:
+            proc.wait()
+
+
+class FakeCompiler:
+    """Stand-in for the CRBasic compiler that doesn't need wine.
+
+    A program compiles if it has a ``BeginProg``/``EndProg`` pair, a line
+    containing ``FAKE_COMPILE_ERROR`` fails on that line. ``FAKE_COMPILE_DELAY``
+    (seconds) simulates the compile time.
+    """
+
+    def __init__(self, delay: float | None = None):
+        self.delay = float(
+            os.environ.get("FAKE_COMPILE_DELAY", 0) if delay is None else delay
+        )
+
+    def start(self) -> None: ...
+
+    def compile(self, path: str) -> tuple[int, str]:
+        started = time.monotonic()
+        time.sleep(self.delay)
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                program = f.read()
+        except OSError as e:
+            return 1, str(e)
+
+        name = os.path.basename(path)
+        for n, line in enumerate(program.splitlines(), start=1):
+            if "FAKE_COMPILE_ERROR" in line:
+                return 0, f"{name} -- line {n}: Error: {line.strip()}"
+
+        if not re.search(r"^\s*BeginProg\b", program, re.MULTILINE):
+            return 0, f"{name} -- Error: BeginProg not found"
+        if not re.search(r"^\s*EndProg\b", program, re.MULTILINE):
+            return 0, f"{name} -- Error: EndProg not found"
+
+        return 0, f"{name} -- Compiled in {time.monotonic() - started:.2f} seconds."
+
+    def stop(self) -> None: ...
+
+
+def serve(compiler: WineCompiler | FakeCompiler) -> None:
+    compiler.start()
+    _send({"ready": True})
+    try:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            try:
+                returncode, output = compiler.compile(job["path"])
+            except Exception as e:
+                returncode, output = 1, f"{type(e).__name__}: {e}"
+            _send({"returncode": returncode, "output": output})
+    finally:
+        compiler.stop()
+
+
+def _send(message: dict) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefix", required=True, help="WINEPREFIX for this worker")
+    parser.add_argument("--workdir", required=True)
+    parser.add_argument("--display", type=int, required=True, help="Xvfb display")
+    parser.add_argument("--fake", action="store_true", help="Use FakeCompiler")
+    args = parser.parse_args()
+
+    os.makedirs(args.workdir, exist_ok=True)
+    if args.fake:
+        serve(FakeCompiler())
+    else:
+        serve(WineCompiler(args.prefix, args.workdir, args.display))
@@ -0,0 +1,579 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import cache
+from typing import AsyncIterator, BinaryIO, Literal, Protocol
+
+WORKDIR = "/home/wine"
+COMPILER_PATH = os.environ.get("COMPILER_PATH", "/opt/ln/cr1000xcomp.exe")
+COMPILE_CACHE_SIZE = int(os.environ.get("COMPILE_CACHE_SIZE", 512))
+COMPILE_CACHE_TTL = float(os.environ.get("COMPILE_CACHE_TTL", 24 * 60 * 60))
+COMPILE_CONCURRENCY = int(os.environ.get("COMPILE_CONCURRENCY", os.cpu_count() or 1))
+COMPILE_TIMEOUT = float(os.environ.get("COMPILE_TIMEOUT", 120))
+COMPILE_QUEUE_LIMIT = int(os.environ.get("COMPILE_QUEUE_LIMIT", 16))
+COMPILE_SCRATCH = os.environ.get("COMPILE_SCRATCH") or (
+    "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+)
+# First Xvfb display of the subprocess pool, each slot gets the next one up.
+COMPILE_DISPLAY = int(os.environ.get("COMPILE_DISPLAY", 99))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# "subprocess" starts check_compile for every job, "daemon" hands jobs to a
+# pool of pre-warmed `app.compile_worker` processes.
+COMPILE_MODE = os.environ.get("COMPILE_MODE", "subprocess")
+COMPILE_FAKE = os.environ.get("COMPILE_FAKE", "false").lower() in ("1", "true")
+COMPILE_WORKER_ROOT = os.environ.get("COMPILE_WORKER_ROOT", f"{WORKDIR}/workers")
+COMPILE_WORKER_DISPLAY = int(os.environ.get("COMPILE_WORKER_DISPLAY", 100))
+COMPILE_WORKER_STARTUP_TIMEOUT = float(
+    os.environ.get("COMPILE_WORKER_STARTUP_TIMEOUT", 300)
+)
+
+
+@dataclass(frozen=True)
+class CompileResult:
+    status: Literal["succeeded", "failed", "error"]
+    output: str
+
+    @classmethod
+    def from_output(cls, output: str) -> CompileResult:
+        if "Compiled in" in output:
+            return cls("succeeded", output)
+        return cls("failed", output)
+
+    @property
+    def cacheable(self) -> bool:
+        # Errors come from the compile checker itself (wine crashing, a non-zero
+        # exit, ...) rather than from the program, so they aren't repeatable.
+        return self.status != "error"
+
+    def to_json(self) -> dict[str, str]:
+        if self.status == "succeeded":
+            return {"message": "Compilation succeeded", "output": self.output}
+        if self.status == "failed":
+            return {"message": "Compilation failed", "details": self.output}
+        return {"error": "Compilation check failed", "details": self.output}
+
+    @property
+    def status_code(self) -> int:
+        return 200 if self.status == "succeeded" else 400
+
+
+@cache
+def compiler_version() -> str:
+    """Identify the installed compiler so cached results are dropped on upgrade.
+
+    ``COMPILER_VERSION`` can be set to pin the value, otherwise the compiler
+    executable is hashed once per process.
+    """
+    if version := os.environ.get("COMPILER_VERSION"):
+        return version
+
+    h = hashlib.sha256()
+    try:
+        with open(COMPILER_PATH, "rb") as f:
+            while chunk := f.read(1 << 20):
+                h.update(chunk)
+    except OSError:
+        return "unknown"
+    return h.hexdigest()
+
+
+def program_hash(version: str | None = None) -> hashlib._Hash:
+    """Start a program hash, seeded with the compiler version.
+
+    Feed it the program bytes with ``update`` and use ``hexdigest`` as the
+    cache key.
+    """
+    h = hashlib.sha256()
+    h.update((version or compiler_version()).encode())
+    h.update(b"\0")
+    return h
+
+
+def cache_key(program: bytes, version: str | None = None) -> str:
+    h = program_hash(version)
+    h.update(program)
+    return h.hexdigest()
+
+
+class Upload(Protocol):
+    filename: str | None
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+class ZipMember:
+    """Exposes a member of a zip archive as an ``Upload``."""
+
+    def __init__(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo):
+        self.filename = info.filename
+        self._archive = archive
+        self._info = info
+        self._file = None
+
+    async def read(self, size: int = -1) -> bytes:
+        # Decompressing blocks, keep it off the event loop.
+        return await asyncio.to_thread(self._read, size)
+
+    def _read(self, size: int) -> bytes:
+        if self._file is None:
+            self._file = self._archive.open(self._info)
+        chunk = self._file.read(size)
+        if not chunk:
+            self._file.close()
+        return chunk
+
+
+def zip_members(file: BinaryIO) -> list[ZipMember]:
+    archive = zipfile.ZipFile(file)
+    return [
+        ZipMember(archive, info)
+        for info in archive.infolist()
+        if not info.is_dir() and not info.filename.startswith("__MACOSX/")
+    ]
+
+
+@dataclass(frozen=True)
+class StagedProgram:
+    path: str
+    key: str
+    size: int
+
+
+@contextlib.asynccontextmanager
+async def stage_upload(
+    upload: Upload, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[StagedProgram]:
+    """Copy an upload into its own scratch directory, hashing it on the way.
+
+    The directory lives under ``COMPILE_SCRATCH`` (tmpfs when available) and is
+    removed on exit, so concurrent uploads with the same name can't collide and
+    the program is never held in memory as a whole. Hashing and writing run in
+    a thread, so large uploads don't stall the event loop.
+    """
+    directory = tempfile.mkdtemp(prefix="compile-", dir=COMPILE_SCRATCH)
+    try:
+        name = os.path.basename(upload.filename or "") or "program.CR1X"
+        path = os.path.join(directory, name)
+        h = program_hash(await asyncio.to_thread(compiler_version))
+        size = 0
+
+        def write(f: BinaryIO, chunk: bytes) -> None:
+            h.update(chunk)
+            f.write(chunk)
+
+        f = await asyncio.to_thread(open, path, "wb")
+        try:
+            while chunk := await upload.read(chunk_size):
+                await asyncio.to_thread(write, f, chunk)
+                size += len(chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+
+        yield StagedProgram(path, h.hexdigest(), size)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# Stand in for the staged program's location in cached output, so a hit can
+# show the requester's own file.
+_SCRATCH_DIR = "\x00dir\x00"
+_WINE_SCRATCH_DIR = "\x00winedir\x00"
+_PROGRAM_NAME = "\x00name\x00"
+
+
+def _wine_path(path: str) -> str:
+    return "Z:" + path.replace("/", "\\")
+
+
+def _scratch_patterns(path: str) -> list[tuple[re.Pattern, str]]:
+    directory, name = os.path.split(path)
+    return [
+        (
+            re.compile(re.escape(_wine_path(directory)), re.IGNORECASE),
+            _WINE_SCRATCH_DIR,
+        ),
+        (re.compile(re.escape(directory)), _SCRATCH_DIR),
+        (re.compile(rf"(?<![\w.-]){re.escape(name)}(?![\w.-])"), _PROGRAM_NAME),
+    ]
+
+
+def _without_upload(result: CompileResult, path: str) -> CompileResult:
+    """Replace the staged program's directory and filename in the output."""
+    output = result.output
+    for pattern, placeholder in _scratch_patterns(path):
+        output = pattern.sub(placeholder, output)
+    return replace(result, output=output)
+
+
+def _with_upload(result: CompileResult, path: str) -> CompileResult:
+    """Undo ``_without_upload`` for another staged program."""
+    directory, name = os.path.split(path)
+    output = (
+        result.output.replace(_WINE_SCRATCH_DIR, _wine_path(directory))
+        .replace(_SCRATCH_DIR, directory)
+        .replace(_PROGRAM_NAME, name)
+    )
+    return replace(result, output=output)
+
+
+class CompileCache:
+    """LRU cache of compile results with a time-to-live.
+
+    Results are stored without the uploader's scratch directory and filename,
+    and handed out with the requester's.
+
+    Args:
+        maxsize (int): Maximum number of results to hold. 0 disables the cache.
+        ttl (float): Seconds before an entry is considered stale. 0 or less means
+            entries never expire.
+    """
+
+    def __init__(
+        self, maxsize: int = COMPILE_CACHE_SIZE, ttl: float = COMPILE_CACHE_TTL
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, CompileResult]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, program: StagedProgram) -> CompileResult | None:
+        key = program.key
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored, result = entry
+        if self.ttl > 0 and time.monotonic() - stored > self.ttl:
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return _with_upload(result, program.path)
+
+    def put(self, program: StagedProgram, result: CompileResult) -> None:
+        if self.maxsize <= 0 or not result.cacheable:
+            return
+
+        key = program.key
+        self._entries[key] = (time.monotonic(), _without_upload(result, program.path))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class CompilePoolFull(Exception):
+    pass
+
+
+class CompilePool:
+    """Runs the compile checker as asyncio subprocesses with bounded concurrency.
+
+    Args:
+        concurrency (int): Maximum number of compiles running at once.
+        timeout (float): Seconds a single compile may run before it is killed.
+        queue_limit (int): Maximum number of compiles waiting for a free slot.
+            Further submissions raise ``CompilePoolFull``.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = COMPILE_CONCURRENCY,
+        timeout: float = COMPILE_TIMEOUT,
+        queue_limit: int = COMPILE_QUEUE_LIMIT,
+    ):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.queue_limit = queue_limit
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # check_compile starts its own Xvfb, so concurrent compiles need
+        # different displays. The semaphore guarantees one is free.
+        self._displays = list(range(COMPILE_DISPLAY, COMPILE_DISPLAY + concurrency))
+
+    async def start(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def compile(self, path: str) -> CompileResult:
+        if self.waiting >= self.queue_limit and self._semaphore.locked():
+            self.rejected += 1
+            raise CompilePoolFull(
+                f"{self.running} compiles running and {self.waiting} queued."
+            )
+
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.running += 1
+        try:
+            return await self._run(path)
+        finally:
+            self.running -= 1
+            self._semaphore.release()
+
+    async def _run(self, path: str) -> CompileResult:
+        display = self._displays.pop()
+        try:
+            return await self._check_compile(path, display)
+        finally:
+            self._displays.append(display)
+
+    async def _check_compile(self, path: str, display: int) -> CompileResult:
+        proc = await asyncio.create_subprocess_exec(
+            "check_compile",
+            path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=WORKDIR,
+            env={**os.environ, "COMPILE_DISPLAY": str(display)},
+            # check_compile starts Xvfb and wine, so kill the whole group.
+            start_new_session=True,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            await _kill(proc)
+            return CompileResult(
+                "error", f"Compilation timed out after {self.timeout} seconds."
+            )
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            await _kill(proc)
+            raise
+
+        self.completed += 1
+        output = stdout.decode(errors="replace")
+        if proc.returncode != 0:
+            return CompileResult("error", output)
+        return CompileResult.from_output(output)
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "mode": "subprocess",
+            "concurrency": self.concurrency,
+            "timeout": self.timeout,
+            "queue_limit": self.queue_limit,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+        }
+
+
+class CompileWorker:
+    """Handle on a single ``app.compile_worker`` process."""
+
+    def __init__(self, index: int, root: str = COMPILE_WORKER_ROOT, fake: bool = False):
+        self.index = index
+        self.prefix = f"{root}/{index}/prefix"
+        self.workdir = f"{root}/{index}/work"
+        self.display = COMPILE_WORKER_DISPLAY + index
+        self.fake = fake
+        self.proc: asyncio.subprocess.Process | None = None
+
+    async def start(self) -> None:
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "app.compile_worker",
+            "--prefix",
+            self.prefix,
+            "--workdir",
+            self.workdir,
+            "--display",
+            str(self.display),
+            *(["--fake"] if self.fake else []),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            start_new_session=True,
+        )
+        ready = await asyncio.wait_for(self._read(), COMPILE_WORKER_STARTUP_TIMEOUT)
+        if not ready.get("ready"):
+            raise RuntimeError(f"Compile worker {self.index} failed to start.")
+
+    async def compile(self, path: str) -> CompileResult:
+        self.proc.stdin.write(json.dumps({"path": path}).encode() + b"\n")
+        await self.proc.stdin.drain()
+        reply = await self._read()
+        if reply["returncode"] != 0:
+            return CompileResult("error", reply["output"])
+        return CompileResult.from_output(reply["output"])
+
+    async def stop(self) -> None:
+        if self.proc is not None:
+            await _kill(self.proc)
+
+    async def _read(self) -> dict:
+        line = await self.proc.stdout.readline()
+        if not line:
+            raise EOFError(f"Compile worker {self.index} exited.")
+        return json.loads(line)
+
+
+class CompileDaemonPool(CompilePool):
+    """Compile pool backed by pre-warmed ``CompileWorker`` processes.
+
+    Args:
+        workers (int): Number of worker processes, which is also the maximum
+            number of compiles running at once.
+        timeout (float): Seconds a single compile may run before its worker is
+            killed and replaced.
+        queue_limit (int): Maximum number of compiles waiting for a free worker.
+        fake (bool): Run the workers with ``FakeCompiler`` instead of wine.
+        root (str): Directory the workers keep their wine prefix and work
+            directory in.
+    """
+
+    def __init__(
+        self,
+        workers: int = COMPILE_CONCURRENCY,
+        timeout: float = COMPILE_TIMEOUT,
+        queue_limit: int = COMPILE_QUEUE_LIMIT,
+        fake: bool = COMPILE_FAKE,
+        root: str = COMPILE_WORKER_ROOT,
+    ):
+        super().__init__(workers, timeout, queue_limit)
+        self.fake = fake
+        self.root = root
+        self.restarts = 0
+        self.closed = False
+        self._idle: asyncio.Queue[CompileWorker] = asyncio.Queue()
+        self._respawning: set[asyncio.Task] = set()
+        # Every worker, idle, busy or being respawned, so all of them are
+        # stopped on close.
+        self._workers: list[CompileWorker] = []
+
+    async def start(self) -> None:
+        self._workers = [
+            CompileWorker(i, root=self.root, fake=self.fake)
+            for i in range(self.concurrency)
+        ]
+        await asyncio.gather(*(x.start() for x in self._workers))
+        for worker in self._workers:
+            self._idle.put_nowait(worker)
+
+    async def close(self) -> None:
+        self.closed = True
+        for task in self._respawning:
+            task.cancel()
+        await asyncio.gather(*self._respawning, return_exceptions=True)
+        # Busy workers too: their jobs fail with an error and aren't respawned.
+        await asyncio.gather(*(x.stop() for x in self._workers))
+
+    async def _run(self, path: str) -> CompileResult:
+        # The semaphore in `compile` guarantees a worker is (or will shortly
+        # be, if one is being respawned) available.
+        worker = await self._idle.get()
+        try:
+            result = await asyncio.wait_for(worker.compile(path), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self._respawn(worker)
+            return CompileResult(
+                "error", f"Compilation timed out after {self.timeout} seconds."
+            )
+        except asyncio.CancelledError:
+            # The worker is mid-job and its reply would be read by the next one.
+            self.cancelled += 1
+            self._respawn(worker)
+            raise
+        except (EOFError, OSError, ValueError) as e:
+            self._respawn(worker)
+            return CompileResult("error", str(e))
+
+        self.completed += 1
+        self._idle.put_nowait(worker)
+        return result
+
+    def _respawn(self, worker: CompileWorker) -> None:
+        if self.closed:
+            return
+        task = asyncio.create_task(self._restart(worker))
+        self._respawning.add(task)
+        task.add_done_callback(self._respawning.discard)
+
+    async def _restart(self, worker: CompileWorker) -> None:
+        await worker.stop()
+        delay = 1.0
+        while True:
+            self.restarts += 1
+            try:
+                await worker.start()
+            except (asyncio.TimeoutError, EOFError, OSError, RuntimeError):
+                await worker.stop()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60)
+                continue
+            self._idle.put_nowait(worker)
+            return
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            **super().stats(),
+            "mode": "daemon",
+            "idle_workers": self._idle.qsize(),
+            "restarts": self.restarts,
+        }
+
+
+def make_pool() -> CompilePool:
+    if COMPILE_MODE == "daemon":
+        return CompileDaemonPool()
+    return CompilePool()
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    await proc.wait()
@@ -0,0 +1,62 @@
+"""CRBasic instructions.
+
+The instructions are generated by ``app/_get_functions.py``, one module per
+instruction, and a module is only imported the first time its instruction is
+looked up (``functions.Average``, ``from app.functions import Sample``). The
+core types are always loaded. Everything known about the instructions (arguments,
+types, options, source and remarks) lives in the catalog instead, and is read
+on demand with ``function_def`` and ``function_doc``.
+"""
+
+from importlib import import_module
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    DataType,
+    Expression,
+    Integer,
+    Variable,
+    VarType,
+    custom,
+)
+from app.functions._catalog import (
+    CatalogError,
+    CatalogFunction,
+    function_def,
+    function_doc,
+)
+from app.functions._index import FUNCTIONS
+
+__all__ = [
+    "Array",
+    "Constant",
+    "ConstantInteger",
+    "DataType",
+    "Expression",
+    "Integer",
+    "Variable",
+    "VarType",
+    "custom",
+    "CatalogError",
+    "CatalogFunction",
+    "function_def",
+    "function_doc",
+]
+
+
+def __getattr__(name: str):
+    try:
+        module = FUNCTIONS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    # Cache on the package so later lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *FUNCTIONS})
@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ACos(
+    Number: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"ACos({Number})"
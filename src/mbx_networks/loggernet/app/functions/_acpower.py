@@ -0,0 +1,27 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ACPower(
+    DestAC: Variable,
+    ConfigAC: Literal["1", "2", "3"],
+    LineFrq: Constant,
+    ChanV: Constant,
+    MultV: Constant,
+    MaxVrms: Constant,
+    ChanI: Constant,
+    MultI: Constant,
+    MaxIrms: Constant,
+    RepsI: Constant,
+) -> str:
+    return f"ACPower({DestAC},{ConfigAC},{LineFrq},{ChanV},{MultV},{MaxVrms},{ChanI},{MultI},{MaxIrms},{RepsI})"
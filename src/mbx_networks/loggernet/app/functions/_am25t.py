@@ -0,0 +1,43 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def AM25T(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Range: Literal[
+        "mV5000",
+        "mV1000",
+        "mv200",
+        "Autorange",
+        "AutorangeC",
+        "mV5000C",
+        "mV1000C",
+        "mV200C",
+    ],
+    AM25TChan: Constant,
+    DiffChan: Constant,
+    TCType: Literal[
+        "mV", "TypeT", "TypeE", "TypeK", "TypeJ", "TypeB", "TypeR", "TypeS", "TypeN"
+    ],
+    TRef: Variable | Expression | Array,
+    ClkPort: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    ResetPort: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    ExcitationChannel: Literal["0", "VX1", "VX2", "VX3", "VX4"],
+    ReverseDifferential: Literal["False", "True"],
+    SettlingTime: Constant,
+    fN1: Literal["15000", "60", "50"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"AM25T({Dest},{Reps},{Range},{AM25TChan},{DiffChan},{TCType},{TRef},{ClkPort},{ResetPort},{ExcitationChannel},{ReverseDifferential},{SettlingTime},{fN1},{Mult},{Offset})"
@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ArgosData(
+    ResultCode: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ST20Buffer: Constant | Integer,
+    DataTable: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NumRecords: Variable,
+    DataFormat: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"ArgosData({ResultCode},{ST20Buffer},{DataTable},{NumRecords},{DataFormat})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ArgosDataRepeat(
+    ResultCode: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RepeatRate: Constant | Integer,
+    RepeatCount: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    BufferArray: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"ArgosDataRepeat({ResultCode},{RepeatRate},{RepeatCount},{BufferArray})"
@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ArgosSetup(
+    ResultCode: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ST20Buffer: Constant | Integer,
+    DecimalID: Constant | Integer,
+    HexadecimalID: Constant | Integer,
+    Frequency: Constant | Integer,
+) -> str:
+    return (
+        f"ArgosSetup({ResultCode},{ST20Buffer},{DecimalID},{HexadecimalID},{Frequency})"
+    )
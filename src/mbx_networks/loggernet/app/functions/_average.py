@@ -0,0 +1,32 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Average(
+    Reps: Constant,
+    Source: Variable,
+    DataType: Literal[
+        "IEEE4",
+        "String",
+        "Boolean",
+        "BOOL8",
+        "Long",
+        "NSEC",
+        "UINT1",
+        "UINT2",
+        "UINT4",
+        "FP2",
+    ],
+    DisableVar: Variable | Constant | Expression,
+) -> str:
+    return f"Average({Reps},{Source},{DataType},{DisableVar})"
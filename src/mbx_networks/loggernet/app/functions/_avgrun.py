@@ -0,0 +1,25 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def AvgRun(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Source: Variable,
+    Number: Constant,
+    RunReset: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Count: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TotalCalls: Constant,
+    Call_ID: Integer,
+) -> str:
+    return f"AvgRun({Dest},{Reps},{Source},{Number},{RunReset},{Count},{TotalCalls},{Call_ID})"
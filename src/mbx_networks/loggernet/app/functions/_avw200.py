@@ -0,0 +1,43 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def AVW200(
+    Result: Literal["0", "≥1", "-3", "-5", "-20"],
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    NeighborAddr: Integer,
+    PakBusAddr: Integer,
+    Destination: Variable,
+    AVWChan: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    MuxChannel: Constant,
+    Reps: Variable | Constant,
+    BeginFreq: Constant,
+    EndFreq: Constant,
+    ExVolt: Constant,
+    Therm50_60Hz: Literal["0", "60", "50"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+    AmpThreshold: Constant,
+) -> str:
+    return f"AVW200({Result},{ComPort},{NeighborAddr},{PakBusAddr},{Destination},{AVWChan},{MuxChannel},{Reps},{BeginFreq},{EndFreq},{ExVolt},{Therm50_60Hz},{Mult},{Offset},{AmpThreshold})"
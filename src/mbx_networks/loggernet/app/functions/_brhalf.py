@@ -0,0 +1,38 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def BrHalf(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Range: Literal[
+        "mV5000",
+        "mV1000",
+        "mv200",
+        "Autorange",
+        "AutorangeC",
+        "mV5000C",
+        "mV1000C",
+        "mV200C",
+    ],
+    SEChan: Constant,
+    ExChan: Literal["VX1", "VX2", "VX3", "VX4"],
+    MeasPEx: Constant,
+    ExmV: Variable | Constant,
+    RevEx: Constant,
+    SettlingTime: Constant,
+    fN1: Literal["15000", "60", "50"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"BrHalf({Dest},{Reps},{Range},{SEChan},{ExChan},{MeasPEx},{ExmV},{RevEx},{SettlingTime},{fN1},{Mult},{Offset})"
@@ -0,0 +1,40 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def BrHalf4W(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Range: Literal[
+        "mV5000",
+        "mV1000",
+        "mv200",
+        "Autorange",
+        "AutorangeC",
+        "mV5000C",
+        "mV1000C",
+        "mV200C",
+    ],
+    DiffChan: Literal["1", "2", "3", "4", "5", "6", "7", "8"],
+    ExChan: Literal["VX1", "VX2", "VX3", "VX4"],
+    MeasPEx: Constant,
+    ExmV: Variable | Constant,
+    RevEx: Constant,
+    ReverseDifferential: Literal["False", "True"],
+    SettlingTime: Constant,
+    fN1: Literal["15000", "60", "50"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+    ReturnV1: Literal["0", "≠0"],
+) -> str:
+    return f"BrHalf4W({Dest},{Reps},{Range},{DiffChan},{ExChan},{MeasPEx},{ExmV},{RevEx},{ReverseDifferential},{SettlingTime},{fN1},{Mult},{Offset},{ReturnV1})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CalFile(
+    SourceDest: Variable | Array,
+    NumVals: Constant,
+    DeviceFilename: Literal["CPU:", "CRD:", "USR:", "USB:"],
+    Option: Literal["0", "1"],
+) -> str:
+    return f"CalFile({SourceDest},{NumVals},{DeviceFilename},{Option})"
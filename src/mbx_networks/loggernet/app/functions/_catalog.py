@@ -0,0 +1,209 @@
+"""The CRBasic function catalog.
+
+``catalog.jsonl`` is the single source for the generated function modules,
+their documentation and the ``/functions`` endpoints. The first line is a
+header naming the format and schema version, and every following line is one
+function. ``_index.CATALOG`` maps a function name to the byte offset and
+length of its line, so a single function is read straight out of a memory
+mapped file without loading the rest.
+"""
+
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from app.functions._index import CATALOG
+
+CATALOG_FORMAT = "crbasic-catalog"
+CATALOG_VERSION = 1
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "catalog.jsonl")
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def _check(record: dict[str, Any], key: str, kind: type, nullable: bool = False):
+    if not isinstance(record, dict):
+        raise CatalogError(f"Expected an object, got {record!r}.")
+    value = record.get(key)
+    if value is None and nullable:
+        return None
+    if not isinstance(value, kind):
+        raise CatalogError(f"{key!r} must be a {kind.__name__}, got {value!r}.")
+    return value
+
+
+@dataclass(frozen=True)
+class CatalogOption:
+    value: str
+    description: str
+
+    @classmethod
+    def from_json(cls, record: dict[str, Any]) -> "CatalogOption":
+        return cls(_check(record, "value", str), _check(record, "description", str))
+
+    def to_json(self) -> dict[str, Any]:
+        return {"value": self.value, "description": self.description}
+
+
+@dataclass(frozen=True)
+class CatalogArgument:
+    name: str
+    description: str
+    types: tuple[str, ...]
+    options: tuple[CatalogOption, ...] | None = None
+    # Python source for the default value, e.g. "0" or "None".
+    default: str | None = None
+
+    @property
+    def variadic(self) -> bool:
+        return self.name == "Argument1..Argument10"
+
+    @classmethod
+    def from_json(cls, record: dict[str, Any]) -> "CatalogArgument":
+        types = _check(record, "types", list)
+        if not all(isinstance(x, str) for x in types):
+            raise CatalogError(f"'types' must only contain strings, got {types!r}.")
+        options = _check(record, "options", list, nullable=True)
+        return cls(
+            _check(record, "name", str),
+            _check(record, "description", str),
+            tuple(types),
+            None if options is None else tuple(map(CatalogOption.from_json, options)),
+            _check(record, "default", str, nullable=True),
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "types": list(self.types),
+            "options": None
+            if self.options is None
+            else [x.to_json() for x in self.options],
+            "default": self.default,
+        }
+
+
+@dataclass(frozen=True)
+class CatalogFunction:
+    name: str
+    source: str
+    remarks: str
+    args: tuple[CatalogArgument, ...]
+
+    @classmethod
+    def from_json(cls, record: dict[str, Any]) -> "CatalogFunction":
+        try:
+            return cls(
+                _check(record, "name", str),
+                _check(record, "source", str),
+                _check(record, "remarks", str),
+                tuple(map(CatalogArgument.from_json, _check(record, "args", list))),
+            )
+        except CatalogError as e:
+            raise CatalogError(
+                f"Invalid catalog entry {record.get('name')}: {e}"
+            ) from None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "source": self.source,
+            "remarks": self.remarks,
+            "args": [x.to_json() for x in self.args],
+        }
+
+    @property
+    def doc(self) -> str:
+        """The scraped documentation, formatted like a docstring."""
+        arg_descriptions = "\n".join(
+            f"{x.name} ({' | '.join(x.types)}): {x.description}"
+            + (
+                "\nMust be one of following options: "
+                + ", ".join(f"{o.value} ({o.description})" for o in x.options)
+                + "\n"
+                if x.options is not None
+                else "\n"
+            )
+            for x in self.args
+        )
+        doc = "\n\n".join(
+            x
+            for x in [
+                f"For a full description of this function, visit [{self.source}]({self.source}).",
+                self.remarks,
+                f"Args:\n{arg_descriptions}\nReturns:\nstr: A string of the CRBasic function call.",
+            ]
+            if x
+        )
+        return "\n".join(x.strip() for x in doc.splitlines())
+
+
+def catalog_header() -> dict[str, Any]:
+    return {"format": CATALOG_FORMAT, "version": CATALOG_VERSION}
+
+
+def check_header(line: bytes) -> None:
+    try:
+        header = json.loads(line)
+    except ValueError:
+        raise CatalogError("The catalog is missing its header line.") from None
+    if not isinstance(header, dict) or header.get("format") != CATALOG_FORMAT:
+        raise CatalogError(f"Not a {CATALOG_FORMAT} file.")
+    if header.get("version") != CATALOG_VERSION:
+        raise CatalogError(
+            f"Catalog version {header.get('version')} is not supported, expected {CATALOG_VERSION}."
+        )
+
+
+def read_catalog(path: str = CATALOG_PATH) -> list[CatalogFunction]:
+    """Load and check every function in a catalog file."""
+    with open(path, "rb") as f:
+        check_header(f.readline())
+        return [CatalogFunction.from_json(json.loads(line)) for line in f]
+
+
+@cache
+def _mapped_catalog() -> mmap.mmap:
+    with open(CATALOG_PATH, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    check_header(mapped[: mapped.find(b"\n")])
+    return mapped
+
+
+def function_def(name: str) -> CatalogFunction | None:
+    """Read one function from the catalog.
+
+    Args:
+        name (str): Name of the function, e.g. ``"Average"``.
+
+    Returns:
+        CatalogFunction | None: The function, or None if there is no such function.
+    """
+    try:
+        offset, length = CATALOG[name]
+    except KeyError:
+        return None
+
+    return CatalogFunction.from_json(
+        json.loads(_mapped_catalog()[offset : offset + length])
+    )
+
+
+def function_doc(name: str) -> str | None:
+    """Read the documentation for a CRBasic function from the catalog.
+
+    Args:
+        name (str): Name of the function, e.g. ``"Average"``.
+
+    Returns:
+        str | None: The documentation, or None if there is no such function.
+    """
+    if (fun := function_def(name)) is None:
+        return None
+    return fun.doc
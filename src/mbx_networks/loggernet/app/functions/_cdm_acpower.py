@@ -0,0 +1,29 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_ACPower(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    DestAC: Variable,
+    ConfigAC: Literal["1", "2", "3"],
+    LineFrq: Constant,
+    ChanV: Constant,
+    MultV: Constant,
+    MaxVrms: Constant,
+    ChanI: Constant,
+    MultI: Constant,
+    MaxIrms: Constant,
+    RepsI: Constant,
+) -> str:
+    return f"CDM_ACPower({CDMType},{CPIAddress},{DestAC},{ConfigAC},{LineFrq},{ChanV},{MultV},{MaxVrms},{ChanI},{MultI},{MaxIrms},{RepsI})"
@@ -0,0 +1,59 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_BrFull6W(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    Dest: Variable | Array,
+    Reps: Constant,
+    Range: Literal[
+        "mV5000",
+        "mV1000",
+        "mV200",
+        "Autorange",
+        "AutorangeC",
+        "mV5000C",
+        "mV1000C",
+        "mV200C",
+    ],
+    DiffChan: Constant,
+    ExChan: Constant,
+    MeasPEx: Constant,
+    ExmV: Constant,
+    RevEx: Constant,
+    ReverseDifferential: Literal["False", "True"],
+    SettlingTime: Constant,
+    fN1: Literal[
+        "30000",
+        "60",
+        "50",
+        "15000",
+        "7500",
+        "3750",
+        "2000",
+        "1000",
+        "500",
+        "100",
+        "30",
+        "25",
+        "15",
+        "10",
+        "5",
+        "2.5",
+    ],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+    ReturnV1: Literal["0", "≠0"],
+) -> str:
+    return f"CDM_BrFull6W({CDMType},{CPIAddress},{Dest},{Reps},{Range},{DiffChan},{ExChan},{MeasPEx},{ExmV},{RevEx},{ReverseDifferential},{SettlingTime},{fN1},{Mult},{Offset},{ReturnV1})"
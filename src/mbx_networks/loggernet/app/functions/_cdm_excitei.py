@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_ExciteI(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    IxChan: Constant,
+    IxUA: Constant,
+    Delay: Constant,
+) -> str:
+    return f"CDM_ExciteI({CDMType},{CPIAddress},{IxChan},{IxUA},{Delay})"
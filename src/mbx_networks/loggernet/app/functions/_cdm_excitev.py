@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_ExciteV(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    ExChan: Constant,
+    ExmV: Constant,
+    Delay: Constant,
+) -> str:
+    return f"CDM_ExciteV({CDMType},{CPIAddress},{ExChan},{ExmV},{Delay})"
@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_MuxSelect(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    ClkPort: Constant,
+    ResetPort: Constant,
+    ClockPW: Constant,
+    MuxChan: Constant,
+    Mode: Constant,
+) -> str:
+    return f"CDM_MuxSelect({CDMType},{CPIAddress},{ClkPort},{ResetPort},{ClockPW},{MuxChan},{Mode})"
@@ -0,0 +1,29 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_PeriodAvg(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    Dest: Variable | Array,
+    Reps: Constant,
+    Gain: Literal["0", "1", "2", "3"],
+    SEChan: Constant,
+    Threshold: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Option: Literal["0", "1"],
+    Cycles: Constant,
+    Timeout: Constant,
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"CDM_PeriodAvg({CDMType},{CPIAddress},{Dest},{Reps},{Gain},{SEChan},{Threshold},{Option},{Cycles},{Timeout},{Mult},{Offset})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_PulsePort(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    SW5Port: Literal["1", "2", "3", "4"],
+    Delay: Constant,
+) -> str:
+    return f"CDM_PulsePort({CDMType},{CPIAddress},{SW5Port},{Delay})"
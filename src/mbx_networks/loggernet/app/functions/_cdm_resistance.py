@@ -0,0 +1,50 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_Resistance(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    Dest: Variable | Array,
+    Reps: Constant,
+    Range: Literal["mV5000", "mV1000", "mV200"],
+    DiffChan: Constant,
+    IexChan: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    MeasPEx: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ExuA: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RevEx: Constant,
+    ReverseDifferential: Literal["False", "True"],
+    SettlingTime: Constant,
+    fN1: Literal[
+        "30000",
+        "60",
+        "50",
+        "15000",
+        "7500",
+        "3750",
+        "2000",
+        "1000",
+        "500",
+        "100",
+        "30",
+        "25",
+        "15",
+        "10",
+        "5",
+        "2.5",
+    ],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+    MeasCurrent: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"CDM_Resistance({CDMType},{CPIAddress},{Dest},{Reps},{Range},{DiffChan},{IexChan},{MeasPEx},{ExuA},{RevEx},{ReverseDifferential},{SettlingTime},{fN1},{Mult},{Offset},{MeasCurrent})"
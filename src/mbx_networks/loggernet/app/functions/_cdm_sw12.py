@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_SW12(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    Port: Constant,
+    State: Literal["0", "≠0"],
+    Option: Literal["Omitted", "0", "1"],
+) -> str:
+    return f"CDM_SW12({CDMType},{CPIAddress},{Port},{State},{Option})"
@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_SW5(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    SW5Port: Literal["1", "2", "3", "4"],
+    State: Literal["0", "≠0"],
+    Option: Literal["Omitted", "0", "1"],
+) -> str:
+    return f"CDM_SW5({CDMType},{CPIAddress},{SW5Port},{State},{Option})"
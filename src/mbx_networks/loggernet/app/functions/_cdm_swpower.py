@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_SWPower(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    State: Literal["0", "≠0"],
+    Option: Literal["Omitted", "0", "1"],
+) -> str:
+    return f"CDM_SWPower({CDMType},{CPIAddress},{State},{Option})"
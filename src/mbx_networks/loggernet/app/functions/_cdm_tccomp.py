@@ -0,0 +1,27 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_TCComp(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    Dest: Variable | Array,
+    Reps: Constant,
+    DiffChan: Constant,
+    TCType: Literal[
+        "TypeT", "TypeE", "TypeK", "TypeJ", "TypeB", "TypeR", "TypeS", "TypeN"
+    ],
+    FilterEnable: Literal["0", "1"],
+    Units: Literal["0", "1", "2"],
+) -> str:
+    return f"CDM_TCComp({CDMType},{CPIAddress},{Dest},{Reps},{DiffChan},{TCType},{FilterEnable},{Units})"
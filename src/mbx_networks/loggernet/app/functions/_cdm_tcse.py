@@ -0,0 +1,58 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_TCSe(
+    CDMType: Constant,
+    CPIAddress: Constant,
+    Dest: Variable | Array,
+    Reps: Constant,
+    Range: Literal[
+        "mV5000",
+        "mV1000",
+        "mV200",
+        "Autorange",
+        "AutorangeC",
+        "mV5000C",
+        "mV1000C",
+        "mV200C",
+    ],
+    SEChan: Constant,
+    TCType: Literal[
+        "TypeT", "TypeE", "TypeK", "TypeJ", "TypeB", "TypeR", "TypeS", "TypeN"
+    ],
+    TRef: Variable | Expression | Array,
+    MeasOff: Literal["0", "1"],
+    SettlingTime: Constant,
+    fN1: Literal[
+        "30000",
+        "60",
+        "50",
+        "15000",
+        "7500",
+        "3750",
+        "2000",
+        "1000",
+        "500",
+        "100",
+        "30",
+        "25",
+        "15",
+        "10",
+        "5",
+        "2.5",
+    ],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"CDM_TCSe({CDMType},{CPIAddress},{Dest},{Reps},{Range},{SEChan},{TCType},{TRef},{MeasOff},{SettlingTime},{fN1},{Mult},{Offset})"
@@ -0,0 +1,36 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CDM_VW300Config(
+    DeviceType: Constant,
+    CPIAddress: Constant,
+    SysOptions: Literal["0", "1", "10", "11"],
+    ChanEnable: Variable,
+    ResonAmp: Variable,
+    LowFreq: Literal["20", "50", "100", "200", "333"],
+    HighFreq: Literal["20", "50", "100", "200", "333"],
+    ChanOptions: Variable,
+    Mult: Constant,
+    Offset: Variable,
+    SteinA: Variable,
+    SteinB: Variable,
+    SteinC: Variable,
+    RF_MeanBins: Variable,
+    RF_AmpBins: Variable,
+    RF_LowLim: Variable,
+    RF_HighLim: Variable,
+    RF_Hyst: Variable,
+    RF_Form: Literal["A", "A", "B", "B", "C", "C"],
+) -> str:
+    return f"CDM_VW300Config({DeviceType},{CPIAddress},{SysOptions},{ChanEnable},{ResonAmp},{LowFreq},{HighFreq},{ChanOptions},{Mult},{Offset},{SteinA},{SteinB},{SteinC},{RF_MeanBins},{RF_AmpBins},{RF_LowLim},{RF_HighLim},{RF_Hyst},{RF_Form})"
@@ -0,0 +1,16 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CheckPort(Port: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"]) -> str:
+    return f"CheckPort({Port})"
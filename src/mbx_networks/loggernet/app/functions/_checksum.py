@@ -0,0 +1,51 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CheckSum(
+    ChkSumString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ChkSumType: Literal[
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "22",
+        "23",
+        "24",
+        "25",
+        "26",
+        "27",
+        "28",
+        "29",
+    ],
+    ChkSumSize: Variable | Expression,
+    ChkSumOpt1: Variable,
+    ChkSumOpt2: Variable,
+    ChkSumOpt3: Variable,
+) -> str:
+    return f"CheckSum({ChkSumString},{ChkSumType},{ChkSumSize},{ChkSumOpt1},{ChkSumOpt2},{ChkSumOpt3})"
@@ -0,0 +1,168 @@
+from typing import Any, NewType
+from dataclasses import dataclass, field
+from enum import Enum
+import re
+import sys
+from textwrap import indent
+
+from app import symbols
+
+
+class VarType(Enum):
+    PUBLIC = "Public"
+    CONST = "Const"
+    DIM = "Dim"
+    ALIAS = "Alias"
+    FIELD_ONLY = "Field"
+
+    def __str__(self):
+        return self.value
+
+
+class DataType(Enum):
+    FLOAT = "Float"
+    BOOLEAN = "Boolean"
+    LONG = "Long"
+    STRING = "String"
+
+    @classmethod
+    def _missing_(cls, value):
+        # Handle custom string types like "String20"
+        if isinstance(value, str) and re.match(r"^String\d+$", value):
+            length = int(
+                value[6:]
+            )  # Extract the length from the value (e.g., 20 from "String20")
+
+            # Dynamically create a new Enum member
+            member = object.__new__(cls)
+            member._value_ = value
+            member._name_ = cls.STRING  # Optional: Set to None because it doesn't correspond to a predefined member
+            member.length = length
+            return member
+
+        return None
+
+    def __str__(self):
+        try:
+            return f"{self.value} * {self.length}"
+        except AttributeError:
+            return self.value
+
+
+@dataclass(slots=True)
+class Variable:
+    """A CRBasic variable.
+
+    Stations declare hundreds of these, so instances are slotted and names
+    are interned: the same name used by every station in a fleet is stored
+    once. An alias keeps the name it aliases in ``orig_name`` and goes by its
+    value. An alias of an array element also points at the array in
+    ``target``, see ``symbols.bind_aliases``, so renaming the array renames
+    the alias's element too.
+
+    Inside ``SymbolTable.capture`` a variable formats as a reference that is
+    resolved to its name when the program is emitted, see ``app.symbols``.
+    """
+
+    name: str
+    var_type: VarType
+    data_type: DataType | None = None
+    value: str | int | float | None = None
+    units: str | None = None
+    rename_to: str | None = None
+    orig_name: str | None = field(init=False, default=None)
+    target: "Variable | None" = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.var_type == VarType.CONST and self.value is None:
+            raise ValueError("When defining a Const type, value must not be none.")
+        self.name = sys.intern(self.name)
+        if self.var_type == VarType.ALIAS:
+            assert self.value is not None, (
+                "When defining an Alias, a value must be defined."
+            )
+            self.orig_name = self.name
+            self.name = sys.intern(self.value)
+
+    def __copy__(self) -> "Variable":
+        # Skips __post_init__, which has already swapped an alias's names.
+        new = object.__new__(Variable)
+        new.name = self.name
+        new.var_type = self.var_type
+        new.data_type = self.data_type
+        new.value = self.value
+        new.units = self.units
+        new.rename_to = self.rename_to
+        new.orig_name = self.orig_name
+        new.target = self.target
+        return new
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        return {} if self.orig_name is None else {"orig_name": self.orig_name}
+
+    def __str__(self):
+        return symbols.reference(self) or self.rename_to or self.name
+
+    @property
+    def array_name(self) -> str:
+        """The array's name without its dimensions, ``x(3)`` -> ``x``."""
+        return symbols.reference(self, array=True) or symbols.array_name(
+            self.rename_to or self.name
+        )
+
+    def element(self, index: int | str) -> str:
+        """A reference to one element of an array, ``x(3)`` -> ``x(index)``."""
+        return f"{self.array_name}({index})"
+
+    def declaration_str(self) -> str:
+        if self.var_type == VarType.FIELD_ONLY:
+            raise ValueError(
+                "declaration_str should not be called when Variable is of FIELD_ONLY type"
+            )
+        if self.var_type != VarType.ALIAS:
+            v_name = self.rename_to or self.name
+        elif self.target is not None:
+            v_name = f"{self.target.array_name}{symbols.dimensions(self.orig_name)}"
+        else:
+            v_name = self.orig_name
+        out = f"{self.var_type} {v_name}"
+
+        if self.var_type in [VarType.CONST, VarType.ALIAS]:
+            val = self.rename_to or self.value
+            out = f"{out} = {val}"
+
+        if self.data_type is not None:
+            out = f"{out} as {str(self.data_type)}"
+
+        if self.units is not None:
+            out = f"{out} : Units {self.rename_to or self.name} = {self.units}"
+
+        return out
+
+
+Constant = NewType("Constant", int)
+Expression = NewType("Expression", str)
+Array = NewType("Array", Variable)
+Integer = NewType("Integer", int)
+ConstantInteger = NewType("ConstantInteger", int)
+
+
+def custom(name: str, *args: str, logic: str | list[str]) -> str:
+    """Create user-defined function
+
+    Args:
+        name (str): Name of the function
+        logic (str | list[str]): The LoggerNet code logic body of the function.
+
+    Returns:
+        str: A string that can be inserted into a CR1X loggernet program to create the function.
+    """
+    s = f"Function {name}({','.join(args)})\n"
+    if isinstance(logic, list):
+        logic = "\n".join(logic)
+
+    s += indent(logic, "    ")
+    s += "\nEndFuncion"
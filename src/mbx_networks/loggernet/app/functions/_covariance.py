@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Covariance(
+    DimX: Constant,
+    XVal: Array,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4"
+    ],
+    DisableVar: Variable | Constant | Expression,
+    NumOfCov: Constant,
+) -> str:
+    return f"Covariance({DimX},{XVal},{DataType},{DisableVar},{NumOfCov})"
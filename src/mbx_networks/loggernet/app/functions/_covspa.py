@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CovSpa(
+    Dest: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NumOfCov: Constant,
+    SizeOfSets: Constant,
+    CoreSets: Array,
+    DataSets: Array,
+) -> str:
+    return f"CovSpa({Dest},{NumOfCov},{SizeOfSets},{CoreSets},{DataSets})"
@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CS616(
+    Dest: Variable | Array,
+    Reps: Constant,
+    CS616Chan: Constant,
+    CS616Port: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    MeasPerPort: Variable | Constant,
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"CS616({Dest},{Reps},{CS616Chan},{CS616Port},{MeasPerPort},{Mult},{Offset})"
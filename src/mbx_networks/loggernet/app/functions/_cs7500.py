@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CS7500(
+    Dest: Literal["0", "2", "3", "4", "5", "6"],
+    Reps: Constant,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    CS7500Cmd: Literal["0", "1", "2", "3", "4", "5", "6"],
+) -> str:
+    return f"CS7500({Dest},{Reps},{SDMAddress},{CS7500Cmd})"
@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CSAT3(
+    Dest: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Reps: Constant,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Command: Literal["90", "91", "92", "97", "98", "99"],
+    CSAT3Option: Literal[
+        "1", "2", "3", "5", "6", "10", "12", "15", "20", "30", "60", "61", "62"
+    ],
+) -> str:
+    return f"CSAT3({Dest},{Reps},{SDMAddress},{Command},{CSAT3Option})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CSAT3B(
+    Dest: Variable,
+    Bus: Constant,
+    Address: Constant,
+    Mode: Literal["0", "5", "10", "25"],
+) -> str:
+    return f"CSAT3B({Dest},{Bus},{Address},{Mode})"
@@ -0,0 +1,16 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CSAT3BMonitor(Dest: Variable, Bus: Constant, Address: Constant) -> str:
+    return f"CSAT3BMonitor({Dest},{Bus},{Address})"
@@ -0,0 +1,26 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def CurrentSE(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Range: Literal["mV1000", "mv200", "Autorange"],
+    RGChan: Constant,
+    MeasOff: Literal["0", "1"],
+    SettlingTime: Constant,
+    fN1: Literal["15000", "60", "50"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"CurrentSE({Dest},{Reps},{Range},{RGChan},{MeasOff},{SettlingTime},{fN1},{Mult},{Offset})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def DataEvent(
+    RecBefore: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    StartTrig: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    EndTrig: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RecAfter: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"DataEvent({RecBefore},{StartTrig},{EndTrig},{RecAfter})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def DataInterval(
+    TintoInt: Variable | Constant,
+    Interval: Constant,
+    Units: Literal["msec", "sec", "min", "hr", "day", "mon"],
+    Lapses: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"DataInterval({TintoInt},{Interval},{Units},{Lapses})"
@@ -0,0 +1,53 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def DaylightSaving(
+    DSTSet: Constant,
+    DSTnStart: Literal["1", "2", "3", "4", "5"],
+    DSTDayStart: Literal["1", "2", "3", "4", "5", "6", "7"],
+    DSTMonthStart: Literal[
+        "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"
+    ],
+    DSTnEnd: Literal["1", "2", "3", "4", "5"],
+    DSTDayEnd: Literal["1", "2", "3", "4", "5", "6", "7"],
+    DSTMonthEnd: Literal["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"],
+    DSTHour: Literal[
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "20",
+        "21",
+        "22",
+        "23",
+        "24",
+    ],
+) -> str:
+    return f"DaylightSaving({DSTSet},{DSTnStart},{DSTDayStart},{DSTMonthStart},{DSTnEnd},{DSTDayEnd},{DSTMonthEnd},{DSTHour})"
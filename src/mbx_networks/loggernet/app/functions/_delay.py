@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Delay(
+    Option: Literal["0", "1", "2"],
+    Delay: Constant,
+    Units: Literal["0", "1", "2", "3", "4", "5"],
+) -> str:
+    return f"Delay({Option},{Delay},{Units})"
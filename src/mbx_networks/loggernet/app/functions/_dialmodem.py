@@ -0,0 +1,39 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def DialModem(
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    BaudRate: Constant,
+    DialString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ResponseString: Variable
+    | Constant
+    | Expression
+    | Array
+    | Integer
+    | ConstantInteger,
+) -> str:
+    return f"DialModem({ComPort},{BaudRate},{DialString},{ResponseString})"
@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def DNPUpdate(
+    DNPSlaveAddr: Variable | Constant,
+    DNPMasterAddr: Variable | Constant,
+    Timeout: Constant,
+    Retries: Constant,
+    ConnectHandle: Variable,
+) -> str:
+    return (
+        f"DNPUpdate({DNPSlaveAddr},{DNPMasterAddr},{Timeout},{Retries},{ConnectHandle})"
+    )
@@ -0,0 +1,84 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def DNPVariable(
+    Source: Variable,
+    Swath: Constant,
+    DNPObject: Constant,
+    DNPVariation: Literal[
+        "0",
+        "0",
+        "0",
+        "0",
+        "0",
+        "0",
+        "0",
+        "0",
+        "0",
+        "0",
+        "1",
+        "1",
+        "2",
+        "2",
+        "2",
+        "10",
+        "10",
+        "12",
+        "20",
+        "20",
+        "20",
+        "20",
+        "20",
+        "20",
+        "20",
+        "20",
+        "21",
+        "21",
+        "21",
+        "21",
+        "21",
+        "21",
+        "22",
+        "22",
+        "22",
+        "22",
+        "30",
+        "30",
+        "30",
+        "30",
+        "30",
+        "32",
+        "32",
+        "32",
+        "32",
+        "32",
+        "32",
+        "40",
+        "40",
+        "40",
+        "41",
+        "41",
+        "41",
+        "50",
+        "60",
+        "60",
+        "60",
+        "110",
+    ],
+    DNPClass: Constant,
+    DNPFlag: Variable | Constant,
+    DNPEvent: Variable,
+    DNPNumEvents: Constant,
+) -> str:
+    return f"DNPVariable({Source},{Swath},{DNPObject},{DNPVariation},{DNPClass},{DNPFlag},{DNPEvent},{DNPNumEvents})"
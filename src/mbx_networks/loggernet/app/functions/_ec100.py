@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def EC100(
+    Destination: Literal["0", "1", "2"],
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    EC100Cmd: Literal["0", "1", "2"],
+) -> str:
+    return f"EC100({Destination},{SDMAddress},{EC100Cmd})"
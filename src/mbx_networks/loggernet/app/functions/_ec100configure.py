@@ -0,0 +1,45 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def EC100Configure(
+    EC100Result: Variable,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    EC100ConfigCmd: Literal[
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "20",
+        "21",
+        "99",
+    ],
+    DestSource: Variable,
+) -> str:
+    return f"EC100Configure({EC100Result},{SDMAddress},{EC100ConfigCmd},{DestSource})"
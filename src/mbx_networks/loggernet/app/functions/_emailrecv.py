@@ -0,0 +1,30 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def EMailRecv(
+    ServerAddr: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ToAddr: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    FromAddr: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Subject: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Message: Variable,
+    Authen: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    UserName: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Password: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Result: Variable,
+    RecvFrom: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RecvSubj: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RecvDate: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TimeOut: Constant,
+) -> str:
+    return f"EMailRecv({ServerAddr},{ToAddr},{FromAddr},{Subject},{Message},{Authen},{UserName},{Password},{Result},{RecvFrom},{RecvSubj},{RecvDate},{TimeOut})"
@@ -0,0 +1,53 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def EmailRelay(
+    Result: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ToAddr: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Subject: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Message: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ServerResponse: Variable,
+    Attach: Variable,
+    NumRecsTimeIntoInterval: Constant,
+    Interval: Literal["0", ">=0", ">0", "<0", "0"],
+    Units: Constant,
+    FileOption: Literal[
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "32",
+        "33",
+        "34",
+        "35",
+    ],
+    TimeOut: Constant,
+) -> str:
+    return f"EmailRelay({Result},{ToAddr},{Subject},{Message},{ServerResponse},{Attach},{NumRecsTimeIntoInterval},{Interval},{Units},{FileOption},{TimeOut})"
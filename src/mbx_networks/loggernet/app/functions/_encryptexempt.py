@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def EncryptExempt(
+    BeginPakBusAddr: Variable
+    | Constant
+    | Expression
+    | Array
+    | Integer
+    | ConstantInteger,
+    EndPakBusAddr: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"EncryptExempt({BeginPakBusAddr},{EndPakBusAddr})"
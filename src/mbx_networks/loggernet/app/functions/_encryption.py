@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Encryption(
+    Dest: Variable | Array,
+    EncryptSrc: Variable | Array,
+    SrcLen: Variable,
+    EncryptKey: Constant,
+    EncryptInit: Variable,
+    EncryptInitLen: Integer,
+    EncryptOption: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"Encryption({Dest},{EncryptSrc},{SrcLen},{EncryptKey},{EncryptInit},{EncryptInitLen},{EncryptOption})"
@@ -0,0 +1,30 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ETsz(
+    Temp: Variable,
+    RH: Variable,
+    uZ: Variable,
+    Rs: Variable,
+    Longitude: Constant,
+    Latitude: Constant,
+    Altitude: Constant,
+    Zw: Variable,
+    Sz: Integer,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4"
+    ],
+    DisableVar: Variable | Constant | Expression,
+) -> str:
+    return f"ETsz({Temp},{RH},{uZ},{Rs},{Longitude},{Latitude},{Altitude},{Zw},{Sz},{DataType},{DisableVar})"
@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ExciteV(
+    ExChan: Literal["VX1", "VX2", "VX3", "VX4"],
+    ExmV: Variable | Constant,
+    Delay: Constant,
+) -> str:
+    return f"ExciteV({ExChan},{ExmV},{Delay})"
@@ -0,0 +1,25 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FFT(
+    SrcArray: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4"
+    ],
+    N: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SampleInterval: Constant,
+    Units: Literal["usec", "msec", "sec", "min"],
+    Option: Literal["0", "1", "2", "3", "4", "5"],
+) -> str:
+    return f"FFT({SrcArray},{DataType},{N},{SampleInterval},{Units},{Option})"
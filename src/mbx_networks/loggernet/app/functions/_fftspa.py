@@ -0,0 +1,26 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FFTSpa(
+    Dest: Variable | Array,
+    N: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SrcArray: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SampleInterval: Constant,
+    Units: Literal["usec", "msec", "sec", "min"],
+    Option: Literal["0", "1", "2", "3", "4", "5"],
+    FFTSpaInit: Variable,
+) -> str:
+    return (
+        f"FFTSpa({Dest},{N},{SrcArray},{SampleInterval},{Units},{Option},{FFTSpaInit})"
+    )
@@ -0,0 +1,26 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FieldCal(
+    Function: Literal["0", "1", "2", "3", "4"],
+    MeasureVar: Variable,
+    Reps: Variable | Constant,
+    MultVar: Variable,
+    OffsetVar: Variable,
+    Mode: Literal["-1", "-2", "-3", "0", "1", "2", "3", "4", "5", "6", "-6"],
+    KnownVar: Variable,
+    Index: Variable | Constant,
+    Avg: Variable | Integer,
+) -> str:
+    return f"FieldCal({Function},{MeasureVar},{Reps},{MultVar},{OffsetVar},{Mode},{KnownVar},{Index},{Avg})"
@@ -0,0 +1,28 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FieldCalStrain(
+    Function: Literal["10", "13", "33", "43"],
+    MeasureVar: Variable,
+    Reps: Variable | Constant,
+    GFAdj: Variable,
+    ZeromVV: Variable,
+    Mode: Literal["-1", "-2", "-3", "0", "1", "2", "3", "4", "5", "6"],
+    KnownRs: Variable,
+    Index: Variable | Constant,
+    Avg: Variable | Integer,
+    GFRaw: Variable,
+    uStrainDest: Variable,
+) -> str:
+    return f"FieldCalStrain({Function},{MeasureVar},{Reps},{GFAdj},{ZeromVV},{Mode},{KnownRs},{Index},{Avg},{GFRaw},{uStrainDest})"
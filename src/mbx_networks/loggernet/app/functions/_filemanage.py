@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FileManage(
+    DeviceFileName: Literal["CPU:", "CRD:", "USR:", "USB:"],
+    Attribute: Literal["bit", "bit", "bit", "bits", "bit", "bit", "bit"],
+) -> str:
+    return f"FileManage({DeviceFileName},{Attribute})"
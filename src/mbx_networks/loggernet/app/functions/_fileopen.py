@@ -0,0 +1,34 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FileOpen(
+    FileName: Variable,
+    Mode: Literal[
+        '"a"',
+        '"ab"',
+        '"a+"',
+        '"a+b"',
+        '"d"',
+        '"r"',
+        '"rb"',
+        '"r+"',
+        '"r+b"',
+        '"w"',
+        '"wb"',
+        '"w+"',
+        '"w+b"',
+    ],
+    SeekPoint: Variable,
+) -> str:
+    return f"FileOpen({FileName},{Mode},{SeekPoint})"
@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FormatFloat(
+    Float: Variable | Constant,
+    FormatString: Literal["%f", "%e", "%g", "%Y.Zf", "%0Y.0Zf", "%Ye", "%Yg"],
+) -> str:
+    return f"FormatFloat({Float},{FormatString})"
@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FormatLong(
+    LongVar: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    FormatString: Literal["%d", "%i", "%u", "%x", "%X", "%o", "%b"],
+) -> str:
+    return f"FormatLong({LongVar},{FormatString})"
@@ -0,0 +1,81 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def FTPClient(
+    IPAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    User: Constant,
+    Password: Constant,
+    LocalFileName: Constant,
+    RemoteFileName: Constant,
+    PutGetOption: Literal[
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "20",
+        "21",
+        "24",
+        "25",
+        "26",
+        "27",
+        "28",
+    ],
+    NumRecsTimeIntoInterval: Constant,
+    Interval: Literal["0", ">=0", ">0", "<0", "0"],
+    Units: Constant,
+    FileOption: Literal[
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "32",
+        "33",
+        "34",
+        "35",
+    ],
+    TimeOut: Constant,
+) -> str:
+    return f"FTPClient({IPAddress},{User},{Password},{LocalFileName},{RemoteFileName},{PutGetOption},{NumRecsTimeIntoInterval},{Interval},{Units},{FileOption},{TimeOut})"
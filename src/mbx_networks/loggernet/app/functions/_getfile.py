@@ -0,0 +1,54 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GetFile(
+    Result: Literal[
+        "0",
+        "-1",
+        "-2",
+        "-9",
+        "-14",
+        "-16",
+        "-17",
+        "-18",
+        "-20",
+        "-21",
+        "-22",
+        "-25",
+        "-26",
+        "-27",
+        "1,",
+    ],
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    NeighborAddr: Integer,
+    PakBusAddr: Integer,
+    Security: Integer,
+    TimeOut: Constant,
+    LocalFile: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RemoteFile: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"GetFile({Result},{ComPort},{NeighborAddr},{PakBusAddr},{Security},{TimeOut},{LocalFile},{RemoteFile})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GetRecord(
+    Dest: Array,
+    TableName: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RecsBack: Variable | Constant,
+    DataFormat: Literal["0", "1", "2", "3", "4", "5", "6", "7", "8"],
+) -> str:
+    return f"GetRecord({Dest},{TableName},{RecsBack},{DataFormat})"
@@ -0,0 +1,42 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GOESData(
+    ResultCode: Literal[
+        "0",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "-11",
+        "-12",
+        "-13",
+        "-14",
+        "-15",
+        "-16",
+        "-17",
+        "-18",
+        "-19",
+        "-20",
+        "-21",
+        "-22",
+    ],
+    Table: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TableOption: Literal["0", "1", "x"],
+    BufferControl: Literal["0", "1", "2", "3", "9"],
+    DataFormat: Literal["0", "1", "2", "3", "4", "5", "6", "7", "8"],
+) -> str:
+    return f"GOESData({ResultCode},{Table},{TableOption},{BufferControl},{DataFormat})"
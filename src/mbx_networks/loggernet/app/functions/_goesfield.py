@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GOESField(
+    NumVals: Literal["0", "0"],
+    Decimation: Variable | Constant,
+    Precision: Variable | Constant,
+    Width: Variable | Constant,
+    SHEF: Variable,
+) -> str:
+    return f"GOESField({NumVals},{Decimation},{Precision},{Width},{SHEF})"
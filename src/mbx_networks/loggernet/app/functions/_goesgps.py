@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GOESGPS(
+    GOESArray1: Literal["Time", "Latitude", "Longitude", "Elevation", "Magnetic"],
+    GOESArray2: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"GOESGPS({GOESArray1},{GOESArray2})"
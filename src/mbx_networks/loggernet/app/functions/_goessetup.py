@@ -0,0 +1,47 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GOESSetup(
+    ResultCode: Literal[
+        "0",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "-11",
+        "-12",
+        "-13",
+        "-14",
+        "-15",
+        "-16",
+        "-17",
+        "-18",
+        "-19",
+        "-20",
+        "-21",
+        "-22",
+    ],
+    PlatformID: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    MsgWindow: Integer,
+    STChan: Integer,
+    STBaud: Integer,
+    RChan: Integer,
+    RBaud: Integer,
+    STInterval: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    STOffset: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    RInterval: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"GOESSetup({ResultCode},{PlatformID},{MsgWindow},{STChan},{STBaud},{RChan},{RBaud},{STInterval},{STOffset},{RInterval})"
@@ -0,0 +1,55 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GOESStatus(
+    ResultCode: Literal[
+        "0",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "-11",
+        "-12",
+        "-13",
+        "-14",
+        "-15",
+        "-16",
+        "-17",
+        "-18",
+        "-19",
+        "-20",
+        "-21",
+        "-22",
+    ],
+    StatusCommand: Literal[
+        "0x00",
+        "0x01",
+        "0x02",
+        "0x03",
+        "0x04",
+        "0x05",
+        "0x06",
+        "0x10",
+        "0x11",
+        "0x12",
+        "0x13",
+        "0x14",
+        "0x15",
+        "0x16",
+        "0x1F",
+    ],
+) -> str:
+    return f"GOESStatus({ResultCode},{StatusCommand})"
@@ -0,0 +1,34 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GOESTable(
+    Result: Variable,
+    ComPort: Literal[
+        "ComRS232",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+        "COMSDC7",
+        "COMSDC8",
+        "COMSDC10",
+        "COMSDC11",
+    ],
+    Model: Literal["0", "2", "3"],
+    BufferControl: Literal["Constant", "Constant", "Variable", "Variable"],
+    Fields_Scan_Order: Literal["False", "True"],
+    Newest_First: Literal["False", "True"],
+    Format: Literal["0", "1", "2", "3", "4", "6"],
+) -> str:
+    return f"GOESTable({Result},{ComPort},{Model},{BufferControl},{Fields_Scan_Order},{Newest_First},{Format})"
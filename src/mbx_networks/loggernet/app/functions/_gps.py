@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def GPS(
+    GPSArray: Variable,
+    ComPort: Constant,
+    TimeOffset: Constant,
+    MaxTimeDiff: Constant,
+    NMEAStrings: Variable | Array,
+) -> str:
+    return f"GPS({GPSArray},{ComPort},{TimeOffset},{MaxTimeDiff},{NMEAStrings})"
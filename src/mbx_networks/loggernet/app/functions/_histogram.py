@@ -0,0 +1,27 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Histogram(
+    BinSelect: Variable,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4"
+    ],
+    DisableVar: Variable | Constant | Expression,
+    Bins: Constant,
+    Form: Literal["A", "A", "B", "B", "C", "C"],
+    WtVal: Variable | Constant,
+    LoLim: Constant,
+    UpLim: Constant,
+) -> str:
+    return f"Histogram({BinSelect},{DataType},{DisableVar},{Bins},{Form},{WtVal},{LoLim},{UpLim})"
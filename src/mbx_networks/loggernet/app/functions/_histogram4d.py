@@ -0,0 +1,36 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Histogram4D(
+    BinSelect: Variable,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4"
+    ],
+    DisableVar: Variable | Constant | Expression,
+    Bins1: Constant,
+    Bins2: Constant,
+    Bins3: Constant,
+    Bins4: Constant,
+    Form: Literal["A = 0", "A = 1", "B = 0", "B = 1", "C = 0", "C = 1"],
+    WtVal: Variable | Constant,
+    LoLim1: Constant,
+    LoLim2: Constant,
+    LoLim3: Constant,
+    LoLim4: Constant,
+    UpLim1: Constant,
+    UpLim2: Constant,
+    UpLim3: Constant,
+    UpLim4: Constant,
+) -> str:
+    return f"Histogram4D({BinSelect},{DataType},{DisableVar},{Bins1},{Bins2},{Bins3},{Bins4},{Form},{WtVal},{LoLim1},{LoLim2},{LoLim3},{LoLim4},{UpLim1},{UpLim2},{UpLim3},{UpLim4})"
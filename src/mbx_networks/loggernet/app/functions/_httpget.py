@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def HTTPGet(
+    URI: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Response: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Header: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TimeOut: Constant,
+) -> str:
+    return f"HTTPGet({URI},{Response},{Header},{TimeOut})"
@@ -0,0 +1,51 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def HTTPPost(
+    URI: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Contents: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Response: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Header: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NumRecsTimeIntoInterval: Constant,
+    Interval: Literal["0", ">=0", ">0", "<0", "0"],
+    Units: Constant,
+    FileOption: Literal[
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "32",
+        "33",
+        "34",
+        "35",
+    ],
+    TimeOut: Constant,
+) -> str:
+    return f"HTTPPost({URI},{Contents},{Response},{Header},{NumRecsTimeIntoInterval},{Interval},{Units},{FileOption},{TimeOut})"
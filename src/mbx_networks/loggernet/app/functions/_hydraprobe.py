@@ -0,0 +1,23 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def HydraProbe(
+    HydraDestination: Variable,
+    SourceVolts: Variable,
+    ProbeType: Constant,
+    SoitType: Constant,
+    HydraMult: Variable | Constant | Expression | Array,
+    HydraOffset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"HydraProbe({HydraDestination},{SourceVolts},{ProbeType},{SoitType},{HydraMult},{HydraOffset})"
@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def I2CRead(
+    BeginPort: Constant,
+    Address: Constant,
+    Dest: Variable,
+    NumBytes: Variable,
+    Option: Literal["B0", "B1", "B2"],
+) -> str:
+    return f"I2CRead({BeginPort},{Address},{Dest},{NumBytes},{Option})"
@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def IIF(
+    Expression: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TrueValue: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    FalseValue: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"IIF({Expression},{TrueValue},{FalseValue})"
@@ -0,0 +1,687 @@
+# Generated by app/_get_functions.py, do not edit.
+FUNCTIONS: dict[str, str] = {
+    "ACPower": "_acpower",
+    "AddPrecise": "_addprecise",
+    "AM25T": "_am25t",
+    "Average": "_average",
+    "AvgRun": "_avgrun",
+    "AvgSpa": "_avgspa",
+    "ABS": "_abs",
+    "AcceptDataRecords": "_acceptdatarecords",
+    "ACos": "_acos",
+    "ASCII": "_ascii",
+    "ASin": "_asin",
+    "Atn": "_atn",
+    "Atn2": "_atn2",
+    "ArgosData": "_argosdata",
+    "ArgosDataRepeat": "_argosdatarepeat",
+    "ArgosError": "_argoserror",
+    "ArgosSetup": "_argossetup",
+    "ArgosTransmit": "_argostransmit",
+    "ArrayLength": "_arraylength",
+    "AVW200": "_avw200",
+    "ArrayIndex": "_arrayindex",
+    "Battery": "_battery",
+    "BrFull": "_brfull",
+    "BrFull6W": "_brfull6w",
+    "BrHalf": "_brhalf",
+    "BrHalf3W": "_brhalf3w",
+    "BrHalf4W": "_brhalf4w",
+    "Broadcast": "_broadcast",
+    "CalFile": "_calfile",
+    "Calibrate": "_calibrate",
+    "CHR": "_chr",
+    "CDM_ACPower": "_cdm_acpower",
+    "CDM_Battery": "_cdm_battery",
+    "CDM_BrFull": "_cdm_brfull",
+    "CDM_BrFull6W": "_cdm_brfull6w",
+    "CDM_BrHalf": "_cdm_brhalf",
+    "CDM_BrHalf3W": "_cdm_brhalf3w",
+    "CDM_BrHalf4W": "_cdm_brhalf4w",
+    "CDM_Delay": "_cdm_delay",
+    "CDM_ExciteI": "_cdm_excitei",
+    "CDM_ExciteV": "_cdm_excitev",
+    "CDM_MuxSelect": "_cdm_muxselect",
+    "CDM_PanelTemp": "_cdm_paneltemp",
+    "CDM_PeriodAvg": "_cdm_periodavg",
+    "CDM_PulsePort": "_cdm_pulseport",
+    "CDM_Resistance": "_cdm_resistance",
+    "CDM_Resistance3W": "_cdm_resistance3w",
+    "CDM_SW12": "_cdm_sw12",
+    "CDM_SW5": "_cdm_sw5",
+    "CDM_SWPower": "_cdm_swpower",
+    "CDM_TCDiff": "_cdm_tcdiff",
+    "CDM_TCSe": "_cdm_tcse",
+    "CDM_Therm107": "_cdm_therm107",
+    "CDM_Therm108": "_cdm_therm108",
+    "CDM_Therm109": "_cdm_therm109",
+    "CDM_VoltSE": "_cdm_voltse",
+    "CDM_VoltDiff": "_cdm_voltdiff",
+    "CDM_CurrentDiff": "_cdm_currentdiff",
+    "CDM_VW300Config": "_cdm_vw300config",
+    "CDM_VW300Dynamic": "_cdm_vw300dynamic",
+    "CDM_VW300Static": "_cdm_vw300static",
+    "CDM_VW300Rainflow": "_cdm_vw300rainflow",
+    "CDM_TCComp": "_cdm_tccomp",
+    "CheckSum": "_checksum",
+    "ClockReport": "_clockreport",
+    "ComPortIsActive": "_comportisactive",
+    "Cos": "_cos",
+    "Cosh": "_cosh",
+    "CSAT3": "_csat3",
+    "CSAT3B": "_csat3b",
+    "CSAT3BMonitor": "_csat3bmonitor",
+    "CS616": "_cs616",
+    "CS7500": "_cs7500",
+    "CheckPort": "_checkport",
+    "ClockSet": "_clockset",
+    "Covariance": "_covariance",
+    "CovSpa": "_covspa",
+    "CardOut": "_cardout",
+    "CTYPE": "_ctype",
+    "CWB100": "_cwb100",
+    "CWB100Diagnostics": "_cwb100diagnostics",
+    "CWB100RSSI": "_cwb100rssi",
+    "CWB100Routes": "_cwb100routes",
+    "DataGram": "_datagram",
+    "DaylightSavingUS": "_daylightsavingus",
+    "DaylightSaving": "_daylightsaving",
+    "DataTime": "_datatime",
+    "DataEvent": "_dataevent",
+    "DataInterval": "_datainterval",
+    "Delay": "_delay",
+    "DewPoint": "_dewpoint",
+    "DialModem": "_dialmodem",
+    "DNP": "_dnp",
+    "DNPUpdate": "_dnpupdate",
+    "DNPVariable": "_dnpvariable",
+    "EC100": "_ec100",
+    "EC100Configure": "_ec100configure",
+    "EncryptExempt": "_encryptexempt",
+    "EmailSend": "_emailsend",
+    "EmailRelay": "_emailrelay",
+    "EMailRecv": "_emailrecv",
+    "Encryption": "_encryption",
+    "Erase": "_erase",
+    "DisplayValue": "_displayvalue",
+    "DisplayLine": "_displayline",
+    "ExciteV": "_excitev",
+    "Exp": "_exp",
+    "EthernetPower": "_ethernetpower",
+    "I2COpen": "_i2copen",
+    "I2CRead": "_i2cread",
+    "I2CWrite": "_i2cwrite",
+    "SPIOpen": "_spiopen",
+    "SPIRead": "_spiread",
+    "SPIWrite": "_spiwrite",
+    "IPNetPower": "_ipnetpower",
+    "ETsz": "_etsz",
+    "FFT": "_fft",
+    "FFTSpa": "_fftspa",
+    "FileManage": "_filemanage",
+    "FileMark": "_filemark",
+    "FindSpa": "_findspa",
+    "Fix": "_fix",
+    "FieldNames": "_fieldnames",
+    "LoadFieldCal": "_loadfieldcal",
+    "IIF": "_iif",
+    "SampleFieldCal": "_samplefieldcal",
+    "NewFieldCal": "_newfieldcal",
+    "NewFieldNames": "_newfieldnames",
+    "FieldCal": "_fieldcal",
+    "FieldCalStrain": "_fieldcalstrain",
+    "FileOpen": "_fileopen",
+    "FileClose": "_fileclose",
+    "FileCopy": "_filecopy",
+    "FileEncrypt": "_fileencrypt",
+    "FileWrite": "_filewrite",
+    "FileRead": "_fileread",
+    "FileReadLine": "_filereadline",
+    "FileRename": "_filerename",
+    "FileTime": "_filetime",
+    "FileSize": "_filesize",
+    "FileList": "_filelist",
+    "Frac": "_frac",
+    "FormatFloat": "_formatfloat",
+    "FormatLong": "_formatlong",
+    "FormatLongLong": "_formatlonglong",
+    "FTPClient": "_ftpclient",
+    "GetRecord": "_getrecord",
+    "GetDataRecord": "_getdatarecord",
+    "GetFile": "_getfile",
+    "GetVariables": "_getvariables",
+    "GOESData": "_goesdata",
+    "GOESStatus": "_goesstatus",
+    "GOESSetup": "_goessetup",
+    "GOESGPS": "_goesgps",
+    "GOESTable": "_goestable",
+    "GOESField": "_goesfield",
+    "GPS": "_gps",
+    "Hex": "_hex",
+    "HexToDec": "_hextodec",
+    "Histogram": "_histogram",
+    "Histogram4D": "_histogram4d",
+    "HydraProbe": "_hydraprobe",
+    "HTTPGet": "_httpget",
+    "HTTPPost": "_httppost",
+    "HTTPPut": "_httpput",
+    "HTTPOut": "_httpout",
+    "TimeIntoInterval": "_timeintointerval",
+    "IfTime": "_iftime",
+    "Int": "_int",
+    "InStr": "_instr",
+    "InstructionTimes": "_instructiontimes",
+    "IPInfo": "_ipinfo",
+    "IPRoute": "_iproute",
+    "IPTrace": "_iptrace",
+    "Len": "_len",
+    "LevelCrossing": "_levelcrossing",
+    "LI7200": "_li7200",
+    "LI7700": "_li7700",
+    "Log": "_log",
+    "LN": "_ln",
+    "Log10": "_log10",
+    "LowerCase": "_lowercase",
+    "Maximum": "_maximum",
+    "MaxSpa": "_maxspa",
+    "Median": "_median",
+    "MenuItem": "_menuitem",
+    "MenuPick": "_menupick",
+    "MenuRecompile": "_menurecompile",
+    "Mid": "_mid",
+    "Minimum": "_minimum",
+    "MinSpa": "_minspa",
+    "ModemCallback": "_modemcallback",
+    "Moment": "_moment",
+    "MonitorComms": "_monitorcomms",
+    "Move": "_move",
+    "MoveBytes": "_movebytes",
+    "MovePrecise": "_moveprecise",
+    "ModbusServer": "_modbusserver",
+    "ModbusClient": "_modbusclient",
+    "MuxSelect": "_muxselect",
+    "NewFile": "_newfile",
+    "Optional": "_optional",
+    "PanelTemp": "_paneltemp",
+    "PeakValley": "_peakvalley",
+    "PeriodAvg": "_periodavg",
+    "PingIP": "_pingip",
+    "PPPOpen": "_pppopen",
+    "PortBridge": "_portbridge",
+    "PortGet": "_portget",
+    "PortSet": "_portset",
+    "PortsConfig": "_portsconfig",
+    "PortPairConfig": "_portpairconfig",
+    "PRT": "_prt",
+    "PRTCalc": "_prtcalc",
+    "PulseCount": "_pulsecount",
+    "PulseCountReset": "_pulsecountreset",
+    "PulsePort": "_pulseport",
+    "PWM": "_pwm",
+    "PWR": "_pwr",
+    "RainFlow": "_rainflow",
+    "RainFlowSample": "_rainflowsample",
+    "Randomize": "_randomize",
+    "ReadIO": "_readio",
+    "RealTime": "_realtime",
+    "RectPolar": "_rectpolar",
+    "ResetTable": "_resettable",
+    "Replace": "_replace",
+    "Right": "_right",
+    "Left": "_left",
+    "RMSSpa": "_rmsspa",
+    "Route": "_route",
+    "RoutersNeighbors": "_routersneighbors",
+    "Round": "_round",
+    "Floor": "_floor",
+    "Ceiling": "_ceiling",
+    "Sample": "_sample",
+    "SampleMaxMin": "_samplemaxmin",
+    "SatVP": "_satvp",
+    "SDI12Recorder": "_sdi12recorder",
+    "SDI12SensorSetup": "_sdi12sensorsetup",
+    "SDI12SensorResponse": "_sdi12sensorresponse",
+    "SDMAO4": "_sdmao4",
+    "SDMAO4A": "_sdmao4a",
+    "SDMBeginPort": "_sdmbeginport",
+    "SDMCD16AC": "_sdmcd16ac",
+    "SDMCD16Mask": "_sdmcd16mask",
+    "SDMCVO4": "_sdmcvo4",
+    "SDMGeneric": "_sdmgeneric",
+    "SDMINT8": "_sdmint8",
+    "SDMSpeed": "_sdmspeed",
+    "SDMSW8A": "_sdmsw8a",
+    "SDMX50": "_sdmx50",
+    "SecsSince1990": "_secssince1990",
+    "SendData": "_senddata",
+    "SendFile": "_sendfile",
+    "SendTableDef": "_sendtabledef",
+    "SendGetVariables": "_sendgetvariables",
+    "SendVariables": "_sendvariables",
+    "SerialOpen": "_serialopen",
+    "SerialClose": "_serialclose",
+    "SerialFlush": "_serialflush",
+    "SerialIn": "_serialin",
+    "SerialInBlock": "_serialinblock",
+    "SerialInChk": "_serialinchk",
+    "SerialInRecord": "_serialinrecord",
+    "SerialOut": "_serialout",
+    "SerialOutBlock": "_serialoutblock",
+    "SerialBrk": "_serialbrk",
+    "SetSettings": "_setsettings",
+    "SetSecurity": "_setsecurity",
+    "SetStatus": "_setstatus",
+    "SetSetting": "_setsetting",
+    "SNMPVariable": "_snmpvariable",
+    "StaticRoute": "_staticroute",
+    "StdDev": "_stddev",
+    "StdDevSpa": "_stddevspa",
+    "Sgn": "_sgn",
+    "Sin": "_sin",
+    "Sinh": "_sinh",
+    "SDMSIO4": "_sdmsio4",
+    "SDMIO16": "_sdmio16",
+    "SplitStr": "_splitstr",
+    "Sprintf": "_sprintf",
+    "SolarPosition": "_solarposition",
+    "SortSpa": "_sortspa",
+    "Sqr": "_sqr",
+    "StrainCalc": "_straincalc",
+    "StrComp": "_strcomp",
+    "SW12": "_sw12",
+    "TCSe": "_tcse",
+    "TCDiff": "_tcdiff",
+    "TCPClose": "_tcpclose",
+    "TCPOpen": "_tcpopen",
+    "TGA": "_tga",
+    "Therm109": "_therm109",
+    "Therm108": "_therm108",
+    "Therm107": "_therm107",
+    "TimedControl": "_timedcontrol",
+    "TimeIsBetween": "_timeisbetween",
+    "Timer": "_timer",
+    "Totalize": "_totalize",
+    "TableFile": "_tablefile",
+    "Tan": "_tan",
+    "Tanh": "_tanh",
+    "TDR100": "_tdr100",
+    "TDR200": "_tdr200",
+    "TimerInput": "_timerinput",
+    "TotalRun": "_totalrun",
+    "MinRun": "_minrun",
+    "MaxRun": "_maxrun",
+    "Trim": "_trim",
+    "LTrim": "_ltrim",
+    "RTrim": "_rtrim",
+    "UDPDataGram": "_udpdatagram",
+    "UDPOpen": "_udpopen",
+    "UpperCase": "_uppercase",
+    "PakBusClock": "_pakbusclock",
+    "VaporPressure": "_vaporpressure",
+    "VoltSE": "_voltse",
+    "VoltDiff": "_voltdiff",
+    "WaitDigTrig": "_waitdigtrig",
+    "WetDryBulb": "_wetdrybulb",
+    "WorstCase": "_worstcase",
+    "WriteIO": "_writeio",
+    "WindVector": "_windvector",
+    "Network": "_network",
+    "NetworkTimeProtocol": "_networktimeprotocol",
+    "XMLParse": "_xmlparse",
+    "TypeOf": "_typeof",
+    "CurrentSE": "_currentse",
+    "Matrix": "_matrix",
+    "Gzip": "_gzip",
+    "StructureType": "_structuretype",
+    "Quadrature": "_quadrature",
+    "SMSRecv": "_smsrecv",
+    "SMSSend": "_smssend",
+    "TCPActiveConnections": "_tcpactiveconnections",
+    "WatchdogTimer": "_watchdogtimer",
+    "MQTTConnect": "_mqttconnect",
+    "MQTTPublishTable": "_mqttpublishtable",
+    "MQTTPublishConstTable": "_mqttpublishconsttable",
+}
+CATALOG: dict[str, tuple[int, int]] = {
+    "ACPower": (44, 5450),
+    "AddPrecise": (5494, 1731),
+    "AM25T": (7225, 14659),
+    "Average": (21884, 7761),
+    "AvgRun": (29645, 6304),
+    "AvgSpa": (35949, 2539),
+    "ABS": (38488, 321),
+    "AcceptDataRecords": (38809, 3066),
+    "ACos": (41875, 998),
+    "ASCII": (42873, 1188),
+    "ASin": (44061, 958),
+    "Atn": (45019, 924),
+    "Atn2": (45943, 992),
+    "ArgosData": (46935, 3254),
+    "ArgosDataRepeat": (50189, 2491),
+    "ArgosError": (52680, 651),
+    "ArgosSetup": (53331, 1637),
+    "ArgosTransmit": (54968, 1396),
+    "ArrayLength": (56364, 829),
+    "AVW200": (57193, 13242),
+    "ArrayIndex": (70435, 1894),
+    "Battery": (72329, 806),
+    "BrFull": (73135, 13270),
+    "BrFull6W": (86405, 14522),
+    "BrHalf": (100927, 12311),
+    "BrHalf3W": (113238, 12913),
+    "BrHalf4W": (126151, 14849),
+    "Broadcast": (141000, 3424),
+    "CalFile": (144424, 2663),
+    "Calibrate": (147087, 3610),
+    "CHR": (150697, 1488),
+    "CDM_ACPower": (152185, 6527),
+    "CDM_Battery": (158712, 1920),
+    "CDM_BrFull": (160632, 14021),
+    "CDM_BrFull6W": (174653, 14744),
+    "CDM_BrHalf": (189397, 13525),
+    "CDM_BrHalf3W": (202922, 13850),
+    "CDM_BrHalf4W": (216772, 14759),
+    "CDM_Delay": (231531, 3559),
+    "CDM_ExciteI": (235090, 2651),
+    "CDM_ExciteV": (237741, 3855),
+    "CDM_MuxSelect": (241596, 3170),
+    "CDM_PanelTemp": (244766, 4867),
+    "CDM_PeriodAvg": (249633, 6951),
+    "CDM_PulsePort": (256584, 2182),
+    "CDM_Resistance": (258766, 12870),
+    "CDM_Resistance3W": (271636, 11936),
+    "CDM_SW12": (283572, 3683),
+    "CDM_SW5": (287255, 3463),
+    "CDM_SWPower": (290718, 3270),
+    "CDM_TCDiff": (293988, 13118),
+    "CDM_TCSe": (307106, 13180),
+    "CDM_Therm107": (320286, 7700),
+    "CDM_Therm108": (327986, 7700),
+    "CDM_Therm109": (335686, 7700),
+    "CDM_VoltSE": (343386, 11665),
+    "CDM_VoltDiff": (355051, 11704),
+    "CDM_CurrentDiff": (366755, 8391),
+    "CDM_VW300Config": (375146, 10067),
+    "CDM_VW300Dynamic": (385213, 2562),
+    "CDM_VW300Static": (387775, 3058),
+    "CDM_VW300Rainflow": (390833, 1975),
+    "CDM_TCComp": (392808, 5269),
+    "CheckSum": (398077, 5564),
+    "ClockReport": (403641, 6870),
+    "ComPortIsActive": (410511, 1680),
+    "Cos": (412191, 716),
+    "Cosh": (412907, 331),
+    "CSAT3": (413238, 4580),
+    "CSAT3B": (417818, 3548),
+    "CSAT3BMonitor": (421366, 2591),
+    "CS616": (423957, 4708),
+    "CS7500": (428665, 4121),
+    "CheckPort": (432786, 1156),
+    "ClockSet": (433942, 907),
+    "Covariance": (434849, 5882),
+    "CovSpa": (440731, 3309),
+    "CardOut": (444040, 5314),
+    "CTYPE": (449354, 1057),
+    "CWB100": (450411, 5690),
+    "CWB100Diagnostics": (456101, 1859),
+    "CWB100RSSI": (457960, 1193),
+    "CWB100Routes": (459153, 1558),
+    "DataGram": (460711, 5973),
+    "DaylightSavingUS": (466684, 5758),
+    "DaylightSaving": (472442, 5756),
+    "DataTime": (478198, 1276),
+    "DataEvent": (479474, 3977),
+    "DataInterval": (483451, 6776),
+    "Delay": (490227, 2501),
+    "DewPoint": (492728, 1604),
+    "DialModem": (494332, 4362),
+    "DNP": (498694, 6575),
+    "DNPUpdate": (505269, 2857),
+    "DNPVariable": (508126, 7430),
+    "EC100": (515556, 3662),
+    "EC100Configure": (519218, 5967),
+    "EncryptExempt": (525185, 1281),
+    "EmailSend": (526466, 10834),
+    "EmailRelay": (537300, 10274),
+    "EMailRecv": (547574, 7620),
+    "Encryption": (555194, 4052),
+    "Erase": (559246, 1063),
+    "DisplayValue": (560309, 1351),
+    "DisplayLine": (561660, 1059),
+    "ExciteV": (562719, 2907),
+    "Exp": (565626, 447),
+    "EthernetPower": (566073, 654),
+    "I2COpen": (566727, 2145),
+    "I2CRead": (568872, 2741),
+    "I2CWrite": (571613, 2754),
+    "SPIOpen": (574367, 2290),
+    "SPIRead": (576657, 1206),
+    "SPIWrite": (577863, 1219),
+    "IPNetPower": (579082, 2455),
+    "ETsz": (581537, 9850),
+    "FFT": (591387, 9325),
+    "FFTSpa": (600712, 6946),
+    "FileManage": (607658, 2134),
+    "FileMark": (609792, 1282),
+    "FindSpa": (611074, 1815),
+    "Fix": (612889, 747),
+    "FieldNames": (613636, 2423),
+    "LoadFieldCal": (616059, 1108),
+    "IIF": (617167, 1288),
+    "SampleFieldCal": (618455, 741),
+    "NewFieldCal": (619196, 735),
+    "NewFieldNames": (619931, 1899),
+    "FieldCal": (621830, 11344),
+    "FieldCalStrain": (633174, 7462),
+    "FileOpen": (640636, 4742),
+    "FileClose": (645378, 802),
+    "FileCopy": (646180, 1611),
+    "FileEncrypt": (647791, 1430),
+    "FileWrite": (649221, 1461),
+    "FileRead": (650682, 1576),
+    "FileReadLine": (652258, 1788),
+    "FileRename": (654046, 2201),
+    "FileTime": (656247, 1404),
+    "FileSize": (657651, 1078),
+    "FileList": (658729, 2647),
+    "Frac": (661376, 323),
+    "FormatFloat": (661699, 2154),
+    "FormatLong": (663853, 1581),
+    "FormatLongLong": (665434, 353),
+    "FTPClient": (665787, 17909),
+    "GetRecord": (683696, 4018),
+    "GetDataRecord": (687714, 14517),
+    "GetFile": (702231, 11709),
+    "GetVariables": (713940, 13413),
+    "GOESData": (727353, 6143),
+    "GOESStatus": (733496, 6048),
+    "GOESSetup": (739544, 5696),
+    "GOESGPS": (745240, 1192),
+    "GOESTable": (746432, 6857),
+    "GOESField": (753289, 2589),
+    "GPS": (755878, 9129),
+    "Hex": (765007, 1114),
+    "HexToDec": (766121, 614),
+    "Histogram": (766735, 9110),
+    "Histogram4D": (775845, 8663),
+    "HydraProbe": (784508, 2966),
+    "HTTPGet": (787474, 2650),
+    "HTTPPost": (790124, 8286),
+    "HTTPPut": (798410, 8003),
+    "HTTPOut": (806413, 548),
+    "TimeIntoInterval": (806961, 4826),
+    "IfTime": (811787, 4816),
+    "Int": (816603, 747),
+    "InStr": (817350, 2894),
+    "InstructionTimes": (820244, 1536),
+    "IPInfo": (821780, 1612),
+    "IPRoute": (823392, 2805),
+    "IPTrace": (826197, 685),
+    "Len": (826882, 798),
+    "LevelCrossing": (827680, 11646),
+    "LI7200": (839326, 3426),
+    "LI7700": (842752, 3290),
+    "Log": (846042, 910),
+    "LN": (846952, 909),
+    "Log10": (847861, 547),
+    "LowerCase": (848408, 505),
+    "Maximum": (848913, 7488),
+    "MaxSpa": (856401, 1613),
+    "Median": (858014, 7870),
+    "MenuItem": (865884, 1762),
+    "MenuPick": (867646, 1042),
+    "MenuRecompile": (868688, 1721),
+    "Mid": (870409, 1623),
+    "Minimum": (872032, 7145),
+    "MinSpa": (879177, 1603),
+    "ModemCallback": (880780, 9634),
+    "Moment": (890414, 6664),
+    "MonitorComms": (897078, 1231),
+    "Move": (898309, 1322),
+    "MoveBytes": (899631, 4101),
+    "MovePrecise": (903732, 1660),
+    "ModbusServer": (905392, 12429),
+    "ModbusClient": (917821, 13069),
+    "MuxSelect": (930890, 2630),
+    "NewFile": (933520, 2552),
+    "Optional": (936072, 343),
+    "PanelTemp": (936415, 1690),
+    "PeakValley": (938105, 2667),
+    "PeriodAvg": (940772, 5234),
+    "PingIP": (946006, 1621),
+    "PPPOpen": (947627, 3098),
+    "PortBridge": (950725, 2480),
+    "PortGet": (953205, 1893),
+    "PortSet": (955098, 2567),
+    "PortsConfig": (957665, 1470),
+    "PortPairConfig": (959135, 1345),
+    "PRT": (960480, 3854),
+    "PRTCalc": (964334, 6528),
+    "PulseCount": (970862, 7165),
+    "PulseCountReset": (978027, 7170),
+    "PulsePort": (985197, 1257),
+    "PWM": (986454, 1544),
+    "PWR": (987998, 494),
+    "RainFlow": (988492, 9665),
+    "RainFlowSample": (998157, 960),
+    "Randomize": (999117, 333),
+    "ReadIO": (999450, 2742),
+    "RealTime": (1002192, 1871),
+    "RectPolar": (1004063, 1336),
+    "ResetTable": (1005399, 341),
+    "Replace": (1005740, 876),
+    "Right": (1006616, 519),
+    "Left": (1007135, 517),
+    "RMSSpa": (1007652, 1876),
+    "Route": (1009528, 1626),
+    "RoutersNeighbors": (1011154, 642),
+    "Round": (1011796, 1029),
+    "Floor": (1012825, 385),
+    "Ceiling": (1013210, 389),
+    "Sample": (1013599, 4760),
+    "SampleMaxMin": (1018359, 6229),
+    "SatVP": (1024588, 1417),
+    "SDI12Recorder": (1026005, 9652),
+    "SDI12SensorSetup": (1035657, 3910),
+    "SDI12SensorResponse": (1039567, 3913),
+    "SDMAO4": (1043480, 1813),
+    "SDMAO4A": (1045293, 4113),
+    "SDMBeginPort": (1049406, 920),
+    "SDMCD16AC": (1050326, 2301),
+    "SDMCD16Mask": (1052627, 2273),
+    "SDMCVO4": (1054900, 3010),
+    "SDMGeneric": (1057910, 2481),
+    "SDMINT8": (1060391, 10141),
+    "SDMSpeed": (1070532, 460),
+    "SDMSW8A": (1070992, 4642),
+    "SDMX50": (1075634, 2257),
+    "SecsSince1990": (1077891, 2660),
+    "SendData": (1080551, 9727),
+    "SendFile": (1090278, 10983),
+    "SendTableDef": (1101261, 6545),
+    "SendGetVariables": (1107806, 12005),
+    "SendVariables": (1119811, 13371),
+    "SerialOpen": (1133182, 12737),
+    "SerialClose": (1145919, 2816),
+    "SerialFlush": (1148735, 3129),
+    "SerialIn": (1151864, 6587),
+    "SerialInBlock": (1158451, 4154),
+    "SerialInChk": (1162605, 2811),
+    "SerialInRecord": (1165416, 8286),
+    "SerialOut": (1173702, 7586),
+    "SerialOutBlock": (1181288, 4211),
+    "SerialBrk": (1185499, 910),
+    "SetSettings": (1186409, 2718),
+    "SetSecurity": (1189127, 1383),
+    "SetStatus": (1190510, 2716),
+    "SetSetting": (1193226, 2717),
+    "SNMPVariable": (1195943, 2884),
+    "StaticRoute": (1198827, 3663),
+    "StdDev": (1202490, 6521),
+    "StdDevSpa": (1209011, 1878),
+    "Sgn": (1210889, 584),
+    "Sin": (1211473, 712),
+    "Sinh": (1212185, 319),
+    "SDMSIO4": (1212504, 7220),
+    "SDMIO16": (1219724, 14480),
+    "SplitStr": (1234204, 5133),
+    "Sprintf": (1239337, 4960),
+    "SolarPosition": (1244297, 4976),
+    "SortSpa": (1249273, 2575),
+    "Sqr": (1251848, 321),
+    "StrainCalc": (1252169, 6409),
+    "StrComp": (1258578, 1643),
+    "SW12": (1260221, 2626),
+    "TCSe": (1262847, 10768),
+    "TCDiff": (1273615, 11958),
+    "TCPClose": (1285573, 1094),
+    "TCPOpen": (1286667, 9698),
+    "TGA": (1296365, 2913),
+    "Therm109": (1299278, 5639),
+    "Therm108": (1304917, 5639),
+    "Therm107": (1310556, 5639),
+    "TimedControl": (1316195, 3972),
+    "TimeIsBetween": (1320167, 2003),
+    "Timer": (1322170, 2559),
+    "Totalize": (1324729, 7180),
+    "TableFile": (1331909, 12374),
+    "Tan": (1344283, 693),
+    "Tanh": (1344976, 319),
+    "TDR100": (1345295, 8497),
+    "TDR200": (1353792, 12060),
+    "TimerInput": (1365852, 3969),
+    "TotalRun": (1369821, 6240),
+    "MinRun": (1376061, 5449),
+    "MaxRun": (1381510, 5300),
+    "Trim": (1386810, 425),
+    "LTrim": (1387235, 414),
+    "RTrim": (1387649, 415),
+    "UDPDataGram": (1388064, 2975),
+    "UDPOpen": (1391039, 3724),
+    "UpperCase": (1394763, 345),
+    "PakBusClock": (1395108, 2162),
+    "VaporPressure": (1397270, 1453),
+    "VoltSE": (1398723, 9796),
+    "VoltDiff": (1408519, 10584),
+    "WaitDigTrig": (1419103, 3520),
+    "WetDryBulb": (1422623, 1764),
+    "WorstCase": (1424387, 4114),
+    "WriteIO": (1428501, 3260),
+    "WindVector": (1431761, 12052),
+    "Network": (1443813, 5457),
+    "NetworkTimeProtocol": (1449270, 2133),
+    "XMLParse": (1451403, 2755),
+    "TypeOf": (1454158, 2432),
+    "CurrentSE": (1456590, 6859),
+    "Matrix": (1463449, 1416),
+    "Gzip": (1464865, 2528),
+    "StructureType": (1467393, 2097),
+    "Quadrature": (1469490, 2813),
+    "SMSRecv": (1472303, 3293),
+    "SMSSend": (1475596, 3386),
+    "TCPActiveConnections": (1478982, 2409),
+    "WatchdogTimer": (1481391, 2286),
+    "MQTTConnect": (1483677, 852),
+    "MQTTPublishTable": (1484529, 5350),
+    "MQTTPublishConstTable": (1489879, 1135),
+}
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def InStr(
+    Start: Integer,
+    SearchString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    FilterString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SearchOption: Literal["0", "1", "2", "3", "4", "6", "8", "9", "10"],
+) -> str:
+    return f"InStr({Start},{SearchString},{FilterString},{SearchOption})"
@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def IPInfo(
+    Interface: Literal["0", "1", "2", "3", "5"], Option: Literal["0", "1"]
+) -> str:
+    return f"IPInfo({Interface},{Option})"
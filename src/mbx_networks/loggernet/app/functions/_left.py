@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Left(
+    SearchString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NumChars: Variable | Constant,
+) -> str:
+    return f"Left({SearchString},{NumChars})"
@@ -0,0 +1,28 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def LevelCrossing(
+    Source: Variable | Array,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4"
+    ],
+    DisableVar: Variable | Constant | Expression,
+    NumLevels: Constant,
+    SecondDim: Constant,
+    CrossingArray: Array,
+    SecondArray: Array,
+    Hysteresis: Constant,
+    Option: Literal["A", "A", "B", "B", "C", "C"],
+) -> str:
+    return f"LevelCrossing({Source},{DataType},{DisableVar},{NumLevels},{SecondDim},{CrossingArray},{SecondArray},{Hysteresis},{Option})"
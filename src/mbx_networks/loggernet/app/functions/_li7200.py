@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def LI7200(
+    Destination: Literal["0", "1", "2", "3", "4", "5", "6", "7"],
+    Reps: Constant,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    LI7200Cmd: Literal["0", "1", "2", "3", "4", "5", "6", "7"],
+) -> str:
+    return f"LI7200({Destination},{Reps},{SDMAddress},{LI7200Cmd})"
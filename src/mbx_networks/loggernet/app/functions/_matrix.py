@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Matrix(
+    Option: Literal["1", "2", "3", "4", "5"], A: Variable, B: Variable, Result: Variable
+) -> str:
+    return f"Matrix({Option},{A},{B},{Result})"
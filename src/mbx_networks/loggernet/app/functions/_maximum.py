@@ -0,0 +1,33 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Maximum(
+    Reps: Constant,
+    Source: Variable,
+    DataType: Literal[
+        "String",
+        "Boolean",
+        "BOOL8",
+        "Long",
+        "NSEC",
+        "UINT1",
+        "UINT2",
+        "UINT4",
+        "FP2",
+        "IEEE4",
+    ],
+    DisableVar: Variable | Constant | Expression,
+    Time: Literal["0", "1"],
+) -> str:
+    return f"Maximum({Reps},{Source},{DataType},{DisableVar},{Time})"
@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def MaxRun(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Source: Variable,
+    Number: Constant,
+    RunReset: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TotalCalls: Constant,
+    Call_ID: Integer,
+) -> str:
+    return f"MaxRun({Dest},{Reps},{Source},{Number},{RunReset},{TotalCalls},{Call_ID})"
@@ -0,0 +1,16 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def MaxSpa(Dest: Variable | Array, Swath: Constant, Source: Variable) -> str:
+    return f"MaxSpa({Dest},{Swath},{Source})"
@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def MenuRecompile(
+    CompileString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    CompileVar: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"MenuRecompile({CompileString},{CompileVar})"
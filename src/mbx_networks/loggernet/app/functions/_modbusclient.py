@@ -0,0 +1,42 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ModbusClient(
+    ResultCode: Variable,
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ]
+    | Variable,
+    BaudRate: Constant,
+    ModbusAddr: Variable | Integer,
+    Function: Literal["01", "02", "03", "04", "05", "06", "15", "16"],
+    ModbusVariable: Variable,
+    Start: Variable | Constant,
+    Length: Variable | Constant,
+    Tries: Constant | Integer,
+    TimeOut: Constant,
+    ModbusOption: Literal["0", "1", "2", "3", "10", "11", "12", "13"],
+) -> str:
+    return f"ModbusClient({ResultCode},{ComPort},{BaudRate},{ModbusAddr},{Function},{ModbusVariable},{Start},{Length},{Tries},{TimeOut},{ModbusOption})"
@@ -0,0 +1,38 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ModbusServer(
+    ComPort: Literal[
+        "0",
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+        "502",
+    ],
+    BaudRate: Constant,
+    ModbusAddr: Variable | Integer,
+    ModbusVariable: Variable,
+    BooleanVariable: Variable | Constant,
+    ModbusOption: Literal["0", "1", "2", "3", "10", "11", "12", "13"],
+) -> str:
+    return f"ModbusServer({ComPort},{BaudRate},{ModbusAddr},{ModbusVariable},{BooleanVariable},{ModbusOption})"
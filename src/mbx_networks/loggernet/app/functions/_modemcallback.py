@@ -0,0 +1,56 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def ModemCallback(
+    Result: Literal[
+        "0",
+        "1,",
+        "-1",
+        "-16",
+        "-17",
+        "-18",
+        "-20",
+        "-21",
+        "-22",
+        "-27",
+        "-30",
+        "-31",
+        "-32",
+        "-33",
+        "-34",
+        "-35",
+    ],
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    BaudRate: Constant,
+    Security: Integer,
+    DialString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ConnectString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Timeout: Constant,
+    Retry: Constant,
+    AbortExp: Variable,
+) -> str:
+    return f"ModemCallback({Result},{ComPort},{BaudRate},{Security},{DialString},{ConnectString},{Timeout},{Retry},{AbortExp})"
@@ -0,0 +1,23 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def MoveBytes(
+    Destination: Variable | Array,
+    DestOffset: Variable | Constant,
+    Source: Variable | Array,
+    SourceOffset: Variable | Constant,
+    NumBytes: Variable | Constant,
+    Transfer: Literal["0", "1", "2", "3", "4"],
+) -> str:
+    return f"MoveBytes({Destination},{DestOffset},{Source},{SourceOffset},{NumBytes},{Transfer})"
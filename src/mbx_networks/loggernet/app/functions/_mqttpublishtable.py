@@ -0,0 +1,25 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def MQTTPublishTable(
+    QoS: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NumRecsTimeIntoInterval: Constant,
+    Interval: Constant,
+    Units: Constant,
+    OutputFormat: Literal["1", "2"],
+    Longitude: Variable | Constant,
+    Latitude: Variable | Constant,
+    Altitude: Variable | Constant,
+) -> str:
+    return f"MQTTPublishTable({QoS},{NumRecsTimeIntoInterval},{Interval},{Units},{OutputFormat},{Longitude},{Latitude},{Altitude})"
@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def MuxSelect(
+    ClkPort: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    ResPort: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    ClockPW: Constant,
+    MuxChan: Constant,
+    Mode: Constant,
+) -> str:
+    return f"MuxSelect({ClkPort},{ResPort},{ClockPW},{MuxChan},{Mode})"
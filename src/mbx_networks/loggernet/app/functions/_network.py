@@ -0,0 +1,27 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Network(
+    ResultCode: Variable | Array,
+    Reps: Constant,
+    BeginAddr: Variable | Integer,
+    TimeIntoInterval: Constant,
+    Interval: Constant,
+    Gap: Constant,
+    GetSwath: Constant,
+    GetVariables: Literal["Destination", "Destination", "Destination", "Destination"],
+    SendSwath: Constant,
+    SendVariable: Literal["Destination", "Destination", "Destination"],
+) -> str:
+    return f"Network({ResultCode},{Reps},{BeginAddr},{TimeIntoInterval},{Interval},{Gap},{GetSwath},{GetVariables},{SendSwath},{SendVariable})"
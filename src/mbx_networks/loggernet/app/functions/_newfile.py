@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def NewFile(
+    NewFileVar: Variable,
+    FileName: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NewFileName: Variable,
+) -> str:
+    return f"NewFile({NewFileVar},{FileName},{NewFileName})"
@@ -0,0 +1,16 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PanelTemp(Dest: Variable | Array, fN1: Literal["15000", "60", "50"]) -> str:
+    return f"PanelTemp({Dest},{fN1})"
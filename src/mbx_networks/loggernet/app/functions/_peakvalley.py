@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PeakValley(
+    DestPV: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    DestChange: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Reps: Constant,
+    Source: Variable,
+    Hysteresis: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"PeakValley({DestPV},{DestChange},{Reps},{Source},{Hysteresis})"
@@ -0,0 +1,27 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PeriodAvg(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Gain: Literal["0", "1", "2", "3"],
+    Chan: Constant,
+    Threshold: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Option: Literal["0", "1"],
+    Cycles: Constant,
+    Timeout: Constant,
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"PeriodAvg({Dest},{Reps},{Gain},{Chan},{Threshold},{Option},{Cycles},{Timeout},{Mult},{Offset})"
@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PingIP(
+    PingIPAddr: Variable,
+    PingIPTimeOut: Constant,
+    PingOption: Literal["0", "1", "2", "3"],
+) -> str:
+    return f"PingIP({PingIPAddr},{PingIPTimeOut},{PingOption})"
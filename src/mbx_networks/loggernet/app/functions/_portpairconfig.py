@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PortPairConfig(
+    Port: Literal["C1", "C3", "C5", "C7"], Option: Literal["1", "2"], PullOpt: Constant
+) -> str:
+    return f"PortPairConfig({Port},{Option},{PullOpt})"
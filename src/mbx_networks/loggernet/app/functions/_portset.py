@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PortSet(
+    Port: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    State: Literal["0", "≠0"],
+    Option: Literal["Omitted", "0", "1"] | None = None,
+) -> str:
+    if Option is None:
+        return f"PortSet({Port},{State})"
+    return f"PortSet({Port},{State},{Option})"
@@ -0,0 +1,23 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PRTCalc(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Source: Variable,
+    Type: Literal["0", "1", "2", "3", "4", "5", "6"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"PRTCalc({Dest},{Reps},{Source},{Type},{Mult},{Offset})"
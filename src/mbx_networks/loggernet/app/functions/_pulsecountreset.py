@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PulseCountReset(
+    Dest: Variable | Array,
+    Reps: Constant,
+    PChan: Literal["P1", "P2", "C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    PConfig: Literal["0", "1", "2", "3", "4", "5"],
+    POption: Literal["0", "1", ">1"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"PulseCountReset({Dest},{Reps},{PChan},{PConfig},{POption},{Mult},{Offset})"
@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def PulsePort(
+    Port: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"], Delay: Constant
+) -> str:
+    return f"PulsePort({Port},{Delay})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Quadrature(
+    Dest: Variable | Array,
+    Port: Literal["C1", "C3", "C5", "C7"],
+    Option: Literal["0", "1", "2"],
+    Mult: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"Quadrature({Dest},{Port},{Option},{Mult})"
@@ -0,0 +1,38 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def RainFlow(
+    Source: Variable,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4"
+    ],
+    DisableVar: Variable | Constant | Expression,
+    MeanBins: Constant,
+    AmpBins: Constant,
+    LoLim: Constant,
+    UpLim: Constant,
+    MinAmp: Constant,
+    Form: Literal[
+        "C(1,2)",
+        "C(1,3)",
+        "C(1,4)",
+        "C(1,5)",
+        "C(2,1)",
+        "C(2,2)",
+        "C(2,3)",
+        "C(2,4)",
+        "C(2,5)",
+    ],
+) -> str:
+    return f"RainFlow({Source},{DataType},{DisableVar},{MeanBins},{AmpBins},{LoLim},{UpLim},{MinAmp},{Form})"
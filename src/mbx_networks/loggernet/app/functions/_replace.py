@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Replace(
+    SearchString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SubString: Variable,
+    ReplaceString: Variable,
+) -> str:
+    return f"Replace({SearchString},{SubString},{ReplaceString})"
@@ -0,0 +1,31 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Sample(
+    Reps: Constant,
+    Source: Variable,
+    DataType: Literal[
+        "String",
+        "Boolean",
+        "BOOL8",
+        "Long",
+        "NSEC",
+        "UINT1",
+        "UINT2",
+        "UINT4",
+        "FP2",
+        "IEEE4",
+    ],
+) -> str:
+    return f"Sample({Reps},{Source},{DataType})"
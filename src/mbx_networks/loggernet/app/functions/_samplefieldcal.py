@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SampleFieldCal(
+    TableName: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NewFieldCal: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Size: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"SampleFieldCal({TableName},{NewFieldCal},{Size})"
@@ -0,0 +1,40 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDI12Recorder(
+    Dest: Variable | Array,
+    SDIPort: Literal["C1", "C3", "C5", "C7"],
+    SDIAddress: Variable | Constant,
+    SDICommand: Literal[
+        "?!",
+        "aAb!",
+        "HB!",
+        "HA!",
+        "C!",
+        "CC!",
+        "I!",
+        "M!",
+        "MC!",
+        "M1!",
+        "RC!",
+        "R0!",
+        "V!",
+        "X!",
+    ],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+    FillNAN: Constant = 0,
+    WaitonTimeout: Constant = 0,
+) -> str:
+    return f"SDI12Recorder({Dest},{SDIPort},{SDIAddress},{SDICommand},{Mult},{Offset},{FillNAN},{WaitonTimeout})"
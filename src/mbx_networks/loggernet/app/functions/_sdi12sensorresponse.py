@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDI12SensorResponse(
+    Reps: Constant,
+    SDIPort: Literal["C1", "C3", "C5", "C7"],
+    SDIAddress: Variable | Constant,
+    ResponseTime: Constant,
+) -> str:
+    return f"SDI12SensorResponse({Reps},{SDIPort},{SDIAddress},{ResponseTime})"
@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMAO4(
+    Source: Variable,
+    Reps: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"SDMAO4({Source},{Reps},{SDMAddress})"
@@ -0,0 +1,23 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMAO4A(
+    Source: Variable,
+    SDMAO4ADest: Literal["240", "241", "242", "243"],
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SDMAO4AStartChan: Constant,
+    Reps: Constant,
+    SDMAO4AOption: Literal["0", "1", "2", "3", "4"],
+) -> str:
+    return f"SDMAO4A({Source},{SDMAO4ADest},{SDMAddress},{SDMAO4AStartChan},{Reps},{SDMAO4AOption})"
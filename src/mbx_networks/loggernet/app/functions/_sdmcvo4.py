@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMCVO4(
+    CVO4Source: Variable,
+    CVO4Reps: Constant,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    CVO4Mode: Literal["0", "1", "10", "11"],
+) -> str:
+    return f"SDMCVO4({CVO4Source},{CVO4Reps},{SDMAddress},{CVO4Mode})"
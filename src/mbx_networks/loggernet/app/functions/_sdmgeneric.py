@@ -0,0 +1,26 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMGeneric(
+    Dest: Variable,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    CmdByte: Variable,
+    NumValsOut: Variable,
+    Source: Variable,
+    NumValsIn: Variable,
+    BytesPerValue: Variable,
+    BigEndian: Constant,
+    DelayByte: Constant,
+) -> str:
+    return f"SDMGeneric({Dest},{SDMAddress},{CmdByte},{NumValsOut},{Source},{NumValsIn},{BytesPerValue},{BigEndian},{DelayByte})"
@@ -0,0 +1,29 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMINT8(
+    Dest: Variable | Array,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Config8_5: Literal["0", "1", "2", "3"],
+    Config4_1: Literal["0", "1", "2", "3"],
+    Funct8_5: Literal["0", "1", "2", "3", "4", "5", "6", "7", "8"],
+    Funct4_1: Literal["0", "1", "2", "3", "4", "5", "6", "7", "8"],
+    OutputOpt: Literal[
+        "32768", "nnnn", "-nnnn", "-9999", "0", "-0", "positive", "negative"
+    ],
+    CaptureTrig: Variable,
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"SDMINT8({Dest},{SDMAddress},{Config8_5},{Config4_1},{Funct8_5},{Funct4_1},{OutputOpt},{CaptureTrig},{Mult},{Offset})"
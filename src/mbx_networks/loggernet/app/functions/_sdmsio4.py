@@ -0,0 +1,49 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMSIO4(
+    Dest: Variable | Array,
+    Reps: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SIO4Mode: Literal["1", "2", "3", "4", "5"],
+    SIO4Cmd: Literal[
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "66",
+        "67",
+        "320",
+        "321",
+        "1024",
+        "1025",
+        "1026",
+        "1027",
+        "2049",
+        "2054",
+        "2304",
+        "2305",
+    ],
+    Param1: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Param2: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ValuesPerRep: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"SDMSIO4({Dest},{Reps},{SDMAddress},{SIO4Mode},{SIO4Cmd},{Param1},{Param2},{ValuesPerRep},{Mult},{Offset})"
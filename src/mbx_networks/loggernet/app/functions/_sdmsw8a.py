@@ -0,0 +1,26 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMSW8A(
+    Dest: Variable | Array,
+    Reps: Constant,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    FunctOp: Literal["0", "1", "2", "3"],
+    SW8AStartChan: Constant,
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return (
+        f"SDMSW8A({Dest},{Reps},{SDMAddress},{FunctOp},{SW8AStartChan},{Mult},{Offset})"
+    )
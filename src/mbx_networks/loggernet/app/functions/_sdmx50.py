@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SDMX50(
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Channel: Constant,
+) -> str:
+    return f"SDMX50({SDMAddress},{Channel})"
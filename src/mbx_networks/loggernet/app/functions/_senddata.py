@@ -0,0 +1,35 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SendData(
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    NeighborAddr: Integer,
+    PakBusAddr: Integer,
+    DataTable: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TableOption: Literal["0", "-1", "X"],
+) -> str:
+    return f"SendData({ComPort},{NeighborAddr},{PakBusAddr},{DataTable},{TableOption})"
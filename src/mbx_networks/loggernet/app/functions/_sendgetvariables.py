@@ -0,0 +1,42 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SendGetVariables(
+    ResultCode: Literal[
+        "0", "-1", "-2", "-16", "-18", "-20", "-21", "-22", "-27", "1,"
+    ],
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    NeighborAddr: Integer,
+    PakBusAddr: Integer,
+    Security: Integer,
+    TimeOut: Constant,
+    SendVariable: Literal["Destination", "Destination", "Destination"],
+    SendSwath: Constant,
+    GetVariables: Literal["Destination", "Destination", "Destination", "Destination"],
+    GetSwath: Constant,
+) -> str:
+    return f"SendGetVariables({ResultCode},{ComPort},{NeighborAddr},{PakBusAddr},{Security},{TimeOut},{SendVariable},{SendSwath},{GetVariables},{GetSwath})"
@@ -0,0 +1,42 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SendVariables(
+    ResultCode: Literal[
+        "0", "-1", "-16", "-17", "-18", "-20", "-21", "-22", "-27", "1,"
+    ],
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    NeighborAddr: Integer,
+    PakBusAddr: Integer,
+    Security: Integer,
+    TimeOut: Constant,
+    TableName: Variable,
+    Fieldname: Variable,
+    Variable: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Swath: Constant,
+) -> str:
+    return f"SendVariables({ResultCode},{ComPort},{NeighborAddr},{PakBusAddr},{Security},{TimeOut},{TableName},{Fieldname},{Variable},{Swath})"
@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SerialBrk(
+    ComPort: Literal["ComC1", "ComC3", "ComC5", "ComC7"], Break: Variable | Constant
+) -> str:
+    return f"SerialBrk({ComPort},{Break})"
@@ -0,0 +1,35 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SerialIn(
+    Dest: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    ComPort_Serial_In: Literal[
+        "ComRS232",
+        "ComMe",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    TimeOut: Constant,
+    TerminationChar: Variable | Constant | Integer,
+    MaxNumChars: Variable | Constant | Integer,
+) -> str:
+    return f"SerialIn({Dest},{ComPort_Serial_In},{TimeOut},{TerminationChar},{MaxNumChars})"
@@ -0,0 +1,33 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SerialInBlock(
+    ComPort_Serial_In: Literal[
+        "ComRS232",
+        "ComMe",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    Dest: Variable | Array,
+    MaxNumberBytes: Constant,
+) -> str:
+    return f"SerialInBlock({ComPort_Serial_In},{Dest},{MaxNumberBytes})"
@@ -0,0 +1,37 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SerialInRecord(
+    ComPort_Serial_In: Literal[
+        "ComRS232",
+        "ComMe",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    Dest: Variable | Array,
+    BeginWord: Constant,
+    NBytes: Constant,
+    EndWord: Constant,
+    NBytesReturned: Variable,
+    SerialInRecOption: Literal["00", "01", "10", "11"],
+) -> str:
+    return f"SerialInRecord({ComPort_Serial_In},{Dest},{BeginWord},{NBytes},{EndWord},{NBytesReturned},{SerialInRecOption})"
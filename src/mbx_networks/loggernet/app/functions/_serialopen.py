@@ -0,0 +1,66 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SerialOpen(
+    ComPort: Literal[
+        "ComRS232",
+        "ComME",
+        "Com310",
+        "Com320",
+        "ComSDC7",
+        "ComSDC8",
+        "ComSDC10",
+        "ComSDC11",
+        "ComC1",
+        "ComC3",
+        "ComC5",
+        "ComC7",
+    ],
+    BaudRate: Constant,
+    SerialOpenFormat: Literal[
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "20",
+        "21",
+        "22",
+        "23",
+        "25",
+        "26",
+        "27",
+        "29",
+        "30",
+        "31",
+    ],
+    TXDelay: Variable | Constant,
+    BufferSize: Constant | Integer,
+    CommsMode: Literal["0", "1", "2", "3", "4", "5", "6*", "7*", "*"],
+) -> str:
+    return f"SerialOpen({ComPort},{BaudRate},{SerialOpenFormat},{TXDelay},{BufferSize},{CommsMode})"
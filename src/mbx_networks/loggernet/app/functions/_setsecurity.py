@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SetSecurity(
+    Security1: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Security2: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Security3: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"SetSecurity({Security1},{Security2},{Security3})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SMSRecv(
+    Result_Code: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    PhoneNumber: Variable,
+    Message: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TimeStamp: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"SMSRecv({Result_Code},{PhoneNumber},{Message},{TimeStamp})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SMSSend(
+    ResultCode: Literal["0", "-1", "-3", "-5", "-6", "-7", "-8", "-9", "-11", "-12"],
+    Swath: Variable,
+    PhoneNumber: Variable,
+    Message: Variable,
+) -> str:
+    return f"SMSSend({ResultCode},{Swath},{PhoneNumber},{Message})"
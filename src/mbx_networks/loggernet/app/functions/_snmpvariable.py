@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SNMPVariable(
+    Name: Variable,
+    OID: Constant,
+    Type: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Access: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Valid: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"SNMPVariable({Name},{OID},{Type},{Access},{Valid})"
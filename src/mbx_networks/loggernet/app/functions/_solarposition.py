@@ -0,0 +1,25 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SolarPosition(
+    Dest: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    TimeArray: Variable,
+    TimeOffset: Constant,
+    Latitude: Constant,
+    Longitude: Constant,
+    Altitude: Constant,
+    Pressure: Variable,
+    AirTemp: Variable,
+) -> str:
+    return f"SolarPosition({Dest},{TimeArray},{TimeOffset},{Latitude},{Longitude},{Altitude},{Pressure},{AirTemp})"
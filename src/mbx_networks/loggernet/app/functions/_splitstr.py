@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SplitStr(
+    SplitResult: Variable | Array,
+    SearchString: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    FilterString: Variable,
+    NumSplit: Constant,
+    SplitOption: Literal["0", "1", "2", "3", "4", "5", "6", "7", "8", "1x"],
+) -> str:
+    return f"SplitStr({SplitResult},{SearchString},{FilterString},{NumSplit},{SplitOption})"
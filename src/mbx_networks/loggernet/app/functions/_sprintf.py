@@ -0,0 +1,20 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Sprintf(
+    Dest: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Format: Literal["+", "Space", "-", "#", "0", "%f"],
+    *args: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"Sprintf({Dest},{Format},{','.join(str(x) for x in args)})"
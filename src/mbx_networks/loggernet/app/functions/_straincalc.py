@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def StrainCalc(
+    Dest: Variable | Array,
+    Reps: Constant,
+    Source: Variable,
+    BrZero: Variable,
+    BrConfig: Literal["1", "2", "3", "4", "5", "6"],
+    GageFactor: Variable,
+    PoissonFactor: Variable,
+) -> str:
+    return f"StrainCalc({Dest},{Reps},{Source},{BrZero},{BrConfig},{GageFactor},{PoissonFactor})"
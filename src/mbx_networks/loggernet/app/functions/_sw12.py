@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def SW12(
+    SW12Chan: Literal["SW12_1", "SW12_2", "SW12_CSIO"],
+    State: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Option: Literal["Omitted", "0", "1"] | None = None,
+) -> str:
+    if Option is None:
+        return f"SW12({SW12Chan},{State})"
+    return f"SW12({SW12Chan},{State},{Option})"
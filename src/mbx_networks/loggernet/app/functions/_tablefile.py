@@ -0,0 +1,52 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TableFile(
+    FileName: Constant,
+    Options: Literal[
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "13",
+        "14",
+        "15",
+        "16",
+        "17",
+        "18",
+        "19",
+        "32",
+        "33",
+        "34",
+        "35",
+        "259",
+        "64",
+    ],
+    MaxFiles: Constant,
+    NumRecsTimeIntoInterval: Variable | Constant,
+    Interval: Variable | Constant,
+    Units: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    OutStat: Variable,
+    LastFileName: Variable,
+) -> str:
+    return f"TableFile({FileName},{Options},{MaxFiles},{NumRecsTimeIntoInterval},{Interval},{Units},{OutStat},{LastFileName})"
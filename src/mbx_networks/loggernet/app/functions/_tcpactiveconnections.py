@@ -0,0 +1,25 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TCPActiveConnections(
+    Dest: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SecsSinceLastRx: Variable
+    | Constant
+    | Expression
+    | Array
+    | Integer
+    | ConstantInteger,
+    Port: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+) -> str:
+    return f"TCPActiveConnections({Dest},{SecsSinceLastRx},{Port})"
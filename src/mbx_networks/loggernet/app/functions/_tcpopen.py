@@ -0,0 +1,23 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TCPOpen(
+    IPAddr: Variable,
+    TCPPort: Variable | Constant,
+    IPBuffer: Constant,
+    IPTimeOut: Constant | Integer | None = None,
+    ConnectHandle: Variable | None = None,
+    MaxConnect: Constant | Integer | None = None,
+) -> str:
+    return f"TCPOpen({IPAddr},{TCPPort},{IPBuffer},{IPTimeOut},{ConnectHandle},{MaxConnect})"
@@ -0,0 +1,33 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TDR200(
+    Dest: Variable | Array,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    Option: Literal["0", "1", "2", "3"],
+    MuxProbeSelect: Constant,
+    WaveAvg: Variable | Constant,
+    Vp: Variable | Constant,
+    Points: Constant,
+    CableLength: Variable | Constant | Array,
+    WindowLength: Variable | Constant,
+    ProbeLength: Variable | Constant,
+    ProbeOffset: Variable | Constant,
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+    NoiseRejectionFreq: Literal["0", "50", "60"],
+    TDRFilterLevel: Constant,
+    TDRLaa: Literal["0", "1", "2"],
+) -> str:
+    return f"TDR200({Dest},{SDMAddress},{Option},{MuxProbeSelect},{WaveAvg},{Vp},{Points},{CableLength},{WindowLength},{ProbeLength},{ProbeOffset},{Mult},{Offset},{NoiseRejectionFreq},{TDRFilterLevel},{TDRLaa})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TGA(
+    Dest: Variable | Array,
+    SDMAddress: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    DataList: Literal["0", "1", "2", "3", "4", "5", "6", "7", "8"],
+    ScanMode: Constant,
+) -> str:
+    return f"TGA({Dest},{SDMAddress},{DataList},{ScanMode})"
@@ -0,0 +1,25 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def Therm107(
+    Dest: Variable | Array,
+    Reps: Constant,
+    SEChan: Constant,
+    ExChan: Literal["VX1", "VX2", "VX3", "VX4"],
+    SettlingTime: Constant,
+    fN1: Literal["15000", "60", "50"],
+    Mult: Variable | Constant | Expression | Array,
+    Offset: Variable | Constant | Expression | Array,
+) -> str:
+    return f"Therm107({Dest},{Reps},{SEChan},{ExChan},{SettlingTime},{fN1},{Mult},{Offset})"
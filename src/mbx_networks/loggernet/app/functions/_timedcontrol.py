@@ -0,0 +1,24 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TimedControl(
+    TCSize: Constant,
+    TCSyncInterval: Variable | Constant,
+    TCIntervalUnits: Constant,
+    TCDefaultValue: Variable | Constant,
+    TCCurrentIndex: Variable,
+    TCSource: Variable | Array,
+    TCClockOption: Literal["1", "2", "3"],
+) -> str:
+    return f"TimedControl({TCSize},{TCSyncInterval},{TCIntervalUnits},{TCDefaultValue},{TCCurrentIndex},{TCSource},{TCClockOption})"
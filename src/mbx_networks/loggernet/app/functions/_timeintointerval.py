@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TimeIntoInterval(
+    TintoInt: Variable | Constant, Interval: Variable | Constant, Units: Constant
+) -> str:
+    return f"TimeIntoInterval({TintoInt},{Interval},{Units})"
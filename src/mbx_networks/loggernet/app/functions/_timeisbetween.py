@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TimeIsBetween(
+    BeginTime: Variable | Constant,
+    EndTime: Variable | Constant,
+    Interval: Variable | Constant,
+    Units: Literal["usec", "msec", "sec", "min", "hr", "day"],
+) -> str:
+    return f"TimeIsBetween({BeginTime},{EndTime},{Interval},{Units})"
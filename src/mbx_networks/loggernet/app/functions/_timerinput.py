@@ -0,0 +1,23 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TimerInput(
+    Dest: Variable | Array,
+    StartChan: Literal["C1"],
+    Edge: Literal["0", "1"],
+    Function: Literal["0", "1", "2", "3", "5"],
+    Timeout: Variable | Constant,
+    Timeout_Units: Literal["μsec", "msec", "Sec", "Min"],
+) -> str:
+    return f"TimerInput({Dest},{StartChan},{Edge},{Function},{Timeout},{Timeout_Units})"
@@ -0,0 +1,18 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def TypeOf(
+    TypeVar: Literal["1", "2", "3", "6", "7", "9", "11", "14", "17", "18", "28"],
+) -> str:
+    return f"TypeOf({TypeVar})"
@@ -0,0 +1,30 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def UDPDataGram(
+    IPAddr: Variable,
+    UDPPort: Variable | Constant,
+    UDPSendVar: Variable,
+    UDPSendLen: Constant,
+    UDPRecVar: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    UDPTimeOut: Constant,
+    ConnectionHandle: Variable
+    | Constant
+    | Expression
+    | Array
+    | Integer
+    | ConstantInteger,
+    IPVersion: Constant,
+) -> str:
+    return f"UDPDataGram({IPAddr},{UDPPort},{UDPSendVar},{UDPSendLen},{UDPRecVar},{UDPTimeOut},{ConnectionHandle},{IPVersion})"
@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def UDPOpen(
+    IPAddr: Variable,
+    UDPPort: Variable | Constant,
+    IPBuffer: Constant,
+    IPVersion: Constant,
+) -> str:
+    return f"UDPOpen({IPAddr},{UDPPort},{IPBuffer},{IPVersion})"
@@ -0,0 +1,16 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def VaporPressure(Dest: Variable | Array, Temp: Variable, RH: Variable) -> str:
+    return f"VaporPressure({Dest},{Temp},{RH})"
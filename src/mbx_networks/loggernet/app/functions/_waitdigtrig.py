@@ -0,0 +1,19 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def WaitDigTrig(
+    ControlPort: Literal["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8"],
+    Option: Literal["0", "1", "2", "3"],
+) -> str:
+    return f"WaitDigTrig({ControlPort},{Option})"
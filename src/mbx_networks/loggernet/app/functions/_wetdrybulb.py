@@ -0,0 +1,21 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def WetDryBulb(
+    Dest: Variable | Array,
+    DryTemp: Variable,
+    WetTemp: Variable,
+    Pressure: Variable | Constant,
+) -> str:
+    return f"WetDryBulb({Dest},{DryTemp},{WetTemp},{Pressure})"
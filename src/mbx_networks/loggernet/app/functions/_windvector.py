@@ -0,0 +1,32 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def WindVector(
+    Reps: Constant,
+    SpeedEast: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    DirectionNorth: Variable
+    | Constant
+    | Expression
+    | Array
+    | Integer
+    | ConstantInteger,
+    DataType: Literal[
+        "String", "Boolean", "BOOL8", "Long", "NSEC", "UINT1", "UINT2", "UINT4", "FP2"
+    ],
+    DisableVar: Variable | Constant | Expression,
+    Subinterval: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    SensorType: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    OutputOpt: Literal["0", "1", "2", "3", "4"],
+) -> str:
+    return f"WindVector({Reps},{SpeedEast},{DirectionNorth},{DataType},{DisableVar},{Subinterval},{SensorType},{OutputOpt})"
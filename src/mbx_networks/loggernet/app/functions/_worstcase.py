@@ -0,0 +1,22 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def WorstCase(
+    TableName: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    NumCases: Constant,
+    MaxMin: Literal["0", "1"],
+    Change: Constant,
+    RankVar: Variable,
+) -> str:
+    return f"WorstCase({TableName},{NumCases},{MaxMin},{Change},{RankVar})"
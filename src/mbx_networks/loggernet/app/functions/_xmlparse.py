@@ -0,0 +1,25 @@
+# Generated by app/_get_functions.py, do not edit.
+# ruff: noqa: F401
+from typing import Literal
+
+from app.functions._core import (
+    Array,
+    Constant,
+    ConstantInteger,
+    Expression,
+    Integer,
+    Variable,
+)
+
+
+def XMLParse(
+    XMLContent: Variable | Constant | Expression | Array | Integer | ConstantInteger,
+    XMLValue: Variable,
+    AttrName: Variable,
+    AttrNameSpace: Variable,
+    ElemName: Variable,
+    ElemNameSpace: Variable,
+    MaxDepth: Constant,
+    MaxNameSpaces: Constant,
+) -> str:
+    return f"XMLParse({XMLContent},{XMLValue},{AttrName},{AttrNameSpace},{ElemName},{ElemNameSpace},{MaxDepth},{MaxNameSpaces})"
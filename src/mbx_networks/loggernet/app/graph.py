@@ -0,0 +1,151 @@
+"""The dependencies between the instruments of a program.
+
+An instrument depends on another when one of its ``Dependency`` slots is
+mapped to a variable the other declares, e.g. a camera that switches off on
+the battery voltage measured by ``CR1000X_Battery``. The graph indexes
+instruments by id and variables by identity, so building it, checking it and
+ordering it are all linear in the number of instruments, variables and
+dependencies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.functions import Variable
+from app.instruments import Instrument
+
+
+class DependencyError(ValueError):
+    pass
+
+
+def label(n: int, instrument: Instrument) -> str:
+    """How an instrument is named in errors, ``n`` counting from 1."""
+    return f"#{n} {instrument.manufacturer} {instrument.model}"
+
+
+def bind_dependencies(instruments: list[Instrument]) -> None:
+    """Map every unmapped dependency to the variable that provides it.
+
+    Providers are indexed by capability (``Instrument.provides``), and a
+    dependency is bound when exactly one other instrument provides its name.
+    Dependencies nothing provides are left for ``DependencyGraph.build`` to
+    report.
+
+    Raises:
+        DependencyError: Listing every dependency more than one instrument
+            could provide. Those have to be mapped explicitly.
+    """
+    providers: dict[str, list[tuple[int, Variable]]] = {}
+    for n, instrument in enumerate(instruments):
+        for capability, v in instrument.provides.items():
+            providers.setdefault(capability, []).append((n, v))
+
+    ambiguous = []
+    for n, instrument in enumerate(instruments):
+        if not instrument.dependencies:
+            continue
+        for dep in instrument.dependencies.dependencies:
+            if dep.mapped_dep is not None:
+                continue
+            candidates = [x for x in providers.get(dep.name, []) if x[0] != n]
+            if len(candidates) == 1:
+                instrument.map_dependency(dep.name, candidates[0][1])
+            elif candidates:
+                ambiguous.append(
+                    f"{dep.name} of {label(n + 1, instrument)} could come from "
+                    + " or ".join(label(m + 1, instruments[m]) for m, _ in candidates)
+                )
+
+    if ambiguous:
+        raise DependencyError(
+            f"Ambiguous dependencies, map them explicitly: {'; '.join(ambiguous)}."
+        )
+
+
+@dataclass
+class DependencyGraph:
+    instruments: list[Instrument]
+    # Instrument ids to the positions of the instruments with that id.
+    by_id: dict[str, list[int]]
+    # id() of every declared variable to the position of its instrument.
+    owners: dict[int, int]
+    # The positions of the instruments each instrument depends on.
+    edges: list[list[int]]
+
+    @classmethod
+    def build(cls, instruments: list[Instrument]) -> DependencyGraph:
+        """Index the instruments and check every dependency is mapped.
+
+        Raises:
+            DependencyError: Listing every dependency that isn't mapped, or
+                is mapped to a variable no instrument in the program declares.
+        """
+        by_id: dict[str, list[int]] = {}
+        owners: dict[int, int] = {}
+        for n, instrument in enumerate(instruments):
+            by_id.setdefault(instrument._id, []).append(n)
+            for v in instrument.variables.values():
+                owners[id(v)] = n
+
+        edges: list[list[int]] = []
+        problems = []
+        for n, instrument in enumerate(instruments):
+            edges.append([])
+            if not instrument.dependencies:
+                continue
+            for dep in instrument.dependencies.dependencies:
+                where = f"{dep.name} of {label(n + 1, instrument)}"
+                if dep.mapped_dep is None:
+                    problems.append(f"{where} is not mapped")
+                elif (owner := owners.get(id(dep.mapped_dep))) is None:
+                    problems.append(
+                        f"{where} is mapped to {dep.mapped_dep}, which no instrument in the program declares"
+                    )
+                elif owner != n:
+                    edges[n].append(owner)
+
+        if problems:
+            raise DependencyError(f"Unresolved dependencies: {'; '.join(problems)}.")
+        return cls(instruments, by_id, owners, edges)
+
+    def order(self) -> list[int]:
+        """Positions of the instruments, each after the ones it depends on.
+
+        Instruments already in a valid order keep it.
+
+        Raises:
+            DependencyError: If the dependencies form a cycle.
+        """
+        # 0: not visited, 1: on the current path, 2: done.
+        state = [0] * len(self.instruments)
+        order: list[int] = []
+
+        for root in range(len(self.instruments)):
+            if state[root]:
+                continue
+            state[root] = 1
+            path = [(root, iter(self.edges[root]))]
+            while path:
+                node, deps = path[-1]
+                for dep in deps:
+                    if state[dep] == 1:
+                        nodes = [n for n, _ in path]
+                        cycle = nodes[nodes.index(dep) :]
+                        raise DependencyError(
+                            "Circular dependencies: "
+                            + " -> ".join(
+                                label(n + 1, self.instruments[n]) for n in [*cycle, dep]
+                            )
+                        )
+                    if state[dep] == 0:
+                        state[dep] = 1
+                        path.append((dep, iter(self.edges[dep])))
+                        break
+                else:
+                    path.pop()
+                    state[node] = 2
+                    order.append(node)
+
+        return order
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from collections import Counter
+from copy import copy
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from app import functions
 from app.functions import Variable, VarType, DataType
 from typing import Literal, Optional, Callable, Any
 from abc import ABC
 from enum import Enum
 from app.operators import If, For
-from textwrap import indent
+from app import ir
+from app import symbols
 
 
 @dataclass
@@ -36,6 +40,9 @@ class CardOut:
     def __str__(self):
         return f"CardOut({self.StopRing},{self.Size})"
 
+    def to_ir(self) -> ir.Call:
+        return ir.Call("CardOut", (self.StopRing, self.Size))
+
 
 @dataclass
 class DataInterval:
@@ -57,6 +64,11 @@ class DataInterval:
             f"DataInterval({self.TIntoInt},{self.Interval},{self.Units},{self.Lapses})"
         )
 
+    def to_ir(self) -> ir.Call:
+        return ir.Call(
+            "DataInterval", (self.TIntoInt, self.Interval, self.Units, self.Lapses)
+        )
+
 
 class Table:
     def __init__(
@@ -75,18 +87,21 @@ class Table:
         self.data_interval = data_interval
         self.card_out = card_out
 
-    def __str__(self):
-        s = f"DataTable({self.name},{self.trig_var},{self.size})\n"
-        s += f"    {str(self.data_interval)}\n"
+    def to_ir(self) -> ir.DataTable:
+        settings = [self.data_interval.to_ir()]
         if self.card_out:
-            s += f"    {str(self.card_out)}\n"
-
-        for item in self.table_items:
-            s += f"\n    {str(item)}"
-
-        s += "\nEndTable"
+            settings.append(self.card_out.to_ir())
+
+        return ir.DataTable(
+            self.name,
+            self.trig_var,
+            self.size,
+            settings,
+            [ir.Statement(str(item)) for item in self.table_items],
+        )
 
-        return s
+    def __str__(self):
+        return ir.render(self.to_ir())
 
     def __eq__(self, other: Table):
         return (
@@ -108,26 +123,26 @@ class Scan:
     def __str__(self):
         return f"Scan({self.ScanInterval},{self.ScanUnit},{self.BufferOption},{self.Count})"
 
+    def to_ir(self) -> ir.Call:
+        return ir.Call(
+            "Scan", (self.ScanInterval, self.ScanUnit, self.BufferOption, self.Count)
+        )
+
 
 @dataclass
 class SlowSequence:
     id: int | str
     scan: Scan
-    logic: str | list[str]
+    logic: ir.Code
 
     def __post_init__(self):
-        if isinstance(self.logic, list):
-            self.logic = "\n".join(self.logic)
+        self.logic = ir.as_block(self.logic)
+
+    def to_ir(self) -> ir.SlowSequence:
+        return ir.SlowSequence(str(self.id), self.scan.to_ir(), self.logic)
 
     def __str__(self) -> str:
-        return "\n".join(
-            [
-                f"SlowSequence '{self.id}",
-                str(self.scan),
-                indent(str(self.logic), "    "),
-                "NextScan",
-            ]
-        )
+        return ir.render(self.to_ir())
 
 
 class WireOptions(Enum):
@@ -239,21 +254,20 @@ class Dependencies:
     def __init__(self, parent: Instrument, *dependencies: Dependency):
         self.parent = parent
         self.dependencies = dependencies
+        self._index = {x.name: x for x in dependencies}
 
     def _internal_getitem(
         self, item: str, return_mapped: bool = True
     ) -> Variable | Dependency:
-        for dep in self.dependencies:
-            if dep.name == item:
-                if return_mapped:
-                    if dep.mapped_dep is None:
-                        raise ValueError(
-                            f"A dependency has not been mapped for {self.parent.manufacturer} {self.parent.model} ({self.parent.type})"
-                        )
-                    return dep.mapped_dep
-                else:
-                    return dep
-        raise ValueError(f"{item} is not a declared dependency.")
+        if (dep := self._index.get(item)) is None:
+            raise ValueError(f"{item} is not a declared dependency.")
+        if not return_mapped:
+            return dep
+        if dep.mapped_dep is None:
+            raise ValueError(
+                f"A dependency has not been mapped for {self.parent.manufacturer} {self.parent.model} ({self.parent.type})"
+            )
+        return dep.mapped_dep
 
     def __getitem__(self, item: str) -> Variable:
         return self._internal_getitem(item, True)
@@ -261,6 +275,86 @@ class Dependencies:
     def map_dependency(self, item: str, v: Variable) -> None:
         item: Dependency = self._internal_getitem(item, False)
         item.mapped_dep = v
+        self.parent.invalidate()
+
+
+@dataclass(frozen=True)
+class Definition:
+    """The default wiring, variables and dependencies of an instrument.
+
+    ``provides`` names the variables other instruments' dependencies are
+    bound to automatically, see ``graph.bind_dependencies``. The variable's
+    name is the capability: a ``batt_volt`` dependency binds to a provided
+    ``batt_volt`` variable.
+
+    A definition is built once per instrument class (and SDI-12 address, for
+    SDI-12 instruments) and shared by all of its instances. It's never handed
+    out: each instance gets its own copies to rewire, rename and map, so the
+    definition can be shared freely, across threads included.
+    """
+
+    wires: WiringDiagram | None = None
+    variables: tuple[Variable, ...] = ()
+    dependencies: tuple[Dependency, ...] = ()
+    provides: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "variables", tuple(self.variables))
+        object.__setattr__(self, "dependencies", tuple(self.dependencies))
+        object.__setattr__(self, "provides", tuple(self.provides))
+
+    def instantiate(self, parent: Instrument) -> None:
+        if self.wires is not None:
+            parent.wires = WiringDiagram(
+                *(Wire(x.wire, x.port, x.description) for x in self.wires.args),
+                description=self.wires.description,
+            )
+        if self.variables:
+            parent.variables = [copy(x) for x in self.variables]
+        if self.dependencies:
+            parent.dependencies = Dependencies(
+                parent, *(Dependency(x.name, x.description) for x in self.dependencies)
+            )
+
+
+# Definitions are shared per instrument class and SDI-12 address, of which
+# there are 62. The bound only matters for callers that skip `schemas`.
+DEFINITION_CACHE_SIZE = 1024
+
+# Code sections an instrument builds on demand, see `Instrument.invalidate`.
+SECTIONS = ("tables", "pre_scan", "funcs", "program", "post_scan", "slow_sequence")
+# Setting any of these throws away the instrument's built sections.
+SECTION_INPUTS = ("variables", "wires", "dependencies", "elevation", "sdi12_address")
+
+
+def _memoized_section(name: str, prop: property) -> property:
+    def fget(self: Instrument):
+        # Sections are built once, with references to the variables rather
+        # than their names, so the same build serves every program.
+        if name not in self._sections:
+            with symbols.collecting() as refs:
+                section = prop.fget(self)
+            self._sections[name] = (section, refs)
+            self.section_builds[name] += 1
+        section, refs = self._sections[name]
+        if symbols.capturing():
+            symbols.register(refs)
+            return section
+        # Outside of a program, hand out a copy with the current names.
+        table = symbols.SymbolTable()
+        for v in refs.values():
+            table.add(v)
+        return table.resolve_object(section)
+
+    def fset(self: Instrument, value: Any):
+        prop.fset(self, value)
+        self.invalidate(name)
+        # Code set while collecting, e.g. merged from several instruments,
+        # can reference other instruments' variables. Keep track of them.
+        if (refs := symbols.collected()) is not None:
+            self._sections[name] = (value, dict(refs))
+
+    return property(fget, fset if prop.fset is not None else None, doc=prop.__doc__)
 
 
 @dataclass
@@ -279,9 +373,59 @@ class Instrument(ABC):
     sdi12_address: str | None = None
     transform: Callable[["Instrument"], "Instrument"] | None = None
 
+    _sections: dict[str, tuple[Any, dict[int, Variable]]] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    # How many times each section has been built, for spotting rebuilds.
+    section_builds: Counter[str] = field(
+        init=False, default_factory=Counter, repr=False, compare=False
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in SECTIONS:
+            if isinstance(prop := cls.__dict__.get(name), property):
+                setattr(cls, name, _memoized_section(name, prop))
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in SECTION_INPUTS and "_sections" in self.__dict__:
+            self.invalidate()
+
+    def invalidate(self, *sections: str) -> None:
+        """Forget built sections (all of them by default) so they're rebuilt
+        on next access.
+
+        Replacing variables, wires or dependencies, mapping a dependency and
+        running the transform do this already. Call it after changing them in
+        place, e.g. rewiring a ``Wire``.
+        """
+        if not sections:
+            self._sections.clear()
+            return
+        for name in sections:
+            self._sections.pop(name, None)
+
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        """Build the instrument's definition.
+
+        Only SDI-12 instruments are given their address, for variables that
+        are named after it.
+        """
+        return Definition()
+
+    @classmethod
+    @lru_cache(maxsize=DEFINITION_CACHE_SIZE)
+    def _shared_definition(cls, sdi12_address: str | None) -> Definition:
+        return cls.define(sdi12_address)
+
     def __post_init__(self):
+        self._definition().instantiate(self)
         if isinstance(self.variables, list):
             self.variables = {x.name: x for x in self.variables}
+        if self.variables:
+            symbols.bind_aliases(self.variables.values())
         if self.transform is not None:
             self._transform()
         self.check_unique_names()
@@ -290,21 +434,32 @@ class Instrument(ABC):
                 "This is an SDI12 device and an SDI12 address isn't specified."
             )
 
+    def _definition(self) -> Definition:
+        if not self.is_sdi12 or self.sdi12_address is None:
+            return self._shared_definition(None)
+        return self._shared_definition(str(self.sdi12_address))
+
     def _transform(self):
         self.transform(self)
+        self.invalidate()
+
+    @property
+    def provides(self) -> dict[str, Variable]:
+        """The variables this instrument provides to others, by capability."""
+        return {x: self.variables[x] for x in self._definition().provides}
 
     def check_unique_names(self):
-        exists = []
         is_list = isinstance(self.variables, list)
         iterator = self.variables if is_list else self.variables.keys()
+        label = f"{self.manufacturer} {self.model}"
 
-        for v in iterator:
-            v = v.name if is_list else v
-            if v in exists:
-                raise ValueError(
-                    f"Variable named {v} is duplicated... Please make all names unique."
-                )
-            exists.append(v)
+        collisions = symbols.find_duplicates(
+            (v.name if is_list else v, label) for v in iterator
+        )
+        if collisions:
+            raise symbols.DuplicateNameError(
+                collisions, "Please make all names unique."
+            )
 
     @property
     def tables(self) -> list[Table]:
@@ -330,6 +485,15 @@ class Instrument(ABC):
     def slow_sequence(self) -> SlowSequence:
         raise NotImplementedError()
 
+    def section(
+        self, name: Literal["pre_scan", "program", "post_scan", "funcs"]
+    ) -> ir.Block:
+        """Return one of the code sections as IR, empty if it isn't defined."""
+        try:
+            return ir.as_block(getattr(self, name))
+        except NotImplementedError:
+            return ir.Block()
+
     def to_json(self) -> dict[str, Any]:
         try:
             tables = {x.name: x for x in self.tables}
@@ -350,6 +514,8 @@ class Instrument(ABC):
 
         if self.dependencies:
             out["Dependencies"] = self.dependencies.dependencies
+        if provides := self.provides:
+            out["Provides"] = list(provides)
 
         return out
 
@@ -362,18 +528,21 @@ class Instrument(ABC):
             if self.tables
             else ""
         )
-        pre_scan = f"Pre-Scan Logic:\n{self.pre_scan}\n" if self.pre_scan else ""
+        pre_scan = self.section("pre_scan")
+        pre_scan = f"Pre-Scan Logic:\n{ir.render(pre_scan)}\n" if pre_scan else ""
         function_str = (
             "User-Defined Functions:\n" + "\n".join(str(x) for x in self.funcs)
             if self.funcs
             else ""
         )
-        program = f"Program Logic:\n\n{self.program}\n" if self.program else ""
+        program = self.section("program")
+        program = f"Program Logic:\n\n{ir.render(program)}\n" if program else ""
         slow_seq = (
             f"Slow Sequence:\n\n{self.slow_sequence}\n" if self.slow_sequence else ""
         )
+        post_scan = self.section("post_scan")
         post_scan = (
-            f"Post Table Call Logic:\n{self.post_scan}\n" if self.post_scan else ""
+            f"Post Table Call Logic:\n{ir.render(post_scan)}\n" if post_scan else ""
         )
 
         return "\n".join(
@@ -401,24 +570,26 @@ class RMYoung_05108_77(Instrument):
     type: str = "Wind"
     _id: str = "rmyoung_05108_77"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Red", WireOptions.P1, "WS Signal      WS SIG"),
-            Wire("White", WireOptions.VX2, "WD Excite      WD EXC"),
-            Wire("Green", WireOptions.SE7, "WD Signal      WD SIG"),
-            Wire("Black", WireOptions.AG, "Signal G       WD REF"),
-            Wire("Brown", WireOptions.G, "Earth G        GND*"),
-            description="* NOTE: Ground to EARTH in junction box directly to mast",
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Red", WireOptions.P1, "WS Signal      WS SIG"),
+                Wire("White", WireOptions.VX2, "WD Excite      WD EXC"),
+                Wire("Green", WireOptions.SE7, "WD Signal      WD SIG"),
+                Wire("Black", WireOptions.AG, "Signal G       WD REF"),
+                Wire("Brown", WireOptions.G, "Earth G        GND*"),
+                description="* NOTE: Ground to EARTH in junction box directly to mast",
+            ),
+            variables=[
+                Variable("WS_offset", VarType.CONST, value=0),
+                Variable("WS_multiplier", VarType.CONST, value=0.1666),
+                Variable("wind_spd", VarType.PUBLIC, units="m s-1"),
+                Variable("wind_dir", VarType.PUBLIC, units="arcdeg"),
+                Variable("wind_timer", VarType.PUBLIC, units="sec"),
+                Variable("windgust", VarType.FIELD_ONLY),
+            ],
         )
-        self.variables = [
-            Variable("WS_offset", VarType.CONST, value=0),
-            Variable("WS_multiplier", VarType.CONST, value=0.1666),
-            Variable("wind_spd", VarType.PUBLIC, units="m s-1"),
-            Variable("wind_dir", VarType.PUBLIC, units="arcdeg"),
-            Variable("wind_timer", VarType.PUBLIC, units="sec"),
-            Variable("windgust", VarType.FIELD_ONLY),
-        ]
-        return super().__post_init__()
 
     @property
     def tables(self) -> list[Table]:
@@ -469,44 +640,41 @@ class RMYoung_05108_77(Instrument):
         ]
 
     @property
-    def program(self) -> str:
-        return "\n".join(
-            str(x)
-            for x in [
-                functions.BrHalf(
-                    self.variables["wind_dir"],
-                    1,
-                    "mV5000",
-                    self.wires["Green"],
-                    self.wires["White"],
-                    1,
-                    2500,
-                    True,
-                    0,
-                    "60",
-                    355,
-                    0,
-                ),
-                functions.PulseCount(
-                    self.variables["wind_spd"],
-                    1,
-                    self.wires["Red"],
-                    "5",
-                    "1",
-                    self.variables["WS_multiplier"],
-                    self.variables["WS_offset"],
-                ),
-                If(
-                    self.variables["wind_spd"],
-                    "<=",
-                    0,
-                    logic=[
-                        f"{self.variables['wind_dir']} = NAN",
-                        f"{self.variables['wind_timer']} = 3",
-                    ],
-                ).Else(f"{self.variables['wind_timer']} = 0"),
-            ]
-        )
+    def program(self) -> ir.Code:
+        return [
+            functions.BrHalf(
+                self.variables["wind_dir"],
+                1,
+                "mV5000",
+                self.wires["Green"],
+                self.wires["White"],
+                1,
+                2500,
+                True,
+                0,
+                "60",
+                355,
+                0,
+            ),
+            functions.PulseCount(
+                self.variables["wind_spd"],
+                1,
+                self.wires["Red"],
+                "5",
+                "1",
+                self.variables["WS_multiplier"],
+                self.variables["WS_offset"],
+            ),
+            If(
+                self.variables["wind_spd"],
+                "<=",
+                0,
+                logic=[
+                    f"{self.variables['wind_dir']} = NAN",
+                    f"{self.variables['wind_timer']} = 3",
+                ],
+            ).Else(f"{self.variables['wind_timer']} = 0"),
+        ]
 
 
 @dataclass
@@ -516,22 +684,24 @@ class RMYoung_09106(Instrument):
     type: str = "Wind"
     _id: str = "rmyoung_09106"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Red", WireOptions._12V, "12v Power"),
-            Wire("White", WireOptions.AG, "Signal G"),
-            Wire("Clear", WireOptions.AG, "Signal G"),
-            Wire("Green", WireOptions.SE13, "WD Signal"),
-            Wire("Brown", WireOptions.SE14, "WS Signal"),
-            Wire("Black", WireOptions.G, "Power Ground"),
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Red", WireOptions._12V, "12v Power"),
+                Wire("White", WireOptions.AG, "Signal G"),
+                Wire("Clear", WireOptions.AG, "Signal G"),
+                Wire("Green", WireOptions.SE13, "WD Signal"),
+                Wire("Brown", WireOptions.SE14, "WS Signal"),
+                Wire("Black", WireOptions.G, "Power Ground"),
+            ),
+            variables=[
+                Variable("wind_spd", VarType.PUBLIC, units="m s-1"),
+                Variable("wind_dir", VarType.PUBLIC, units="arcdeg"),
+                Variable("wind_timer", VarType.PUBLIC, units="sec"),
+                Variable("windgust", VarType.FIELD_ONLY),
+            ],
         )
-        self.variables = [
-            Variable("wind_spd", VarType.PUBLIC, units="m s-1"),
-            Variable("wind_dir", VarType.PUBLIC, units="arcdeg"),
-            Variable("wind_timer", VarType.PUBLIC, units="sec"),
-            Variable("windgust", VarType.FIELD_ONLY),
-        ]
-        return super().__post_init__()
 
     @property
     def tables(self) -> list[Table]:
@@ -611,17 +781,19 @@ class Setra_CS100(Instrument):
     type: str = "Barometer"
     _id: str = "setra_cs100"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Blue", WireOptions.SE2, "Signal H"),
-            Wire("Yellow", WireOptions.AG, "Signal G"),
-            Wire("Clear", WireOptions.AG, "Signal G"),
-            Wire("Red", WireOptions._12V, "12v Power"),
-            Wire("Black", WireOptions.G, "Power Ground"),
-            Wire("Green", WireOptions.C2, "Control"),
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Blue", WireOptions.SE2, "Signal H"),
+                Wire("Yellow", WireOptions.AG, "Signal G"),
+                Wire("Clear", WireOptions.AG, "Signal G"),
+                Wire("Red", WireOptions._12V, "12v Power"),
+                Wire("Black", WireOptions.G, "Power Ground"),
+                Wire("Green", WireOptions.C2, "Control"),
+            ),
+            variables=[Variable("bp", VarType.PUBLIC, units="kPa")],
         )
-        self.variables = [Variable("bp", VarType.PUBLIC, units="kPa")]
-        return super().__post_init__()
 
     @property
     def tables(self) -> list[Table]:
@@ -660,28 +832,30 @@ class Vaisala_HMP155(Instrument):
     type: str = "RH/T"
     _id: str = "vaisala_hmp155"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Brown", WireOptions.COM7, "RS485 B"),
-            Wire("Pink", WireOptions.C8, "RS485 A"),
-            Wire("Red", WireOptions.RG2),
-            Wire("Blue", WireOptions._12V, "12V Power"),
-            Wire("Black/Clear", WireOptions.AG),
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Brown", WireOptions.COM7, "RS485 B"),
+                Wire("Pink", WireOptions.C8, "RS485 A"),
+                Wire("Red", WireOptions.RG2),
+                Wire("Blue", WireOptions._12V, "12V Power"),
+                Wire("Black/Clear", WireOptions.AG),
+            ),
+            variables=[
+                Variable("rhtemp(2)", VarType.PUBLIC, DataType.FLOAT),
+                Variable("rhtemp(1)", VarType.ALIAS, value="rh", units="%"),
+                Variable("rhtemp(2)", VarType.ALIAS, value="air_temp", units="deg C"),
+                Variable("reset_hmp155", VarType.PUBLIC, DataType.BOOLEAN),
+                Variable("NBytesReturned", VarType.DIM, DataType.LONG),
+                Variable("SerialIngest", VarType.DIM, DataType("String26")),
+                Variable("String_1", VarType.DIM, DataType.STRING),
+                Variable("String_2", VarType.DIM, DataType.STRING),
+                Variable("CRLF", VarType.CONST, value="CHR(13)+CHR(10)"),
+            ],
+            provides=["air_temp"],
         )
 
-        self.variables = [
-            Variable("rhtemp(2)", VarType.PUBLIC, DataType.FLOAT),
-            Variable("rhtemp(1)", VarType.ALIAS, value="rh", units="%"),
-            Variable("rhtemp(2)", VarType.ALIAS, value="air_temp", units="deg C"),
-            Variable("reset_hmp155", VarType.PUBLIC, DataType.BOOLEAN),
-            Variable("NBytesReturned", VarType.DIM, DataType.LONG),
-            Variable("SerialIngest", VarType.DIM, DataType("String26")),
-            Variable("String_1", VarType.DIM, DataType.STRING),
-            Variable("String_2", VarType.DIM, DataType.STRING),
-            Variable("CRLF", VarType.CONST, value="CHR(13)+CHR(10)"),
-        ]
-        return super().__post_init__()
-
     @property
     def tables(self) -> list[Table]:
         return [
@@ -778,42 +952,45 @@ class Acclima_TDR310N(Instrument):
             raise AttributeError(
                 "This device is deployed at depth. An elevation must be assigned."
             )
+        return super().__post_init__()
 
-        self.wires = WiringDiagram(
-            Wire("Blue", WireOptions.C3, "SDI-12 data  SDI_ADD: 1-5"),
-            Wire("Red", WireOptions._12V, "12v Power"),
-            Wire("White", WireOptions.G, "Ground"),
-        )
-
-        self.variables = [
-            Variable(f"soil_{self.sdi12_address}(5)", VarType.PUBLIC),
-            Variable(
-                f"soil_{self.sdi12_address}(1)",
-                VarType.ALIAS,
-                value="soil_vwc",
-                units="m3 m-3",
-            ),
-            Variable(
-                f"soil_{self.sdi12_address}(2)",
-                VarType.ALIAS,
-                value="soil_temp",
-                units="deg C",
-            ),
-            Variable(f"soil_{self.sdi12_address}(3)", VarType.ALIAS, value="soil_perm"),
-            Variable(
-                f"soil_{self.sdi12_address}(4)",
-                VarType.ALIAS,
-                value="soil_ec_blk",
-                units="uS cm-1",
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Blue", WireOptions.C3, "SDI-12 data  SDI_ADD: 1-5"),
+                Wire("Red", WireOptions._12V, "12v Power"),
+                Wire("White", WireOptions.G, "Ground"),
             ),
-            Variable(
-                f"soil_{self.sdi12_address}(5)",
-                VarType.ALIAS,
-                value="soil_ec_por",
-                units="uS cm-1",
-            ),
-        ]
-        return super().__post_init__()
+            variables=[
+                Variable(f"soil_{sdi12_address}(5)", VarType.PUBLIC),
+                Variable(
+                    f"soil_{sdi12_address}(1)",
+                    VarType.ALIAS,
+                    value="soil_vwc",
+                    units="m3 m-3",
+                ),
+                Variable(
+                    f"soil_{sdi12_address}(2)",
+                    VarType.ALIAS,
+                    value="soil_temp",
+                    units="deg C",
+                ),
+                Variable(f"soil_{sdi12_address}(3)", VarType.ALIAS, value="soil_perm"),
+                Variable(
+                    f"soil_{sdi12_address}(4)",
+                    VarType.ALIAS,
+                    value="soil_ec_blk",
+                    units="uS cm-1",
+                ),
+                Variable(
+                    f"soil_{sdi12_address}(5)",
+                    VarType.ALIAS,
+                    value="soil_ec_por",
+                    units="uS cm-1",
+                ),
+            ],
+        )
 
     @property
     def tables(self) -> list[Table]:
@@ -901,34 +1078,41 @@ class ProStar_EMC1(Instrument):
     type: str = "Charge Data"
     _id: str = "prostar_emc1"
 
-    def __post_init__(self):
-        self.variables = [
-            Variable("ModbusSocket", VarType.PUBLIC, DataType.FLOAT),
-            Variable("ModbusResult", VarType.PUBLIC),
-            Variable("ChgCntDat(82)", VarType.DIM, DataType.LONG),
-            Variable("i", VarType.DIM),
-            Variable("batt_volt", VarType.PUBLIC, units="v"),
-            Variable("shutoff_voltage", VarType.PUBLIC, units="v"),
-            Variable("ChgCntDat(17)", VarType.ALIAS, value="charge_current"),
-            Variable("ChgCntDat(18)", VarType.ALIAS, value="array_current"),
-            Variable("ChgCntDat(19)", VarType.ALIAS, value="battery_terminal_voltage"),
-            Variable("ChgCntDat(21)", VarType.ALIAS, value="load_voltage"),
-            Variable("ChgCntDat(22)", VarType.ALIAS, value="net_battery_current"),
-            Variable("ChgCntDat(23)", VarType.ALIAS, value="load_current"),
-            Variable("ChgCntDat(27)", VarType.ALIAS, value="heatsink_temp"),
-            Variable("ChgCntDat(28)", VarType.ALIAS, value="battery_temp"),
-            Variable("ChgCntDat(29)", VarType.ALIAS, value="ambient_temp"),
-            Variable("ChgCntDat(34)", VarType.ALIAS, value="charge_state"),
-            Variable("ChgCntDat(41)", VarType.ALIAS, value="total_ah_charge_hi"),
-            Variable("ChgCntDat(42)", VarType.ALIAS, value="total_ah_charge_lo"),
-            Variable("ChgCntDat(47)", VarType.ALIAS, value="load_state"),
-            Variable("ChgCntDat(53)", VarType.ALIAS, value="total_ah_load_hi"),
-            Variable("ChgCntDat(54)", VarType.ALIAS, value="total_ah_load_lo"),
-            Variable("ChgCntDat(74)", VarType.ALIAS, value="daily_absorption_time"),
-            Variable("ChgCntDat(75)", VarType.ALIAS, value="daily_equalization_time"),
-            Variable("ChgCntDat(76)", VarType.ALIAS, value="daily_float_time"),
-        ]
-        return super().__post_init__()
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            variables=[
+                Variable("ModbusSocket", VarType.PUBLIC, DataType.FLOAT),
+                Variable("ModbusResult", VarType.PUBLIC),
+                Variable("ChgCntDat(82)", VarType.DIM, DataType.LONG),
+                Variable("i", VarType.DIM),
+                Variable("batt_volt", VarType.PUBLIC, units="v"),
+                Variable("shutoff_voltage", VarType.PUBLIC, units="v"),
+                Variable("ChgCntDat(17)", VarType.ALIAS, value="charge_current"),
+                Variable("ChgCntDat(18)", VarType.ALIAS, value="array_current"),
+                Variable(
+                    "ChgCntDat(19)", VarType.ALIAS, value="battery_terminal_voltage"
+                ),
+                Variable("ChgCntDat(21)", VarType.ALIAS, value="load_voltage"),
+                Variable("ChgCntDat(22)", VarType.ALIAS, value="net_battery_current"),
+                Variable("ChgCntDat(23)", VarType.ALIAS, value="load_current"),
+                Variable("ChgCntDat(27)", VarType.ALIAS, value="heatsink_temp"),
+                Variable("ChgCntDat(28)", VarType.ALIAS, value="battery_temp"),
+                Variable("ChgCntDat(29)", VarType.ALIAS, value="ambient_temp"),
+                Variable("ChgCntDat(34)", VarType.ALIAS, value="charge_state"),
+                Variable("ChgCntDat(41)", VarType.ALIAS, value="total_ah_charge_hi"),
+                Variable("ChgCntDat(42)", VarType.ALIAS, value="total_ah_charge_lo"),
+                Variable("ChgCntDat(47)", VarType.ALIAS, value="load_state"),
+                Variable("ChgCntDat(53)", VarType.ALIAS, value="total_ah_load_hi"),
+                Variable("ChgCntDat(54)", VarType.ALIAS, value="total_ah_load_lo"),
+                Variable("ChgCntDat(74)", VarType.ALIAS, value="daily_absorption_time"),
+                Variable(
+                    "ChgCntDat(75)", VarType.ALIAS, value="daily_equalization_time"
+                ),
+                Variable("ChgCntDat(76)", VarType.ALIAS, value="daily_float_time"),
+            ],
+            provides=["batt_volt", "shutoff_voltage"],
+        )
 
     @property
     def pre_scan(self):
@@ -1001,21 +1185,21 @@ class ProStar_EMC1(Instrument):
                         9600,
                         1,
                         3,
-                        str(self.variables["ChgCntDat(82)"]).replace("(82)", ""),
+                        self.variables["ChgCntDat(82)"].array_name,
                         1,
                         82,
                         3,
                         1500,
                         3,
                     ),
-                    f" {self.variables['batt_volt']} = ScaleToF16({str(self.variables['ChgCntDat(82)']).replace('(82)', '(25)')})\n",
+                    f" {self.variables['batt_volt']} = ScaleToF16({self.variables['ChgCntDat(82)'].element(25)})\n",
                     str(
                         If(
                             self.variables["ModbusSocket"],
                             "=",
                             0,
                             logic=For(
-                                logic=f"{str(self.variables['ChgCntDat(82)']).replace('82', 'i')} = NAN",
+                                logic=f"{self.variables['ChgCntDat(82)'].element('i')} = NAN",
                                 v=self.variables["i"],
                                 start=1,
                                 end=82,
@@ -1034,12 +1218,15 @@ class CR1000X_Battery(Instrument):
     type: str = "Charge Data"
     _id: str = "cr1000x_charge"
 
-    def __post_init__(self):
-        self.variables = [
-            Variable("batt_volt", VarType.PUBLIC, units="v"),
-            Variable("shutoff_voltage", VarType.PUBLIC),
-        ]
-        return super().__post_init__()
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            variables=[
+                Variable("batt_volt", VarType.PUBLIC, units="v"),
+                Variable("shutoff_voltage", VarType.PUBLIC),
+            ],
+            provides=["batt_volt", "shutoff_voltage"],
+        )
 
     @property
     def tables(self) -> list[Table]:
@@ -1069,10 +1256,11 @@ class CR1000X_PanelTemp(Instrument):
     type: str = "Temperature"
     _id: str = "cr1000x_temp"
 
-    def __post_init__(self):
-        self.variables = [Variable("panel_temp", VarType.PUBLIC, units="deg C")]
-
-        return super().__post_init__()
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            variables=[Variable("panel_temp", VarType.PUBLIC, units="deg C")],
+        )
 
     @property
     def program(self):
@@ -1081,32 +1269,33 @@ class CR1000X_PanelTemp(Instrument):
 
 @dataclass
 class Generic_IPCamera(Instrument):
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Black", WireOptions.G, "#4 Black to Ground"),
-            Wire(
-                "Red",
-                WireOptions.SW12_1,
-                "CR1000X SW1 and #2 red to fuse block (6.2A fuse)",
-            ),
-            description="Red from camera to #1 and white to ground (yellow cable)",
-        )
-
-        self.variables = [
-            Variable("Camera_Power", VarType.PUBLIC, DataType.BOOLEAN),
-            Variable("Camera_Power_Manual", VarType.PUBLIC, DataType.BOOLEAN),
-        ]
-        self.dependencies = Dependencies(
-            self,
-            Dependency("batt_volt", "Variable measuring the current battery voltage."),
-            Dependency(
-                "shutoff_voltage",
-                "A variable storing the voltage at which the camera should shut off for battery savings.",
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Black", WireOptions.G, "#4 Black to Ground"),
+                Wire(
+                    "Red",
+                    WireOptions.SW12_1,
+                    "CR1000X SW1 and #2 red to fuse block (6.2A fuse)",
+                ),
+                description="Red from camera to #1 and white to ground (yellow cable)",
             ),
+            variables=[
+                Variable("Camera_Power", VarType.PUBLIC, DataType.BOOLEAN),
+                Variable("Camera_Power_Manual", VarType.PUBLIC, DataType.BOOLEAN),
+            ],
+            dependencies=[
+                Dependency(
+                    "batt_volt", "Variable measuring the current battery voltage."
+                ),
+                Dependency(
+                    "shutoff_voltage",
+                    "A variable storing the voltage at which the camera should shut off for battery savings.",
+                ),
+            ],
         )
 
-        return super().__post_init__()
-
     @property
     def pre_scan(self):
         "\n".join(
@@ -1117,44 +1306,30 @@ class Generic_IPCamera(Instrument):
         )
 
     @property
-    def program(self):
-        return "\n".join(
-            [
-                str(
+    def program(self) -> ir.Code:
+        return [
+            If(
+                self.variables["Camera_Power_Manual"],
+                logic=functions.SW12(self.wires["Red"], self.variables["Camera_Power"]),
+            ).Else(
+                [
                     If(
-                        self.variables["Camera_Power_Manual"],
-                        logic=functions.SW12(
-                            self.wires["Red"], self.variables["Camera_Power"]
-                        ),
-                    ).Else(
-                        "\n".join(
-                            [
-                                str(
-                                    If(
-                                        functions.TimeIsBetween(2, 3, 1400, "min"),
-                                        logic=f"{self.variables['Camera_Power']}=False",
-                                    ).Else(f"{self.variables['Camera_Power']}=True")
-                                ),
-                                str(
-                                    If(
-                                        self.dependencies["batt_volt"].name,
-                                        "<",
-                                        self.dependencies["shutoff_voltage"].name,
-                                        logic=f"{self.variables['Camera_Power']}=false",
-                                    )
-                                ),
-                                str(
-                                    functions.SW12(
-                                        self.wires["Red"],
-                                        self.variables["Camera_Power"],
-                                    )
-                                ),
-                            ]
-                        )
-                    )
-                )
-            ]
-        )
+                        functions.TimeIsBetween(2, 3, 1400, "min"),
+                        logic=f"{self.variables['Camera_Power']}=False",
+                    ).Else(f"{self.variables['Camera_Power']}=True"),
+                    If(
+                        self.dependencies["batt_volt"],
+                        "<",
+                        self.dependencies["shutoff_voltage"],
+                        logic=f"{self.variables['Camera_Power']}=false",
+                    ),
+                    functions.SW12(
+                        self.wires["Red"],
+                        self.variables["Camera_Power"],
+                    ),
+                ]
+            )
+        ]
 
 
 @dataclass
@@ -1186,18 +1361,19 @@ class SparkFun_Door_Switch(Instrument):
     type: str = "Door"
     _id: str = "sparkfun_door"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Red", WireOptions._5V, "5v Power"),
-            Wire("Black", WireOptions.C4, "Open/Closed Status"),
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Red", WireOptions._5V, "5v Power"),
+                Wire("Black", WireOptions.C4, "Open/Closed Status"),
+            ),
+            variables=[
+                Variable("door", VarType.PUBLIC),
+                Variable("door_timer", VarType.PUBLIC, DataType.LONG, units="sec"),
+            ],
         )
 
-        self.variables = [
-            Variable("door", VarType.PUBLIC),
-            Variable("door_timer", VarType.PUBLIC, DataType.LONG, units="sec"),
-        ]
-        return super().__post_init__()
-
     @property
     def tables(self) -> list[Table]:
         return [
@@ -1223,38 +1399,28 @@ class SparkFun_Door_Switch(Instrument):
         ]
 
     @property
-    def program(self) -> str:
-        return "\n".join(
-            [
-                str(
+    def program(self) -> ir.Code:
+        return [
+            If(
+                functions.CheckPort(self.wires["Black"]),
+                logic=[
+                    f"{self.variables['door']} = 0",
+                    f"{self.variables['door_timer']} = 0",
+                    functions.Timer(1, "2", "3"),
+                ],
+            ).Else(
+                [
+                    functions.Timer(1, "2", "0"),
+                    f"{self.variables['door_timer']} = {functions.Timer(1, '2', '4')}",
                     If(
-                        functions.CheckPort(self.wires["Black"]),
-                        logic="\n".join(
-                            [
-                                f"{self.variables['door']} = 0",
-                                f"{self.variables['door_timer']} = 0",
-                                functions.Timer(1, "2", "3"),
-                            ]
-                        ),
-                    ).Else(
-                        "\n".join(
-                            [
-                                functions.Timer(1, "2", "0"),
-                                f"{self.variables['door_timer']} = {functions.Timer(1, '2', '4')}",
-                                str(
-                                    If(
-                                        self.variables["door_timer"],
-                                        ">",
-                                        14400,
-                                        logic=f"{self.variables['door']} = 0",
-                                    ).Else(f"{self.variables['door']} = 1")
-                                ),
-                            ]
-                        )
-                    )
-                )
-            ]
-        )
+                        self.variables["door_timer"],
+                        ">",
+                        14400,
+                        logic=f"{self.variables['door']} = 0",
+                    ).Else(f"{self.variables['door']} = 1"),
+                ]
+            )
+        ]
 
 
 @dataclass
@@ -1269,21 +1435,26 @@ class OTT_PLS500(Instrument):
         assert self.sdi12_address is not None, (
             "An SDI12 Address must be specified for this device."
         )
+        super().__post_init__()
 
-        self.wires = WiringDiagram(
-            Wire("Blue", WireOptions.G),
-            Wire("Red", WireOptions._12V, "(on CR1000X)"),
-            Wire("Grey", WireOptions.C5),
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Blue", WireOptions.G),
+                Wire("Red", WireOptions._12V, "(on CR1000X)"),
+                Wire("Grey", WireOptions.C5),
+            ),
+            variables=[
+                Variable("Transducer(3)", var_type=VarType.PUBLIC),
+                Variable("Transducer(1)", VarType.ALIAS, value="well_lvl", units="m"),
+                Variable(
+                    "Transducer(2)", VarType.ALIAS, value="well_tmp", units="deg C"
+                ),
+                Variable("Transducer(3)", VarType.ALIAS, value="well_status"),
+            ],
         )
 
-        self.variables = [
-            Variable("Transducer(3)", var_type=VarType.PUBLIC),
-            Variable("Transducer(1)", VarType.ALIAS, value="well_lvl", units="m"),
-            Variable("Transducer(2)", VarType.ALIAS, value="well_tmp", units="deg C"),
-            Variable("Transducer(3)", VarType.ALIAS, value="well_status"),
-        ]
-        super().__post_init__()
-
     @property
     def tables(self) -> list[Table]:
         return [
@@ -1310,7 +1481,7 @@ class OTT_PLS500(Instrument):
             "Transducer",
             Scan(1, "Min", 0, 0),
             functions.SDI12Recorder(
-                str(self.variables["Transducer(3)"]).replace("(3)", ""),
+                self.variables["Transducer(3)"].array_name,
                 self.wires["Grey"],
                 self.sdi12_address,
                 "M!",
@@ -1330,32 +1501,40 @@ class OTT_Pluvio(Instrument):
     is_sdi12: bool = True
     _id: str = "ott_pluvio"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Black", None, "DC Converter black (out) (#1 not used)"),
-            Wire("Green", WireOptions.C5, "SDI-12 data SDI_ADD: 2"),
-            Wire("White", WireOptions.G, "Data Ground"),
-            Wire("Red", None, "24V DC Converter Out (Yellow)"),
-            Wire("Yellow", WireOptions._12V, "12v Power"),
-            Wire("Brown", WireOptions.G, "Power Ground"),
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Black", None, "DC Converter black (out) (#1 not used)"),
+                Wire("Green", WireOptions.C5, "SDI-12 data SDI_ADD: 2"),
+                Wire("White", WireOptions.G, "Data Ground"),
+                Wire("Red", None, "24V DC Converter Out (Yellow)"),
+                Wire("Yellow", WireOptions._12V, "12v Power"),
+                Wire("Brown", WireOptions.G, "Power Ground"),
+            ),
+            variables=[
+                Variable("Pluvio(9)", VarType.PUBLIC),
+                Variable(
+                    "Pluvio(1)", VarType.ALIAS, value="ppt_max_rate", units="mm hr-1"
+                ),
+                Variable("Pluvio(2)", VarType.ALIAS, value="ppt", units="mm"),
+                Variable("Pluvio(3)", VarType.ALIAS, value="pluv_accuNRT", units="mm"),
+                Variable(
+                    "Pluvio(4)", VarType.ALIAS, value="pluv_accuTtlNRT", units="mm"
+                ),
+                Variable("Pluvio(5)", VarType.ALIAS, value="pluv_fill", units="mm"),
+                Variable(
+                    "Pluvio(6)", VarType.ALIAS, value="pluv_bucketNRT", units="mm"
+                ),
+                Variable("Pluvio(7)", VarType.ALIAS, value="pluv_temp", units="deg C"),
+                Variable("Pluvio(8)", VarType.ALIAS, value="pluv_heater", units="code"),
+                Variable(
+                    "Pluvio(9)", VarType.ALIAS, value="pluv_gagestat", units="code"
+                ),
+                Variable("pluv_flag", VarType.PUBLIC, value=1),
+            ],
         )
 
-        self.variables = [
-            Variable("Pluvio(9)", VarType.PUBLIC),
-            Variable("Pluvio(1)", VarType.ALIAS, value="ppt_max_rate", units="mm hr-1"),
-            Variable("Pluvio(2)", VarType.ALIAS, value="ppt", units="mm"),
-            Variable("Pluvio(3)", VarType.ALIAS, value="pluv_accuNRT", units="mm"),
-            Variable("Pluvio(4)", VarType.ALIAS, value="pluv_accuTtlNRT", units="mm"),
-            Variable("Pluvio(5)", VarType.ALIAS, value="pluv_fill", units="mm"),
-            Variable("Pluvio(6)", VarType.ALIAS, value="pluv_bucketNRT", units="mm"),
-            Variable("Pluvio(7)", VarType.ALIAS, value="pluv_temp", units="deg C"),
-            Variable("Pluvio(8)", VarType.ALIAS, value="pluv_heater", units="code"),
-            Variable("Pluvio(9)", VarType.ALIAS, value="pluv_gagestat", units="code"),
-            Variable("pluv_flag", VarType.PUBLIC, value=1),
-        ]
-
-        return super().__post_init__()
-
     @property
     def tables(self) -> list[Table]:
         return [
@@ -1401,20 +1580,18 @@ class OTT_Pluvio(Instrument):
         return SlowSequence(
             "pluvio",
             Scan(1, "Min", 0, 0),
-            logic="\n".join(
-                [
-                    functions.SDI12Recorder(
-                        self.variables["Pluvio(9)"].name.replace("9", ""),
-                        self.wires["Green"],
-                        self.sdi12_address,
-                        "C!",
-                        1,
-                        0 - 1,
-                        1,
-                    ),
-                    f"{self.variables['pluv_flag']} = 0",
-                ]
-            ),
+            logic=[
+                functions.SDI12Recorder(
+                    self.variables["Pluvio(9)"].element(""),
+                    self.wires["Green"],
+                    self.sdi12_address,
+                    "C!",
+                    1,
+                    0 - 1,
+                    1,
+                ),
+                f"{self.variables['pluv_flag']} = 0",
+            ],
         )
 
 
@@ -1425,55 +1602,48 @@ class Sierra_RV50X(Instrument):
     type = "Modem"
     _id = "sierra_rv50x"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("Black", WireOptions.G),
-            Wire("Red", WireOptions._12V, "(On CR1000X)"),
-            Wire("White", WireOptions.SW12_2),
-        )
-
-        self.variables = [Variable("Modem_Power", VarType.PUBLIC, DataType.BOOLEAN)]
-        self.dependencies = Dependencies(
-            self,
-            Dependency("batt_volt", "Variable measuring the current battery voltage."),
-            Dependency(
-                "shutoff_voltage",
-                "A variable storing the voltage at which the camera should shut off for battery savings.",
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("Black", WireOptions.G),
+                Wire("Red", WireOptions._12V, "(On CR1000X)"),
+                Wire("White", WireOptions.SW12_2),
             ),
+            variables=[Variable("Modem_Power", VarType.PUBLIC, DataType.BOOLEAN)],
+            dependencies=[
+                Dependency(
+                    "batt_volt", "Variable measuring the current battery voltage."
+                ),
+                Dependency(
+                    "shutoff_voltage",
+                    "A variable storing the voltage at which the camera should shut off for battery savings.",
+                ),
+            ],
         )
 
-        return super().__post_init__()
-
     @property
     def pre_scan(self) -> str:
         return f"{self.variables['Modem_Power']} = True"
 
     @property
-    def program(self) -> str:
-        return "\n".join(
-            [
-                str(
-                    If(
-                        functions.TimeIsBetween(2, 3, 1440, "min"),
-                        logic=f"{self.variables['Modem_Power']} = False",
-                    ).Else(f"{self.variables['Modem_Power']} = True")
-                ),
-                str(
-                    If(
-                        self.dependencies["batt_volt"].name,
-                        "<",
-                        self.dependencies["shutoff_voltage"].name,
-                        logic=str(
-                            If(
-                                functions.TimeIsBetween(1, 4, 240, "min"),
-                                logic=f"{self.variables['Modem_Power']} = True",
-                            ).Else(f"{self.variables['Modem_Power']} = False")
-                        ),
-                    )
-                ),
-                functions.SW12(self.wires["White"], self.variables["Modem_Power"]),
-            ]
-        )
+    def program(self) -> ir.Code:
+        return [
+            If(
+                functions.TimeIsBetween(2, 3, 1440, "min"),
+                logic=f"{self.variables['Modem_Power']} = False",
+            ).Else(f"{self.variables['Modem_Power']} = True"),
+            If(
+                self.dependencies["batt_volt"],
+                "<",
+                self.dependencies["shutoff_voltage"],
+                logic=If(
+                    functions.TimeIsBetween(1, 4, 240, "min"),
+                    logic=f"{self.variables['Modem_Power']} = True",
+                ).Else(f"{self.variables['Modem_Power']} = False"),
+            ),
+            functions.SW12(self.wires["White"], self.variables["Modem_Power"]),
+        ]
 
 
 @dataclass
@@ -1484,73 +1654,74 @@ class Campbell_SnowVue10(Instrument):
     is_sdi12: bool = True
     _id: str = "campbell_snowvue10"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("White", WireOptions.C1, "SDI-12 data SDI_ADD: 1"),
-            Wire("Brown", WireOptions._12V, "Fuse Block 0.5A fuse power"),
-            Wire("Black", WireOptions.G, "Power Ground"),
-            Wire("Clear", WireOptions.AG),
-        )
-
-        self.variables = [
-            Variable(
-                "SnowVUE_Go", VarType.PUBLIC, DataType.BOOLEAN
-            ),  # When true, runs the SnowVUE10 measurement cycle
-            Variable(
-                "Set_D2G", VarType.PUBLIC, DataType.BOOLEAN
-            ),  # When true, sets the SnowVUE10 distance to ground
-            Variable("SnowVUE(2)", VarType.PUBLIC),  # General SnowVUE variable
-            Variable("Dist2Gnd", VarType.PUBLIC, units="m"),  # Distance to ground
-            Variable(
-                "SnowVUE(1)", VarType.ALIAS, value="Dist2Targ", units="m"
-            ),  # Distance from the SnowVUE10 to target
-            Variable(
-                "TCDT", VarType.PUBLIC, units="m"
-            ),  # Final temperature-corrected distance
-            Variable("snow_depth", VarType.PUBLIC, units="cm"),  # Snow depth
-            Variable(
-                "snow_min", VarType.PUBLIC, units="cm"
-            ),  # Used to store snow_depth < 0
-            Variable(
-                "SnowVUE(2)", VarType.ALIAS, value="snow_depth_q"
-            ),  # Measurement quality number
-            Variable(
-                "FH", VarType.DIM, DataType.LONG
-            ),  # File Handle to use to set distance to ground
-            Variable("dummystr", VarType.DIM, DataType.STRING),  # Dummy string variable
-            Variable("SnowVUE_Meta(8)", VarType.PUBLIC),  # Metadata calls
-            Variable(
-                "SnowVUE_Meta(2)", VarType.ALIAS, value="IntTemp", units="deg C"
-            ),  # Temperature inside sensor housing
-            Variable(
-                "SnowVUE_Meta(3)", VarType.ALIAS, value="IntRH", units="%"
-            ),  # Relative Humidity inside sensor housing
-            Variable(
-                "SnowVUE_Meta(4)", VarType.ALIAS, value="Pitch", units="deg"
-            ),  # Tilt (degrees) front to back
-            Variable(
-                "SnowVUE_Meta(5)", VarType.ALIAS, value="Roll", units="deg"
-            ),  # Tilt (degrees) side to side
-            Variable(
-                "SnowVUE_Meta(6)", VarType.ALIAS, value="SupVolt", units="v"
-            ),  # Voltage of supply from power source
-            Variable(
-                "SnowVUE_Meta(7)", VarType.ALIAS, value="ResFreq", units="kHz"
-            ),  # Resonate Frequency of Transducer
-            Variable(
-                "SnowVUE_Meta(8)", VarType.ALIAS, value="Alert", units="unitless"
-            ),  # Alert flag if ResFreq is out of tolerance
-        ]
-
-        self.dependencies = Dependencies(
-            self,
-            Dependency(
-                "air_temp", "Air temperature to correct distance to ground measurement."
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("White", WireOptions.C1, "SDI-12 data SDI_ADD: 1"),
+                Wire("Brown", WireOptions._12V, "Fuse Block 0.5A fuse power"),
+                Wire("Black", WireOptions.G, "Power Ground"),
+                Wire("Clear", WireOptions.AG),
             ),
+            variables=[
+                Variable(
+                    "SnowVUE_Go", VarType.PUBLIC, DataType.BOOLEAN
+                ),  # When true, runs the SnowVUE10 measurement cycle
+                Variable(
+                    "Set_D2G", VarType.PUBLIC, DataType.BOOLEAN
+                ),  # When true, sets the SnowVUE10 distance to ground
+                Variable("SnowVUE(2)", VarType.PUBLIC),  # General SnowVUE variable
+                Variable("Dist2Gnd", VarType.PUBLIC, units="m"),  # Distance to ground
+                Variable(
+                    "SnowVUE(1)", VarType.ALIAS, value="Dist2Targ", units="m"
+                ),  # Distance from the SnowVUE10 to target
+                Variable(
+                    "TCDT", VarType.PUBLIC, units="m"
+                ),  # Final temperature-corrected distance
+                Variable("snow_depth", VarType.PUBLIC, units="cm"),  # Snow depth
+                Variable(
+                    "snow_min", VarType.PUBLIC, units="cm"
+                ),  # Used to store snow_depth < 0
+                Variable(
+                    "SnowVUE(2)", VarType.ALIAS, value="snow_depth_q"
+                ),  # Measurement quality number
+                Variable(
+                    "FH", VarType.DIM, DataType.LONG
+                ),  # File Handle to use to set distance to ground
+                Variable(
+                    "dummystr", VarType.DIM, DataType.STRING
+                ),  # Dummy string variable
+                Variable("SnowVUE_Meta(8)", VarType.PUBLIC),  # Metadata calls
+                Variable(
+                    "SnowVUE_Meta(2)", VarType.ALIAS, value="IntTemp", units="deg C"
+                ),  # Temperature inside sensor housing
+                Variable(
+                    "SnowVUE_Meta(3)", VarType.ALIAS, value="IntRH", units="%"
+                ),  # Relative Humidity inside sensor housing
+                Variable(
+                    "SnowVUE_Meta(4)", VarType.ALIAS, value="Pitch", units="deg"
+                ),  # Tilt (degrees) front to back
+                Variable(
+                    "SnowVUE_Meta(5)", VarType.ALIAS, value="Roll", units="deg"
+                ),  # Tilt (degrees) side to side
+                Variable(
+                    "SnowVUE_Meta(6)", VarType.ALIAS, value="SupVolt", units="v"
+                ),  # Voltage of supply from power source
+                Variable(
+                    "SnowVUE_Meta(7)", VarType.ALIAS, value="ResFreq", units="kHz"
+                ),  # Resonate Frequency of Transducer
+                Variable(
+                    "SnowVUE_Meta(8)", VarType.ALIAS, value="Alert", units="unitless"
+                ),  # Alert flag if ResFreq is out of tolerance
+            ],
+            dependencies=[
+                Dependency(
+                    "air_temp",
+                    "Air temperature to correct distance to ground measurement.",
+                )
+            ],
         )
 
-        return super().__post_init__()
-
     @property
     def tables(self) -> list[Table]:
         return [
@@ -1583,127 +1754,99 @@ class Campbell_SnowVue10(Instrument):
         ]
 
     @property
-    def pre_scan(self) -> str:
-        return "\n".join(
-            [
-                str(
-                    If(
-                        functions.FileSize("USR:Dist2Gnd.txt"),
-                        ">",
-                        0,
-                        logic="\n".join(
-                            [
-                                f"{self.variables['FH']} = {functions.FileOpen('USR:Dist2Gnd.txt', 'r', 0)}",
-                                functions.FileRead(
-                                    self.variables["FH"], self.variables["dummystr"], 10
-                                ),
-                                functions.SplitStr(
-                                    self.variables["Dist2Gnd"],
-                                    self.variables["dummystr"],
-                                    "",
-                                    1,
-                                    0,
-                                ),
-                                functions.FileClose(self.variables["FH"]),
-                            ]
-                        ),
-                    ).Else(f"{self.variables['Dist2Gnd']} = 1.9")
-                )
-            ]
-        )
-
-    @property
-    def program(self) -> str:
-        return "\n".join(
-            [
-                str(
-                    If(
-                        functions.IfTime(237, 300, "Sec"),
-                        logic=f"{self.variables['SnowVUE_Go']} = True",
-                    )
+    def pre_scan(self) -> ir.Code:
+        return If(
+            functions.FileSize("USR:Dist2Gnd.txt"),
+            ">",
+            0,
+            logic=[
+                f"{self.variables['FH']} = {functions.FileOpen('USR:Dist2Gnd.txt', 'r', 0)}",
+                functions.FileRead(
+                    self.variables["FH"], self.variables["dummystr"], 10
                 ),
-                str(
-                    If(
-                        self.variables["Set_D2G"],
-                        logic=f"{self.variables['SnowVUE_Go']} = True",
-                    )
+                functions.SplitStr(
+                    self.variables["Dist2Gnd"],
+                    self.variables["dummystr"],
+                    "",
+                    1,
+                    0,
                 ),
-            ]
-        )
+                functions.FileClose(self.variables["FH"]),
+            ],
+        ).Else(f"{self.variables['Dist2Gnd']} = 1.9")
+
+    @property
+    def program(self) -> ir.Code:
+        return [
+            If(
+                functions.IfTime(237, 300, "Sec"),
+                logic=f"{self.variables['SnowVUE_Go']} = True",
+            ),
+            If(
+                self.variables["Set_D2G"],
+                logic=f"{self.variables['SnowVUE_Go']} = True",
+            ),
+        ]
 
     @property
     def slow_sequence(self) -> SlowSequence:
         return SlowSequence(
             "Snow",
             Scan(1, "Min", 0, 0),
-            logic="\n".join(
-                [
-                    str(
-                        If(
-                            self.variables["SnowVUE_Go"],
-                            logic="\n".join(
-                                [
-                                    functions.SDI12Recorder(
-                                        self.variables["SnowVUE(2)"].name.replace(
-                                            "2", ""
-                                        ),
-                                        self.wires["White"],
-                                        self.sdi12_address,
-                                        "M1!",
-                                        1,
-                                        0,
-                                        -1,
-                                    ),
-                                    functions.SDI12Recorder(
-                                        self.variables["SnowVUE_Meta(8)"].name.replace(
-                                            "8", ""
-                                        ),
-                                        self.wires["White"],
-                                        self.sdi12_address,
-                                        "M9!",
-                                        1,
-                                        0,
-                                        -1,
-                                    ),
-                                ]
-                            ),
-                        )
-                    ),
-                    f"{self.variables['SnowVUE_Go']} = False",
-                    f"{self.variables['TCDT']} = {self.variables['Dist2Targ']}*{functions.Sqr(f'({self.dependencies["air_temp"].name}+273.15)/273.15')}",
-                    f"{self.variables['snow_depth']} = ({self.variables['Dist2Gnd']} - {self.variables['TCDT']}) * 100",
-                    str(
-                        If(
-                            self.variables["snow_depth"],
-                            "<",
-                            "0",
-                            logic=[
-                                f"{self.variables['snow_min']} = {self.variables['snow_depth']}",
-                                f"{self.variables['snow_depth']} = 0",
-                            ],
-                        )
-                    ),
-                    str(
-                        If(
-                            self.variables["Set_D2G"],
-                            logic=[
-                                f"{self.variables['Dist2Gnd']} = {self.variables['TCDT']}",
-                                f"{self.variables['FH']} = {functions.FileOpen('USR:Dist2Gnd.txt', 'w', 0)}",
-                                functions.Sprintf(
-                                    self.variables["dummystr"],
-                                    r"%f",
-                                    self.variables["Dist2Gnd"],
-                                ),
-                                functions.FileWrite(
-                                    self.variables["FH"], self.variables["dummystr"], 0
-                                ),
-                                functions.FileClose(self.variables["FH"]),
-                                f"{self.variables['Set_D2G']} = False",
-                            ],
-                        )
-                    ),
-                ]
-            ),
+            logic=[
+                If(
+                    self.variables["SnowVUE_Go"],
+                    logic=[
+                        functions.SDI12Recorder(
+                            self.variables["SnowVUE(2)"].element(""),
+                            self.wires["White"],
+                            self.sdi12_address,
+                            "M1!",
+                            1,
+                            0,
+                            -1,
+                        ),
+                        functions.SDI12Recorder(
+                            self.variables["SnowVUE_Meta(8)"].element(""),
+                            self.wires["White"],
+                            self.sdi12_address,
+                            "M9!",
+                            1,
+                            0,
+                            -1,
+                        ),
+                    ],
+                ),
+                f"{self.variables['SnowVUE_Go']} = False",
+                f"{self.variables['TCDT']} = {self.variables['Dist2Targ']}*{functions.Sqr(f'({self.dependencies["air_temp"]}+273.15)/273.15')}",
+                f"{self.variables['snow_depth']} = ({self.variables['Dist2Gnd']} - {self.variables['TCDT']}) * 100",
+                If(
+                    self.variables["snow_depth"],
+                    "<",
+                    "0",
+                    logic=[
+                        f"{self.variables['snow_min']} = {self.variables['snow_depth']}",
+                        f"{self.variables['snow_depth']} = 0",
+                    ],
+                ),
+                If(
+                    self.variables["Set_D2G"],
+                    logic=[
+                        f"{self.variables['Dist2Gnd']} = {self.variables['TCDT']}",
+                        f"{self.variables['FH']} = {functions.FileOpen('USR:Dist2Gnd.txt', 'w', 0)}",
+                        functions.Sprintf(
+                            self.variables["dummystr"],
+                            r"%f",
+                            self.variables["Dist2Gnd"],
+                        ),
+                        functions.FileWrite(
+                            self.variables["FH"], self.variables["dummystr"], 0
+                        ),
+                        functions.FileClose(self.variables["FH"]),
+                        f"{self.variables['Set_D2G']} = False",
+                    ],
+                ),
+            ],
         )
 
 
@@ -1714,29 +1857,28 @@ class Apogee_SP510(Instrument):
     type: str = "Pyranometer"
     _id: str = "apogee_sp510"
 
-    def __post_init__(self):
-        self.wires = WiringDiagram(
-            Wire("White", WireOptions.DIFF_2_H, "Signal Positive"),
-            Wire("Black", WireOptions.DIFF_2_L, "Signal Negative"),
-            Wire("Clear", WireOptions.AG, "Shield Ground"),
-            Wire("Yellow", WireOptions._12V, "Fuse block 0.5A fuse heater"),
-            Wire("Blue", WireOptions.G, "Power ground for heater"),
-        )
-
-        self.variables = [
-            Variable("sol_rad", VarType.PUBLIC, units="W m-2"),
-            Variable("sol_min", VarType.PUBLIC, units="W m-2"),
-            Variable("pyran_calib", VarType.PUBLIC),
-        ]
-
-        self.dependencies = Dependencies(
-            self,
-            Dependency(
-                "pyran_calib",
-                "Pyranometer calibration coefficient to correct radiation value.",
+    @classmethod
+    def define(cls, sdi12_address: str | None) -> Definition:
+        return Definition(
+            wires=WiringDiagram(
+                Wire("White", WireOptions.DIFF_2_H, "Signal Positive"),
+                Wire("Black", WireOptions.DIFF_2_L, "Signal Negative"),
+                Wire("Clear", WireOptions.AG, "Shield Ground"),
+                Wire("Yellow", WireOptions._12V, "Fuse block 0.5A fuse heater"),
+                Wire("Blue", WireOptions.G, "Power ground for heater"),
             ),
+            variables=[
+                Variable("sol_rad", VarType.PUBLIC, units="W m-2"),
+                Variable("sol_min", VarType.PUBLIC, units="W m-2"),
+                Variable("pyran_calib", VarType.PUBLIC),
+            ],
+            dependencies=[
+                Dependency(
+                    "pyran_calib",
+                    "Pyranometer calibration coefficient to correct radiation value.",
+                )
+            ],
         )
-        return super().__post_init__()
 
     @property
     def tables(self) -> list[Table]:
@@ -1779,31 +1921,29 @@ class Apogee_SP510(Instrument):
         return f"{self.variables['pyran_calib']} = {self.dependencies['pyran_calib'].value}"
 
     @property
-    def program(self) -> str:
-        return "\n".join(
-            [
-                functions.VoltDiff(
-                    self.variables["sol_rad"],
-                    1,
-                    "mv200",
-                    self.wires["White"],
-                    True,
-                    0,
-                    "60",
-                    self.variables["pyran_calib"],
-                    0,
-                ),
-                If(
-                    self.variables["sol_rad"],
-                    "<",
-                    0,
-                    logic=[
-                        f"{self.variables['sol_min']} = {self.variables['sol_rad']}",
-                        f"{self.variables['sol_rad']} = 0",
-                    ],
-                ),
-            ]
-        )
+    def program(self) -> ir.Code:
+        return [
+            functions.VoltDiff(
+                self.variables["sol_rad"],
+                1,
+                "mv200",
+                self.wires["White"],
+                True,
+                0,
+                "60",
+                self.variables["pyran_calib"],
+                0,
+            ),
+            If(
+                self.variables["sol_rad"],
+                "<",
+                0,
+                logic=[
+                    f"{self.variables['sol_min']} = {self.variables['sol_rad']}",
+                    f"{self.variables['sol_rad']} = 0",
+                ],
+            ),
+        ]
 
 
 INSTRUMENTS = {
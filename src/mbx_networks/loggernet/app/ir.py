@@ -0,0 +1,164 @@
+"""Intermediate representation for CRBasic code.
+
+Instruments and the ``operators`` builders describe code as a tree of nodes
+rather than pre-formatted strings. Merging code from several instruments is
+then a matter of appending nodes, and ``render`` prints a tree, indentation
+included, in a single pass.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Union
+
+INDENT = "    "
+
+
+@dataclass
+class Statement:
+    """A single line of CRBasic, typically an instruction call or assignment."""
+
+    text: str
+
+
+@dataclass
+class Call:
+    name: str
+    args: tuple[Any, ...] = ()
+
+    def __str__(self) -> str:
+        return f"{self.name}({','.join(str(x) for x in self.args)})"
+
+
+@dataclass
+class Declaration:
+    variable: Any
+
+    def __str__(self) -> str:
+        return self.variable.declaration_str()
+
+
+@dataclass
+class Block:
+    body: list[Node] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.body)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.body)
+
+    def __add__(self, other: Block) -> Block:
+        return Block([*self.body, *other.body])
+
+    def append(self, node: Node) -> None:
+        self.body.append(node)
+
+    def extend(self, other: Block) -> None:
+        self.body.extend(other.body)
+
+
+@dataclass
+class If:
+    condition: str
+    body: Block
+    else_ifs: list[tuple[str, Block]] = field(default_factory=list)
+    orelse: Block | None = None
+
+
+@dataclass
+class For:
+    var: str
+    start: str
+    end: str
+    body: Block
+    step: str | None = None
+
+
+@dataclass
+class DataTable:
+    name: str
+    trig_var: str
+    size: int
+    settings: list[Call]
+    items: list[Statement]
+
+
+@dataclass
+class SlowSequence:
+    id: str
+    scan: Call
+    body: Block
+
+
+Node = Union[Statement, Call, Declaration, Block, If, For, DataTable, SlowSequence]
+# Anything `as_block` accepts: nodes, strings, objects with a `to_ir` method
+# (such as `operators.If`) and lists of those.
+Code = Union[Node, str, list, None]
+
+
+def as_block(code: Code) -> Block:
+    if not code:
+        return Block()
+    if isinstance(code, Block):
+        return code
+    if isinstance(code, (list, tuple)):
+        block = Block()
+        for x in code:
+            block.extend(as_block(x))
+        return block
+    if isinstance(
+        code, (Statement, Call, Declaration, If, For, DataTable, SlowSequence)
+    ):
+        return Block([code])
+    if hasattr(code, "to_ir"):
+        return Block([code.to_ir()])
+    return Block([Statement(x) for x in str(code).split("\n")])
+
+
+def iter_lines(node: Node, depth: int = 0) -> Iterator[str]:
+    pad = INDENT * depth
+
+    match node:
+        case Statement(text=text):
+            # Like textwrap.indent, whitespace only lines are left alone.
+            yield f"{pad}{text}" if text.strip() else text
+        case Call() | Declaration():
+            yield f"{pad}{node}"
+        case Block(body=body):
+            for x in body:
+                yield from iter_lines(x, depth)
+        case If():
+            yield f"{pad}If {node.condition} Then"
+            yield from iter_lines(node.body, depth + 1)
+            for condition, body in node.else_ifs:
+                yield f"{pad}ElseIf {condition} Then"
+                yield from iter_lines(body, depth + 1)
+            if node.orelse is not None:
+                yield f"{pad}Else"
+                yield from iter_lines(node.orelse, depth + 1)
+            yield f"{pad}EndIf"
+        case For():
+            step = f" Step {node.step}" if node.step else ""
+            yield f"{pad}For {node.var}={node.start} To {node.end}{step}"
+            yield from iter_lines(node.body, depth + 1)
+            yield f"{pad}Next {node.var}"
+        case DataTable():
+            yield f"{pad}DataTable({node.name},{node.trig_var},{node.size})"
+            for x in node.settings:
+                yield from iter_lines(x, depth + 1)
+            yield ""
+            for x in node.items:
+                yield from iter_lines(x, depth + 1)
+            yield f"{pad}EndTable"
+        case SlowSequence():
+            yield f"{pad}SlowSequence '{node.id}"
+            yield from iter_lines(node.scan, depth)
+            yield from iter_lines(node.body, depth + 1)
+            yield f"{pad}NextScan"
+        case _:
+            raise TypeError(f"Can't render {type(node).__name__} as CRBasic.")
+
+
+def render(code: Code, depth: int = 0) -> str:
+    return "\n".join(iter_lines(as_block(code), depth))
@@ -1,16 +1,64 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Query, Path, Body
-from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from fastapi import (
+    FastAPI,
+    File,
+    UploadFile,
+    HTTPException,
+    Query,
+    Path,
+    Body,
+    Request,
+)
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
-import subprocess
-import os
-import io
+from starlette.background import BackgroundTask
+import asyncio
+import contextlib
+import json
+import re
+import zipfile
 from app import schemas
-from app.instruments import INSTRUMENTS
+from app.builds import BuildPool, BuildPoolFull
+from app.compiler import (
+    CompileCache,
+    CompilePoolFull,
+    CompileResult,
+    StagedProgram,
+    compiler_version,
+    make_pool,
+    stage_upload,
+    zip_members,
+)
+from app.catalog import InstrumentCatalog
+from app.functions import function_def
+from app.graph import DependencyError
+from app.instruments import INSTRUMENTS, Instrument
 from app.program import Program, elev_sdi12_rename
+from app.symbols import DuplicateNameError
+from app.zipstream import ZipStream
 import datetime as dt
-from typing import Annotated
+from typing import Annotated, Any, Coroutine, Iterator, TypeVar
 
-app = FastAPI()
+T = TypeVar("T")
+ZIP_CONTENT_TYPES = ("application/zip", "application/x-zip-compressed")
+UNSAFE_PATH_CHARS = re.compile(r"[^\w.-]")
+COMPILE_CACHE = CompileCache()
+COMPILE_POOL = make_pool()
+BUILD_POOL = BuildPool()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.catalog = InstrumentCatalog()
+    # Hashes the compiler executable, do it before the first upload waits on it.
+    await asyncio.to_thread(compiler_version)
+    await COMPILE_POOL.start()
+    await BUILD_POOL.start()
+    yield
+    await BUILD_POOL.close()
+    await COMPILE_POOL.close()
+
+
+app = FastAPI(lifespan=lifespan)
 app.mount("/static", StaticFiles(directory="/app/app/static"), name="static")
 
 # @app.get("/test")
@@ -19,59 +67,158 @@ app.mount("/static", StaticFiles(directory="/app/app/static"), name="static")
 
 
 @app.post("/compile")
-async def check_compile(file: UploadFile = File(...)):
-    # Save the uploaded file temporarily
-    temp_file_path = f"/home/wine/{file.filename}"
-    try:
-        with open(temp_file_path, "wb") as temp_file:
-            temp_file.write(await file.read())
+async def check_compile(request: Request, file: UploadFile = File(...)):
+    async with stage_upload(file) as staged:
+        if (result := COMPILE_CACHE.get(staged)) is not None:
+            return compile_response(result, cache_status="hit")
 
-        # Use subprocess to run the `check_compile` command
         try:
-            output = subprocess.check_output(
-                ["check_compile", temp_file_path],
-                stderr=subprocess.STDOUT,
-                text=True,
-                cwd="/home/wine",
+            result = await cancel_on_disconnect(
+                request, COMPILE_POOL.compile(staged.path)
+            )
+        except CompilePoolFull as e:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Compile queue is full, try again later. {e}",
+                headers={"Retry-After": "5"},
             )
-            if "Compiled in" in output:
-                return JSONResponse(
-                    content={"message": "Compilation succeeded", "output": output},
-                    status_code=200,
+        if result is None:
+            # The client went away, there is nobody left to answer.
+            return Response(status_code=499)
+
+        COMPILE_CACHE.put(staged, result)
+        return compile_response(result, cache_status="miss")
+
+
+@app.get("/compile/cache")
+async def compile_cache_stats():
+    return COMPILE_CACHE.stats()
+
+
+@app.get("/compile/pool")
+async def compile_pool_stats():
+    return COMPILE_POOL.stats()
+
+
+@app.post("/compile/batch")
+async def check_compile_batch(files: list[UploadFile] = File(...)):
+    uploads = []
+    for file in files:
+        if is_zip(file):
+            try:
+                uploads.extend(zip_members(file.file))
+            except zipfile.BadZipFile:
+                raise HTTPException(
+                    status_code=400, detail=f"{file.filename} is not a valid zip file."
                 )
+        else:
+            uploads.append(file)
+
+    # Stage everything up front, the uploaded files are closed once this returns.
+    stack = contextlib.AsyncExitStack()
+    try:
+        staged = [
+            (upload.filename, await stack.enter_async_context(stage_upload(upload)))
+            for upload in uploads
+        ]
+    except BaseException:
+        await stack.aclose()
+        raise
+
+    # Don't let a single batch fill the shared queue and starve /compile.
+    limit = asyncio.Semaphore(COMPILE_POOL.concurrency)
+
+    async def compile_one(name: str, program: StagedProgram) -> dict[str, str]:
+        if (result := COMPILE_CACHE.get(program)) is not None:
+            return batch_result(name, result, cache_status="hit")
+        async with limit:
+            try:
+                result = await COMPILE_POOL.compile(program.path)
+            except CompilePoolFull as e:
+                return {"file": name, "status": "rejected", "error": str(e)}
+        COMPILE_CACHE.put(program, result)
+        return batch_result(name, result, cache_status="miss")
+
+    async def results():
+        tasks = [asyncio.ensure_future(compile_one(*x)) for x in staged]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield json.dumps(await task) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await stack.aclose()
+
+    return StreamingResponse(
+        results(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(stack.aclose),
+    )
+
+
+def is_zip(file: UploadFile) -> bool:
+    return file.content_type in ZIP_CONTENT_TYPES or (
+        file.filename or ""
+    ).lower().endswith(".zip")
+
+
+def batch_result(name: str, result: CompileResult, cache_status: str) -> dict[str, str]:
+    return {
+        "file": name,
+        "status": result.status,
+        "cache": cache_status,
+        **result.to_json(),
+    }
 
-            return JSONResponse(
-                content={"message": "Compilation failed", "details": output},
-                status_code=400,
-            )
-        except subprocess.CalledProcessError as e:
-            # Handle errors from the command
-            return JSONResponse(
-                content={"error": "Compilation check failed", "details": e.output},
-                status_code=400,
-            )
 
-    finally:
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+async def cancel_on_disconnect(
+    request: Request, coro: Coroutine[Any, Any, T], poll: float = 0.5
+) -> T | None:
+    task = asyncio.ensure_future(coro)
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=poll)
+        if done:
+            return task.result()
+        if await request.is_disconnected():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            return None
+
+
+def compile_response(result: CompileResult, cache_status: str) -> JSONResponse:
+    return JSONResponse(
+        content=result.to_json(),
+        status_code=result.status_code,
+        headers={"X-Compile-Cache": cache_status},
+    )
 
 
 @app.get("/instruments")
-async def get_instruments(q: Annotated[schemas.NamesOnly, Query()]):
+async def get_instruments(request: Request, q: Annotated[schemas.NamesOnly, Query()]):
+    catalog: InstrumentCatalog = request.app.state.catalog
     if q.names_only:
-        return {"instruments": list(INSTRUMENTS.keys())}
-    instances = {}
-    for _, instrument in INSTRUMENTS.items():
-        instances[instrument._id] = instrument(elevation=1, sdi12_address=1).to_json()
-    return instances
+        return catalog.names.response(request)
+    return catalog.all.response(request)
 
 
 @app.get("/instruments/{instrument}")
-async def get_instrument(instrument: Annotated[schemas.ValidInstruments, Path]):
-    instance = INSTRUMENTS[instrument.value](elevation=1, sdi12_address=1)
+async def get_instrument(
+    request: Request, instrument: Annotated[schemas.ValidInstruments, Path]
+):
+    catalog: InstrumentCatalog = request.app.state.catalog
+    return catalog.instruments[instrument.value].response(request)
+
+
+@app.get("/functions/{name}")
+async def get_function(name: Annotated[schemas.ValidFunctions, Path]):
+    return function_def(name.value).to_json()
 
-    out = instance.to_json()
-    return out
+
+@app.get("/functions/{name}/doc")
+async def get_function_doc(name: Annotated[schemas.ValidFunctions, Path]):
+    return {"name": name.value, "doc": function_def(name.value).doc}
 
 
 # my_sensors = [
@@ -88,19 +235,9 @@ async def get_instrument(instrument: Annotated[schemas.ValidInstruments, Path]):
 # )
 
 
-def find_instrument(
-    target: str, instruments: list[schemas.ProgramInstruments]
-) -> schemas.ProgramInstruments | None:
-    for instrument in instruments:
-        if instrument._id == target:
-            return instrument
-    return None
-
-
-@app.post("/program")
-async def build_program(
-    instruments: Annotated[list[schemas.ProgramInstruments], Body()],
-):
+def make_program(
+    instruments: list[schemas.ProgramInstruments], filename: str
+) -> Program:
     program_instruments = []
     for instrument in instruments:
         instance = INSTRUMENTS[instrument.name](
@@ -115,41 +252,181 @@ async def build_program(
             for wire in instance.wires.args:
                 user_def_wiring = instrument.wiring[wire.wire]
                 wire.port = user_def_wiring
+            instance.invalidate()
 
         program_instruments.append(instance)
 
-    for instrument in instruments:
+    # The first instrument with each id provides its variables to the others.
+    by_id: dict[str, Instrument] = {}
+    for instance in program_instruments:
+        by_id.setdefault(instance._id, instance)
+
+    for instrument, instance in zip(instruments, program_instruments):
         if not instrument.dependencies:
             continue
         for dep, meta in instrument.dependencies.items():
-            # Find the instances of instrument that will populate the program
-            program_instrument = find_instrument(instrument.name, program_instruments)
-            target = find_instrument(meta["_id"], program_instruments)
-            if target is None:
+            if "_id" not in meta or "variable" not in meta:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Dependency {dep} of {instrument.name} needs an _id and a variable",
+                )
+            if (target := by_id.get(meta["_id"])) is None:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Could not find dependency {meta['_id']} for {instrument.name}",
                 )
+            if (the_dep := target.variables.get(meta["variable"])) is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{meta['_id']} has no variable {meta['variable']} for {instrument.name}",
+                )
+            if instance.dependencies is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{instrument.name} has no dependency {dep}",
+                )
+            try:
+                instance.map_dependency(dep, the_dep)
+            except ValueError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{instrument.name} has no dependency {dep}",
+                )
 
-            # Add the dependency to the instrument
-            the_dep = target.variables[meta["variable"]]
-            program_instrument.dependencies.map_dependency(meta["variable"], the_dep)
+    try:
+        return Program(
+            filename,
+            instruments=program_instruments,
+            mode="SequentialMode",
+        )
+    except DuplicateNameError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": str(e), "collisions": e.collisions},
+        )
+    except DependencyError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    filename = f"CSI_LoggerNet_{str(dt.date.today()).replace('-', '')}.CR1X"
-    program = Program(
-        filename,
-        instruments=program_instruments,
-        mode="SequentialMode",
-    )
 
-    stream = io.StringIO(program.construct())
+def build_source(instruments: list[schemas.ProgramInstruments], filename: str) -> str:
+    return make_program(instruments, filename).construct()
+
+
+def build_chunks(
+    instruments: list[schemas.ProgramInstruments], filename: str
+) -> Iterator[str]:
+    return make_program(instruments, filename).iter_construct()
+
+
+def program_filename() -> str:
+    return f"CSI_LoggerNet_{str(dt.date.today()).replace('-', '')}.CR1X"
+
+
+def station_dirs(stations: list[str]) -> dict[str, str]:
+    """A safe, unique directory name in the fleet archive for every station.
+
+    Anything but letters, digits, ``_``, ``-`` and ``.`` becomes ``_``, a
+    leading dot is escaped so nothing can resolve to ``.`` or ``..``, and
+    stations that end up with the same name, ignoring case, are numbered
+    ``x``, ``x_2``...
+    """
+    dirs: dict[str, str] = {}
+    # Compared case-insensitively, the archive may be unpacked on Windows.
+    taken = {"manifest.json"}
+    for station in stations:
+        base = UNSAFE_PATH_CHARS.sub("_", station)
+        if not base or base.startswith("."):
+            base = f"_{base}"
+        name, n = base, 1
+        while name.casefold() in taken:
+            n += 1
+            name = f"{base}_{n}"
+        taken.add(name.casefold())
+        dirs[station] = name
+    return dirs
+
+
+@app.post("/program")
+async def build_program(
+    instruments: Annotated[list[schemas.ProgramInstruments], Body()],
+):
+    filename = program_filename()
+    try:
+        chunks = await BUILD_POOL.stream(build_chunks, instruments, filename)
+    except BuildPoolFull as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Build queue is full, try again later. {e}",
+            headers={"Retry-After": "5"},
+        )
+
     return StreamingResponse(
-        stream,
+        chunks,
         media_type="text/plain",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
 
+@app.get("/program/pool")
+async def build_pool_stats():
+    return BUILD_POOL.stats()
+
+
+@app.post("/program/fleet")
+async def build_fleet(
+    stations: Annotated[dict[str, list[schemas.ProgramInstruments]], Body()],
+):
+    filename = program_filename()
+    dirs = station_dirs(list(stations))
+    # Don't let a single fleet fill the shared queue and starve /program.
+    limit = asyncio.Semaphore(BUILD_POOL.concurrency)
+
+    async def build_station(
+        station: str, instruments
+    ) -> tuple[str, str | None, str | None]:
+        try:
+            async with limit:
+                program = await BUILD_POOL.run(build_source, instruments, filename)
+            return station, program, None
+        except BuildPoolFull as e:
+            return station, None, f"Build queue is full. {e}"
+        except HTTPException as e:
+            return station, None, e.detail
+        except Exception as e:
+            return station, None, f"{type(e).__name__}: {e}"
+
+    async def archive():
+        zs = ZipStream()
+        manifest = {}
+        tasks = [
+            asyncio.ensure_future(build_station(station, instruments))
+            for station, instruments in stations.items()
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                station, program, error = await task
+                if error is not None:
+                    manifest[station] = {"status": "error", "error": error}
+                    continue
+
+                path = f"{dirs[station]}/{filename}"
+                manifest[station] = {"status": "ok", "file": path}
+                yield zs.add(path, program)
+
+            yield zs.add("manifest.json", json.dumps(manifest, indent=2))
+            yield zs.close()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    archive_name = filename.replace(".CR1X", ".zip")
+    return StreamingResponse(
+        archive(),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={archive_name}"},
+    )
+
+
 @app.get("/program/build")
 async def program_builder_form():
     return FileResponse("/app/app/static/index.html")
@@ -1,83 +1,70 @@
+from app import ir
 from app.functions import Variable
 
 
 class If:
-    def __init__(self, *args: str | int | float | Variable, logic: str | list[str]):
-        self.initial_condition = self._join_if_logic(*args, is_initial=True)
-        self.else_ifs = []
-        self.else_logic = None
-        self.logic = logic
+    def __init__(self, *args: str | int | float | Variable, logic: ir.Code):
+        self.condition = self._join_condition(*args)
+        self.logic = ir.as_block(logic)
+        self.else_ifs: list[tuple[str, ir.Block]] = []
+        self.else_logic: ir.Block | None = None
 
     @staticmethod
-    def _join_if_logic(*args: str | int | float | Variable, is_initial: bool = True):
-        if is_initial:
-            return f"If {' '.join(str(x) for x in args)} Then"
-        return f"ElseIf {' '.join(str(x) for x in args)} Then"
+    def _join_condition(*args: str | int | float | Variable) -> str:
+        return " ".join(str(x) for x in args)
 
-    def ElseIf(self, *args: str | int | float, logic: str | list[str]):
-        if isinstance(logic, str):
-            logic = [logic]
-        self.else_ifs.append(
-            f"{self._join_if_logic(*args, is_initial=False)}\n{'\n    '.join(x for x in logic)}"
-        )
-        return self
+    @property
+    def initial_condition(self) -> str:
+        return f"If {self.condition} Then"
 
-    def Else(self, logic: str | list[str]):
-        if isinstance(logic, str):
-            logic = [logic]
-        logic = "\n    ".join(x for x in logic)
-        self.else_logic = f"Else\n    {logic}"
+    def ElseIf(self, *args: str | int | float, logic: ir.Code):
+        self.else_ifs.append((self._join_condition(*args), ir.as_block(logic)))
         return self
 
-    def __str__(self):
-        code = [self.initial_condition]
-        if isinstance(self.logic, str):
-            self.logic = [self.logic]
-        elif isinstance(self.logic, If):
-            self.logic = str(self.logic)
-        elif isinstance(self.logic, For):
-            self.logic = str(self.logic)
-
-        code.append(f"    {'\n    '.join(x for x in self.logic)}")
-
-        for elseif in self.else_ifs:
-            code.append(elseif)
+    def Else(self, logic: ir.Code):
+        self.else_logic = ir.as_block(logic)
+        return self
 
-        if self.else_logic:
-            code.append(self.else_logic)
+    def to_ir(self) -> ir.If:
+        return ir.If(self.condition, self.logic, list(self.else_ifs), self.else_logic)
 
-        code.append("EndIf")
-        return "\n".join(code)
+    def __str__(self):
+        return ir.render(self)
 
     def __eq__(self, other: "If") -> bool:
-        return self.initial_condition == other.initial_condition
+        return self.condition == other.condition
 
     def __add__(self, other: "If") -> "If":
         assert self == other, (
             "The two If objects are not equal. They must have identical If conditions."
         )
-        self.logic = f"{self.logic}\n    {other.logic}"
+        self.logic = self.logic + other.logic
         return self
 
 
 class For:
     def __init__(
         self,
-        logic: str,
+        logic: ir.Code,
         v: Variable,
         start: int | Variable,
         end: int | Variable,
         step: int | None = None,
     ):
-        self.logic = logic
+        self.logic = ir.as_block(logic)
         self.v = v
         self.start = start
         self.end = end
         self.step = step
 
+    def to_ir(self) -> ir.For:
+        return ir.For(
+            str(self.v),
+            str(self.start),
+            str(self.end),
+            self.logic,
+            str(self.step) if self.step else None,
+        )
+
     def __str__(self):
-        formatted_logic = "\n".join(f"    {line}" for line in self.logic.splitlines())
-        first_line = f"For {self.v}={self.start} To {self.end}"
-        if self.step:
-            first_line += f" Step {self.step}"
-        return f"{first_line}\n{formatted_logic}\nNext {self.v}"
+        return ir.render(self)
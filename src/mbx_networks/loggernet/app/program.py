@@ -1,17 +1,20 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date
 import re
 
+from app import ir, symbols
+from app.graph import DependencyGraph, bind_dependencies, label
+from app.symbols import DuplicateNameError, SymbolTable, find_duplicates
 from app.instruments import (
     Instrument,
     Table,
+    TableItem,
     Acclima_TDR310N,
     Scan,
     SlowSequence,
 )
-from app.functions import VarType
-from typing import Callable, Literal
-from textwrap import indent
+from app.functions import Variable, VarType
+from typing import Callable, Iterator, Literal
 
 
 @dataclass
@@ -24,6 +27,7 @@ class Program:
     tables: list[Table] = field(init=False)
     functions: list[str] = field(init=False)
     slow_sequence: list[SlowSequence] = field(init=False)
+    symbols: SymbolTable = field(init=False, repr=False)
 
     transform: Callable[["Program"], "Program"] | None = None
 
@@ -31,11 +35,23 @@ class Program:
         if self.transform is not None:
             self._transform()
 
-        self.__find_tables()
-        self.__find_functions()
-        self.__group_slow_sequence()
         self.__check_unique_names()
         self.__validate_dependencies()
+        self.symbols = SymbolTable()
+        for instrument in self.instruments:
+            for v in instrument.variables.values():
+                self.symbols.add(v)
+
+        # Variables in the instruments' code are references into the symbol
+        # table until the program is emitted, so renaming doesn't rebuild it.
+        with self.symbols.capture():
+            self.__find_tables()
+            self.__find_functions()
+            self.__group_slow_sequence()
+            self._sections = {
+                name: [self.instruments[n].section(name) for n in self._order]
+                for name in ("pre_scan", "program", "post_scan")
+            }
 
     def _transform(self):
         self.transform(self)
@@ -51,12 +67,17 @@ class Program:
 
         self.functions = list(functions)
 
-    # TODO: Implement logic to make sure if an instruemnt has a dependency,
-    # that the dependency indeed exists.
-    def __validate_dependencies(self): ...
+    def __validate_dependencies(self):
+        bind_dependencies(self.instruments)
+        graph = DependencyGraph.build(self.instruments)
+        # Code that reads another instrument's variable comes after the code
+        # that sets it. Only the code is reordered: declarations and table
+        # columns keep the order the instruments were given in, so the
+        # logger's data files keep their layout.
+        self._order = graph.order()
 
     def __find_tables(self):
-        tables = {}
+        tables: dict[str, tuple[Table, list[TableItem]]] = {}
         for instrument in self.instruments:
             try:
                 tabs = instrument.tables
@@ -64,16 +85,27 @@ class Program:
                 continue
 
             for table in tabs:
-                if table.name in tables and tables[table.name] != table:
+                if table.name in tables and tables[table.name][0] != table:
                     raise AttributeError(
                         f"More than one table named {table.name} exist, but have settings that don't match. Make sure that all tables named {table.name} share the same settings."
                     )
                 if table.name in tables:
-                    tables[table.name].table_items += table.table_items
+                    tables[table.name][1].extend(table.table_items)
                 else:
-                    tables[table.name] = table
-
-        self.tables = list(tables.values())
+                    tables[table.name] = (table, list(table.table_items))
+
+        # Merged into new tables, the instruments' own tables are left untouched.
+        self.tables = [
+            Table(
+                table.name,
+                *items,
+                trig_var=table.trig_var,
+                size=table.size,
+                data_interval=table.data_interval,
+                card_out=table.card_out,
+            )
+            for table, items in tables.values()
+        ]
 
     def __group_slow_sequence(self):
         ss: dict[str, SlowSequence] = {}
@@ -82,97 +114,100 @@ class Program:
             try:
                 if i := instrument.slow_sequence:
                     if i.id in ss:
-                        target = ss[i.id]
-                        target.logic = f"{target.logic}\n{i.logic}"
+                        ss[i.id].logic.extend(i.logic)
                     else:
-                        ss[i.id] = i
+                        ss[i.id] = SlowSequence(i.id, i.scan, ir.Block(list(i.logic)))
             except NotImplementedError:
                 continue
 
-        self.slow_sequence = "\n\n".join(str(x) for x in ss.values())
+        self.slow_sequence = list(ss.values())
 
     def __check_unique_names(self):
-        keys = []
-        for instrument in self.instruments:
-            for k, v in instrument.variables.items():
-                val = v.rename_to or k
-                if val in keys:
-                    raise ValueError(
-                        f"Variable name {val} is duplicated. Please define a name transform function or change in the instrument's configuration."
-                    )
-                else:
-                    keys.append(val)
+        collisions = find_duplicates(
+            (v.rename_to or k, label(n, i))
+            for n, i in enumerate(self.instruments, 1)
+            for k, v in i.variables.items()
+        )
+        if collisions:
+            raise DuplicateNameError(
+                collisions,
+                "Please define a name transform function or change in the instrument's configuration.",
+            )
+
+    def rename(self, name: str, new_name: str) -> Variable:
+        """Rename a variable everywhere it's declared and used.
+
+        Only the symbol table changes, the next ``construct`` picks the new
+        name up.
+        """
+        return self.symbols.rename(name, new_name)
 
     def construct(self) -> str:
-        s = f"'{self.name}\n'Program Created on: {date.today()}\n\n"
-        s += "'SYSTEM CONFIGURATION\n"
-        s += "\n".join(
+        return "".join(self.iter_construct())
+
+    def iter_construct(self) -> Iterator[str]:
+        """Yield the program source a section at a time.
+
+        Joining the chunks gives the same result as ``construct``, but nothing
+        larger than a single section is ever held in memory.
+        """
+        for chunk in self._iter_chunks():
+            yield self.symbols.resolve(chunk)
+
+    def _iter_chunks(self) -> Iterator[str]:
+        yield f"'{self.name}\n'Program Created on: {date.today()}\n\n"
+        yield "'SYSTEM CONFIGURATION\n"
+        yield "\n".join(
             f"'{x.type}: {x.manufacturer} {x.model}" for x in self.instruments
         )
-        s += "\n\n'Wiring Diagram\n"
+        yield "\n\n'Wiring Diagram\n"
         for i in self.instruments:
             if i.wires is not None:
-                s += f"'####{i.model} Wiring####\n"
-                s += str(i.wires) + "\n\n"
+                yield f"'####{i.model} Wiring####\n{i.wires}\n\n"
 
         for i in self.instruments:
-            for v in i.variables.values():
-                if v.var_type != VarType.FIELD_ONLY:
-                    s += v.declaration_str() + "\n"
+            yield "".join(
+                f"{v.declaration_str()}\n"
+                for v in i.variables.values()
+                if v.var_type != VarType.FIELD_ONLY
+            )
 
-        s += "\n"
+        yield "\n"
         if self.preserve_variables:
-            s += "PreserveVariables\n"
+            yield "PreserveVariables\n"
 
-        s += f"{self.mode}\n"
+        yield f"{self.mode}\n"
 
         for table in self.tables:
-            s += str(table) + "\n\n"
+            yield f"{table}\n\n"
 
         if self.functions:
-            s += "\n".join(self.functions)
-            s += "\n"
+            yield "\n".join(self.functions) + "\n"
 
-        s += "BeginProg\n"
+        yield "BeginProg\n"
 
-        for i in self.instruments:
-            try:
-                if ps := i.pre_scan:
-                    s += indent(ps, "    ")
-                    s += "\n\n"
-            except NotImplementedError:
-                continue
-
-        s += f"    {str(self.scan)}\n\n"
-
-        for i in self.instruments:
-            try:
-                if pr := i.program:
-                    s += indent(pr, "        ")
-                    s += "\n\n"
-            except NotImplementedError:
-                continue
+        for ps in self._sections["pre_scan"]:
+            if ps:
+                yield ir.render(ps, 1) + "\n\n"
 
-        calltable = "\n".join([f"CallTable {x.name}" for x in self.tables])
+        yield f"    {str(self.scan)}\n\n"
 
-        s += indent(calltable, "        ")
-        s += "\n\n"
+        for pr in self._sections["program"]:
+            if pr:
+                yield ir.render(pr, 2) + "\n\n"
 
-        for i in self.instruments:
-            try:
-                if ps := i.post_scan:
-                    s += indent(ps, "    ")
-                    s += "\n\n"
-            except NotImplementedError:
-                continue
+        calltable = [ir.Statement(f"CallTable {x.name}") for x in self.tables]
+        yield ir.render(calltable, 2) + "\n\n"
 
-        s += "    NextScan\n\n"
+        for ps in self._sections["post_scan"]:
+            if ps:
+                yield ir.render(ps, 1) + "\n\n"
 
-        s += indent(self.slow_sequence, "    ")
+        yield "    NextScan\n\n"
 
-        s += "\n\nEndProg"
+        yield "\n\n".join(ir.render(x, 1) for x in self.slow_sequence)
 
-        return s
+        yield "\n\nEndProg"
 
 
 def elev_sdi12_rename(
@@ -206,8 +241,27 @@ def soil_slow_seq_match(p: Program) -> None:
 
     if probes:
         first: Acclima_TDR310N = probes.pop(0)
-        ss_logic = first.slow_sequence.logic
-        for probe in probes:
-            if ss_logic == (new_logic := probe.slow_sequence.logic):
-                ss_logic += new_logic
+        # Merge as references, so renaming the probes' variables later still
+        # reaches the shared slow sequence.
+        with symbols.collecting():
+            ss = first.slow_sequence
+            # Copies of the first probe's If blocks, to append the others to.
+            logic = ir.Block(
+                [
+                    replace(x, body=ir.Block(list(x.body)))
+                    if isinstance(x, ir.If)
+                    else x
+                    for x in ss.logic
+                ]
+            )
+            ifs = {x.condition: x for x in logic if isinstance(x, ir.If)}
+            merged = []
+            for probe in probes:
+                new_logic = probe.slow_sequence.logic
+                if all(isinstance(x, ir.If) and x.condition in ifs for x in new_logic):
+                    for x in new_logic:
+                        ifs[x.condition].body.extend(x.body)
+                    merged.append(probe)
+            first.slow_sequence = SlowSequence(ss.id, ss.scan, logic)
+        for probe in merged:
             probe.slow_sequence = None
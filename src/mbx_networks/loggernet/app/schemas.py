@@ -1,12 +1,19 @@
+from app.functions import FUNCTIONS
 from app.instruments import INSTRUMENTS, WireOptions
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 from typing import Literal
+import re
 
 ValidInstruments = Enum(
     "ValidInstruments", dict((v._id, v._id) for v in INSTRUMENTS.values())
 )
 
+ValidFunctions = Enum("ValidFunctions", dict((k, k) for k in FUNCTIONS))
+
+# SDI-12 addresses are a single character: 0-9, A-Z or a-z.
+SDI12_ADDRESS = re.compile(r"[0-9A-Za-z]")
+
 
 class NamesOnly(BaseModel):
     names_only: bool = Field(
@@ -19,7 +26,7 @@ class ProgramInstruments(BaseModel):
     name: str = Field(description="Name of the instrument")
     elevation: int | None = Field(description="The sensor's elevation in cm.")
     sdi12_address: int | str | None = Field(
-        "The sensor's SDI12 address (if it is an SDI12 instrument)."
+        None, description="The sensor's SDI12 address (if it is an SDI12 instrument)."
     )
     var_name_inclusion: Literal["sdi12", "elevation", "both", "none"] = Field(
         "Whether to include sensor metadata in the variable name"
@@ -30,3 +37,14 @@ class ProgramInstruments(BaseModel):
     dependencies: dict[str, dict[str, str]] | None = Field(
         "A dictionary defining the variable dependencies of this instrument."
     )
+
+    @field_validator("sdi12_address")
+    @classmethod
+    def check_sdi12_address(cls, v: int | str | None) -> str | None:
+        if v is None:
+            return None
+        if not SDI12_ADDRESS.fullmatch(v := str(v)):
+            raise ValueError(
+                f"{v!r} is not an SDI-12 address, use a single character 0-9, A-Z or a-z."
+            )
+        return v
@@ -0,0 +1,241 @@
+"""Program-wide symbol table.
+
+While code is being collected (``collecting``) or a ``SymbolTable`` is
+capturing, formatting a ``Variable`` doesn't bake its name into the code. It
+produces a reference to the variable itself, which any table holding the
+variable resolves to its current name when the program is emitted. Renaming a
+variable is then a table update followed by a re-emit, and code built once is
+valid in every program and outside of one: it's never rebuilt for a new name.
+"""
+
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy
+from enum import Enum
+from typing import TYPE_CHECKING, Hashable, Iterable, Iterator, TypeVar
+
+if TYPE_CHECKING:
+    from app.functions import Variable
+
+_CAPTURING: ContextVar[SymbolTable | None] = ContextVar("symbols", default=None)
+# The variables referenced by the code being collected, by id().
+_COLLECTING: ContextVar[dict[int, Variable] | None] = ContextVar(
+    "references", default=None
+)
+# References are the variable's id(). Control characters never show up in
+# CRBasic, so they can't clash with code.
+_REFERENCE = re.compile(r"\x00(\d+)\x00|\x01(\d+)\x01")
+_DIMENSIONS = re.compile(r"\(.*\)$")
+
+Owner = TypeVar("Owner", bound=Hashable)
+T = TypeVar("T")
+
+
+class DuplicateNameError(ValueError):
+    """Raised with every duplicated name and the owners that declare it."""
+
+    def __init__(self, collisions: dict[str, list], hint: str = ""):
+        self.collisions = collisions
+        listed = "; ".join(
+            f"{name} ({', '.join(str(x) for x in owners)})"
+            for name, owners in collisions.items()
+        )
+        super().__init__(f"Duplicated variable names: {listed}. {hint}".strip())
+
+
+def find_duplicates(names: Iterable[tuple[str, Owner]]) -> dict[str, list[Owner]]:
+    """Find every name declared more than once, in a single pass.
+
+    Args:
+        names (Iterable[tuple[str, Owner]]): Pairs of a name and whatever
+            declared it.
+
+    Returns:
+        dict[str, list[Owner]]: Each duplicated name and all of its owners.
+    """
+    owners: dict[str, list[Owner]] = {}
+    for name, owner in names:
+        owners.setdefault(name, []).append(owner)
+    return {k: v for k, v in owners.items() if len(v) > 1}
+
+
+@contextmanager
+def _capturing(table: SymbolTable | None) -> Iterator[None]:
+    token = _CAPTURING.set(table)
+    try:
+        yield
+    finally:
+        _CAPTURING.reset(token)
+
+
+@contextmanager
+def _collecting(refs: dict[int, Variable] | None) -> Iterator[None]:
+    token = _COLLECTING.set(refs)
+    try:
+        yield
+    finally:
+        _COLLECTING.reset(token)
+
+
+def current() -> SymbolTable | None:
+    """The table that is capturing, if any."""
+    return _CAPTURING.get()
+
+
+def capturing() -> bool:
+    """Whether variables currently format as references."""
+    return _COLLECTING.get() is not None or _CAPTURING.get() is not None
+
+
+@contextmanager
+def collecting() -> Iterator[dict[int, Variable]]:
+    """Format variables as references inside the block, and collect them.
+
+    Yields the variables referenced in the block by id(), including the ones
+    ``register``-ed by code built earlier and reused in the block.
+    """
+    refs: dict[int, Variable] = {}
+    with _collecting(refs):
+        yield refs
+
+
+def collected() -> dict[int, Variable] | None:
+    """The variables collected so far by the innermost ``collecting`` block."""
+    return _COLLECTING.get()
+
+
+def register(variables: dict[int, Variable]) -> None:
+    """Record that reused code references ``variables``, so whatever is being
+    collected or captured can resolve them."""
+    if (refs := _COLLECTING.get()) is not None:
+        refs.update(variables)
+    if (table := _CAPTURING.get()) is not None:
+        for v in variables.values():
+            table.add(v)
+
+
+def reference(variable: Variable, array: bool = False) -> str | None:
+    """A reference to ``variable``, None if nothing is collecting or capturing."""
+    if (refs := _COLLECTING.get()) is not None:
+        refs[id(variable)] = variable
+    elif (table := _CAPTURING.get()) is not None:
+        table.add(variable)
+    else:
+        return None
+    return f"\x01{id(variable)}\x01" if array else f"\x00{id(variable)}\x00"
+
+
+def array_name(name: str) -> str:
+    """The name of an array without its dimensions, ``x(3)`` -> ``x``."""
+    return _DIMENSIONS.sub("", name)
+
+
+def dimensions(name: str) -> str:
+    """The dimensions of an array, ``x(3)`` -> ``(3)``, empty if it has none."""
+    match = _DIMENSIONS.search(name)
+    return "" if match is None else match.group()
+
+
+def bind_aliases(variables: Iterable[Variable]) -> None:
+    """Point every alias of an array element at the array it aliases into.
+
+    ``Alias x(2) = y`` targets the ``x`` array declared among ``variables``,
+    so the alias is declared with the array's current name.
+    """
+    variables = list(variables)
+    # Only aliases have an orig_name.
+    arrays = {
+        array_name(v.name): v
+        for v in variables
+        if v.orig_name is None and dimensions(v.name)
+    }
+    for v in variables:
+        if v.orig_name is not None and dimensions(v.orig_name):
+            v.target = arrays.get(array_name(v.orig_name))
+
+
+class SymbolTable:
+    """Every variable in a program, looked up by the name it will be emitted as."""
+
+    def __init__(self):
+        self._symbols: list[Variable] = []
+        self._ids: dict[int, int] = {}
+        self._names: dict[str, Variable] = {}
+
+    def add(self, variable: Variable) -> int:
+        if (index := self._ids.get(id(variable))) is None:
+            index = self._ids[id(variable)] = len(self._symbols)
+            self._symbols.append(variable)
+            self._names.setdefault(self._name(variable), variable)
+        return index
+
+    @staticmethod
+    def _name(variable: Variable) -> str:
+        return variable.rename_to or variable.name
+
+    def __getitem__(self, name: str) -> Variable:
+        return self._names[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[Variable]:
+        return iter(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def rename(self, name: str, new_name: str) -> Variable:
+        """Emit the variable currently named ``name`` as ``new_name`` from now on.
+
+        Raises:
+            KeyError: If there's no variable named ``name``.
+            ValueError: If another variable is already named ``new_name``.
+        """
+        variable = self._names[name]
+        if new_name != name and new_name in self._names:
+            raise ValueError(
+                f"Can't rename {name} to {new_name}, a variable named {new_name} already exists."
+            )
+        del self._names[name]
+        variable.rename_to = new_name
+        self._names[new_name] = variable
+        return variable
+
+    def resolve(self, code: str) -> str:
+        """Replace the references in ``code`` with the variables' current names."""
+        if "\x00" not in code and "\x01" not in code:
+            return code
+
+        def name(match: re.Match) -> str:
+            full, array = match.groups()
+            variable = self._symbols[self._ids[int(full or array)]]
+            return str(variable) if full is not None else array_name(str(variable))
+
+        with _capturing(None), _collecting(None):
+            return _REFERENCE.sub(name, code)
+
+    def resolve_object(self, obj: T) -> T:
+        """``resolve`` a copy of built code: strings, lists and tuples of
+        them, and the attributes of objects such as tables and IR nodes."""
+        if isinstance(obj, str):
+            return self.resolve(obj)
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(self.resolve_object(x) for x in obj)
+        if hasattr(obj, "__dict__") and not isinstance(obj, (type, Enum)):
+            new = copy(obj)
+            new.__dict__.update(
+                {k: self.resolve_object(v) for k, v in vars(obj).items()}
+            )
+            return new
+        return obj
+
+    @contextmanager
+    def capture(self) -> Iterator[SymbolTable]:
+        """Format variables as references inside the block, and add the
+        variables referenced by reused code to this table."""
+        with _capturing(self):
+            yield self
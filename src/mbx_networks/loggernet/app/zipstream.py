@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import io
+import zipfile
+
+
+class _Sink(io.RawIOBase):
+    """Write-only, unseekable buffer that ``zipfile`` streams into."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        self._position += len(b)
+        return len(b)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+class ZipStream:
+    """Builds a zip archive incrementally, handing back bytes as they're ready.
+
+    Because the underlying buffer can't seek, entries are written with data
+    descriptors and nothing has to be kept around once it has been returned.
+
+    Example:
+        zs = ZipStream()
+        yield zs.add("a.CR1X", program_a)
+        yield zs.add("b.CR1X", program_b)
+        yield zs.close()
+    """
+
+    def __init__(self, compression: int = zipfile.ZIP_DEFLATED):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression)
+
+    def add(self, name: str, data: str | bytes) -> bytes:
+        self._zip.writestr(name, data)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._zip.close()
+        return self._sink.drain()
@@ -0,0 +1,77 @@
+"""Benchmark the start-up cost of importing the CRBasic function catalog.
+
+Each measurement runs in a fresh interpreter and reports the import time and
+the peak resident memory above a bare interpreter. ``eager`` loads every
+function module, which is what the old single ``functions.py`` cost at import.
+``lazy`` only loads the functions ``app.instruments`` calls.
+
+Run from the loggernet directory:
+
+    python scripts/bench_functions_import.py --runs 20
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, resource, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "maxrss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+BODIES = {
+    "bare": "pass",
+    "eager": (
+        "import app.functions as f\n"
+        "from app.functions._index import FUNCTIONS\n"
+        "for name in FUNCTIONS: getattr(f, name)"
+    ),
+    "lazy": "import app.functions as f\nfor name in {used}: getattr(f, name)",
+}
+
+
+def used_functions(root: str) -> list[str]:
+    with open(os.path.join(root, "app", "instruments.py")) as f:
+        return sorted(set(re.findall(r"functions\.(\w+)\(", f.read())))
+
+
+def measure(body: str, root: str) -> dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD.format(body=body)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=root,
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    used = used_functions(root)
+    results = {
+        mode: [measure(body.format(used=used), root) for _ in range(args.runs)]
+        for mode, body in BODIES.items()
+    }
+    bare_rss = statistics.median(x["maxrss"] for x in results.pop("bare"))
+
+    print(f"{'mode':<8}{'import ms':>12}{'rss KiB':>12}")
+    for mode, runs in results.items():
+        ms = statistics.median(x["seconds"] for x in runs) * 1000
+        rss = statistics.median(x["maxrss"] for x in runs) - bare_rss
+        print(f"{mode:<8}{ms:>12.1f}{rss:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
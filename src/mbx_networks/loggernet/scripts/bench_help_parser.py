@@ -0,0 +1,82 @@
+"""Benchmark the BeautifulSoup backends used to parse the CRBasic help pages.
+
+Parses every page in a help page cache (``_get_functions.py --cache``) with
+each available backend, reports the time per page and checks that every
+backend produces the same function definitions.
+
+Run from the loggernet directory:
+
+    python scripts/bench_help_parser.py --cache app/fixtures/help_pages
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "app")]
+
+from _get_functions import module_source, parse_function_def  # noqa: E402
+
+BACKENDS = ["html.parser", "lxml"]
+
+
+def load_pages(cache: str) -> list[tuple[str, str, str]]:
+    pages = []
+    for name in sorted(os.listdir(cache)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(cache, name)) as f:
+            meta = json.load(f)
+        if meta["status_code"] != 200:
+            continue
+        page = name.removesuffix(".json")
+        with open(os.path.join(cache, page), encoding="utf-8") as f:
+            pages.append((page.removesuffix(".htm"), meta["url"], f.read()))
+    return pages
+
+
+def run(pages: list[tuple[str, str, str]], parser: str) -> list[str]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        fun_defs = [parse_function_def(*page, parser) for page in pages]
+    return [f"{module_source(x)}\n{x.doc}" if x is not None else "" for x in fun_defs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--cache", default=os.path.join(ROOT, "app", "fixtures", "help_pages")
+    )
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = load_pages(args.cache)
+    print(f"{len(pages)} pages, {args.rounds} rounds")
+    print(f"{'backend':<14}{'ms/page':>10}")
+
+    outputs = {}
+    for backend in BACKENDS:
+        try:
+            outputs[backend] = run(pages, backend)
+        except Exception as e:  # bs4.FeatureNotFound when lxml isn't installed
+            print(f"{backend:<14}{'unavailable':>10} ({e})")
+            continue
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            run(pages, backend)
+        elapsed = time.perf_counter() - start
+        print(f"{backend:<14}{elapsed / args.rounds / len(pages) * 1000:>10.2f}")
+
+    reference, *others = outputs.values()
+    for backend, output in zip(list(outputs)[1:], others):
+        if output != reference:
+            print(f"{backend} output differs from {BACKENDS[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Count how often instrument sections are built during a program build.
+
+Builds a station program, emits it twice and describes every instrument with
+``to_json``. ``Instrument.section_builds`` counts how many times each section
+was actually built, which should be once: the program and ``to_json`` share
+the same build. Sections no instrument in the station defines show ``-``.
+Also reports the time per build.
+
+Run from the loggernet directory:
+
+    python scripts/bench_program_build.py --builds 50
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.instruments import (  # noqa: E402
+    SECTIONS,
+    Acclima_TDR310N,
+    CR1000X_Battery,
+    CR1000X_PanelTemp,
+    EnviroCams_iPatrol,
+    OTT_Pluvio,
+    RMYoung_05108_77,
+    Sierra_RV50X,
+)
+from app.program import Program, elev_sdi12_rename  # noqa: E402
+
+
+def station() -> Program:
+    battery = CR1000X_Battery()
+    camera = EnviroCams_iPatrol()
+    modem = Sierra_RV50X()
+    for dependent in (camera, modem):
+        dependent.map_dependency("batt_volt", battery.variables["batt_volt"])
+        dependent.map_dependency(
+            "shutoff_voltage", battery.variables["shutoff_voltage"]
+        )
+    soil = [
+        Acclima_TDR310N(
+            elevation=elevation,
+            sdi12_address=address,
+            transform=lambda x: elev_sdi12_rename(x, "both"),
+        )
+        for elevation, address in [(5, "1"), (10, "2")]
+    ]
+    instruments = [RMYoung_05108_77(), battery, CR1000X_PanelTemp(), *soil]
+    instruments += [OTT_Pluvio(sdi12_address="3"), camera, modem]
+    return Program("station", instruments)
+
+
+def build() -> Program:
+    program = station()
+    program.construct()
+    program.construct()
+    for instrument in program.instruments:
+        instrument.to_json()
+        instrument.to_json()
+    return program
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--builds", type=int, default=50)
+    args = parser.parse_args()
+
+    program = build()
+    print(f"{'section':<15}{'max builds/instrument':>22}")
+    for name in SECTIONS:
+        builds = Counter(i.section_builds[name] for i in program.instruments)
+        print(f"{name:<15}{max(builds) or '-':>22}")
+
+    start = time.perf_counter()
+    for _ in range(args.builds):
+        build()
+    elapsed = time.perf_counter() - start
+    print(f"\n{elapsed / args.builds * 1000:.2f} ms per build")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark the memory and construction time of ``functions.Variable``.
+
+Builds a fleet of stations, each declaring every variable of every
+instrument in ``app.instruments``, with the slotted ``Variable`` and with a
+copy of the previous plain dataclass (``legacy``). Names are copied for every
+station, the way they arrive when they're built by f-strings or read from a
+request, so interning is part of what gets measured.
+
+Run from the loggernet directory:
+
+    python scripts/bench_variable.py --stations 200
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.functions import DataType, Variable, VarType  # noqa: E402
+from app.instruments import INSTRUMENTS  # noqa: E402
+
+
+@dataclass
+class LegacyVariable:
+    name: str
+    var_type: VarType
+    data_type: DataType | None = None
+    value: str | int | float | None = None
+    units: str | None = None
+    rename_to: str | None = None
+    meta: dict[str, Any] = field(init=False)
+
+    def __post_init__(self):
+        self.meta = {}
+        if self.var_type == VarType.CONST and self.value is None:
+            raise ValueError("When defining a Const type, value must not be none.")
+        if self.var_type == VarType.ALIAS:
+            assert self.value is not None, (
+                "When defining an Alias, a value must be defined."
+            )
+            self.meta["orig_name"] = self.name
+            self.name = self.value
+
+
+CLASSES = {"legacy": LegacyVariable, "slotted": Variable}
+
+
+def station_spec() -> list[tuple]:
+    spec = []
+    for instrument in INSTRUMENTS.values():
+        for v in instrument(elevation=1, sdi12_address=1).variables.values():
+            name = v.name if v.orig_name is None else v.orig_name
+            spec.append((name, v.var_type, v.data_type, v.value, v.units))
+    return spec
+
+
+def copy(s: Any) -> Any:
+    return "".join(list(s)) if isinstance(s, str) else s
+
+
+def build(cls: type, spec: list[tuple], stations: int) -> list[list]:
+    return [[cls(*(copy(x) for x in args)) for args in spec] for _ in range(stations)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    spec = station_spec()
+    count = len(spec) * args.stations
+    print(f"{args.stations} stations, {count} variables")
+    print(f"{'class':<10}{'bytes/var':>12}{'us/var':>10}")
+
+    for label, cls in CLASSES.items():
+        tracemalloc.start()
+        fleet = build(cls, spec, args.stations)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del fleet
+
+        best = float("inf")
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            build(cls, spec, args.stations)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<10}{size / count:>12.0f}{best / count * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.builds import BuildPool, BuildPoolFull
+
+
+def chunks(n: int):
+    return (f"chunk {i}\n" for i in range(n))
+
+
+def fail():
+    raise ValueError("bad program")
+
+
+async def started(**kwargs) -> BuildPool:
+    pool = BuildPool(**kwargs)
+    await pool.start()
+    return pool
+
+
+def test_stream_yields_chunks_as_they_are_read():
+    async def main():
+        pool = await started(concurrency=1)
+        stream = await pool.stream(chunks, 3)
+        assert await anext(stream) == "chunk 0\n"
+        assert pool.running == 1
+        assert [x async for x in stream] == ["chunk 1\n", "chunk 2\n"]
+        assert (pool.running, pool.completed) == (0, 1)
+        await pool.close()
+
+    asyncio.run(main())
+
+
+def test_closing_a_stream_frees_its_slot():
+    async def main():
+        pool = await started(concurrency=1)
+        stream = await pool.stream(chunks, 3)
+        await anext(stream)
+        await stream.aclose()
+        assert (pool.running, pool.cancelled) == (0, 1)
+        assert await pool.run(sum, [1, 2]) == 3
+        await pool.close()
+
+    asyncio.run(main())
+
+
+def test_stream_raises_build_errors_before_streaming():
+    async def main():
+        pool = await started(concurrency=1)
+        with pytest.raises(ValueError, match="bad program"):
+            await pool.stream(fail)
+        assert (pool.running, pool.failed) == (0, 1)
+        await pool.close()
+
+    asyncio.run(main())
+
+
+def test_full_queue_rejects_builds():
+    async def main():
+        pool = await started(concurrency=1, queue_limit=0)
+        stream = await pool.stream(chunks, 1)
+        with pytest.raises(BuildPoolFull):
+            await pool.run(sum, [])
+        assert pool.rejected == 1
+        await stream.aclose()
+        await pool.close()
+
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+import asyncio
+import io
+import os
+
+from app import compiler
+from app.compiler import (
+    CompileCache,
+    CompileDaemonPool,
+    CompilePool,
+    CompileResult,
+    StagedProgram,
+    cache_key,
+    stage_upload,
+)
+
+# Stands in for check_compile: reports its display while other compiles run.
+CHECK_COMPILE = """#!/bin/sh
+sleep 0.2
+echo "display $COMPILE_DISPLAY"
+echo "Compiled in 1 ms"
+"""
+
+
+def test_concurrent_compiles_get_their_own_display(tmp_path, monkeypatch):
+    script = tmp_path / "check_compile"
+    script.write_text(CHECK_COMPILE)
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(compiler, "WORKDIR", str(tmp_path))
+
+    async def main():
+        pool = CompilePool(concurrency=3)
+        results = await asyncio.gather(*(pool.compile("x.CR1X") for _ in range(6)))
+        return pool, results
+
+    pool, results = asyncio.run(main())
+
+    assert all(x.status == "succeeded" for x in results)
+    displays = [x.output.split()[1] for x in results]
+    assert set(displays) == {str(compiler.COMPILE_DISPLAY + i) for i in range(3)}
+    # The first three ran at the same time.
+    assert len(set(displays[:3])) == 3
+    assert len(pool._displays) == 3
+
+
+PROGRAM = "BeginProg\n    Scan(1,Sec,0,0)\n    NextScan\nEndProg\n"
+
+
+async def daemon_pool(root, **kwargs) -> CompileDaemonPool:
+    pool = CompileDaemonPool(fake=True, root=str(root), **kwargs)
+    await pool.start()
+    return pool
+
+
+def program(tmp_path, text: str = PROGRAM, name: str = "program.CR1X") -> str:
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def gone(worker) -> bool:
+    try:
+        os.killpg(worker.proc.pid, 0)
+    except ProcessLookupError:
+        return True
+    return False
+
+
+def test_daemon_pool_compiles(tmp_path):
+    async def main():
+        pool = await daemon_pool(tmp_path, workers=2)
+        try:
+            ok, bad = await asyncio.gather(
+                pool.compile(program(tmp_path)),
+                pool.compile(program(tmp_path, "BeginProg\n", "bad.CR1X")),
+            )
+        finally:
+            await pool.close()
+        return pool, ok, bad
+
+    pool, ok, bad = asyncio.run(main())
+
+    assert ok.status == "succeeded"
+    assert bad.status == "failed"
+    assert "EndProg not found" in bad.output
+    assert pool.completed == 2
+
+
+def test_daemon_pool_respawns_timed_out_worker(tmp_path, monkeypatch):
+    monkeypatch.setenv("FAKE_COMPILE_DELAY", "5")
+
+    async def main():
+        pool = await daemon_pool(tmp_path, workers=1, timeout=0.5)
+        try:
+            timed_out = await pool.compile(program(tmp_path))
+            # The replacement starts once the pool gets control back, without
+            # the delay.
+            monkeypatch.setenv("FAKE_COMPILE_DELAY", "0")
+            await asyncio.gather(*pool._respawning)
+            result = await pool.compile(program(tmp_path))
+        finally:
+            await pool.close()
+        return pool, timed_out, result
+
+    pool, timed_out, result = asyncio.run(main())
+
+    assert timed_out.status == "error"
+    assert "timed out" in timed_out.output
+    assert (pool.timeouts, pool.restarts) == (1, 1)
+    assert result.status == "succeeded"
+
+
+def test_daemon_pool_close_stops_busy_workers(tmp_path, monkeypatch):
+    monkeypatch.setenv("FAKE_COMPILE_DELAY", "5")
+
+    async def main():
+        pool = await daemon_pool(tmp_path, workers=2)
+        job = asyncio.create_task(pool.compile(program(tmp_path)))
+        while pool._idle.qsize() > 1:
+            await asyncio.sleep(0.01)
+        await pool.close()
+        return pool, await job
+
+    pool, result = asyncio.run(main())
+
+    assert result.status == "error"
+    assert not pool._respawning
+    assert pool.restarts == 0
+    assert all(gone(x) for x in pool._workers)
+
+
+def test_cache_hits_show_the_requesters_file():
+    cache = CompileCache()
+    first = StagedProgram("/dev/shm/compile-a1/first.CR1X", "key", 10)
+    second = StagedProgram("/dev/shm/compile-b2/second.CR1X", "key", 10)
+    cache.put(
+        first,
+        CompileResult(
+            "failed",
+            "Z:\\dev\\shm\\compile-a1\\first.CR1X\n"
+            "first.CR1X -- line 3: Error: first.CR1Xb undeclared",
+        ),
+    )
+
+    assert cache.get(second).output == (
+        "Z:\\dev\\shm\\compile-b2\\second.CR1X\n"
+        "second.CR1X -- line 3: Error: first.CR1Xb undeclared"
+    )
+
+
+class FakeUpload:
+    def __init__(self, filename: str, data: bytes):
+        self.filename = filename
+        self._data = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+
+def test_stage_upload_copies_and_hashes(tmp_path, monkeypatch):
+    monkeypatch.setattr(compiler, "COMPILE_SCRATCH", str(tmp_path))
+    data = PROGRAM.encode() * 1000
+
+    async def main():
+        async with stage_upload(FakeUpload("../up.CR1X", data), 4096) as staged:
+            with open(staged.path, "rb") as f:
+                return staged, f.read()
+
+    staged, staged_data = asyncio.run(main())
+
+    assert os.path.basename(staged.path) == "up.CR1X"
+    assert staged_data == data
+    assert staged.size == len(data)
+    assert staged.key == cache_key(data)
+    assert not os.path.exists(staged.path)
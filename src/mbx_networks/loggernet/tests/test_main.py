@@ -0,0 +1,77 @@
+import pytest
+from fastapi import HTTPException
+
+from app.instruments import INSTRUMENTS
+from app.main import make_program
+from app.schemas import ProgramInstruments
+
+
+def instrument(name, dependencies=None):
+    wires = INSTRUMENTS[name]().wires
+    return ProgramInstruments(
+        name=name,
+        elevation=None,
+        var_name_inclusion="none",
+        wiring={x.wire: x.port for x in wires.args} if wires else {},
+        dependencies=dependencies,
+    )
+
+
+def test_make_program_maps_dependencies():
+    battery = {"_id": "cr1000x_charge", "variable": "batt_volt"}
+    program = make_program(
+        [
+            instrument("cr1000x_charge"),
+            instrument("envirocams_ipatrol", {"batt_volt": battery}),
+        ],
+        "test",
+    )
+
+    assert "Camera_Power" in program.construct()
+
+
+@pytest.mark.parametrize(
+    "dependencies, message",
+    [
+        ({"batt_volt": {"_id": "cr1000x_charge"}}, "needs an _id and a variable"),
+        (
+            {"batt_volt": {"_id": "campbell_cs215", "variable": "air_temp"}},
+            "Could not find dependency campbell_cs215",
+        ),
+        (
+            {"batt_volt": {"_id": "cr1000x_charge", "variable": "nope"}},
+            "cr1000x_charge has no variable nope",
+        ),
+        (
+            {"solar": {"_id": "cr1000x_charge", "variable": "batt_volt"}},
+            "envirocams_ipatrol has no dependency solar",
+        ),
+    ],
+)
+def test_make_program_rejects_bad_dependencies(dependencies, message):
+    with pytest.raises(HTTPException) as e:
+        make_program(
+            [
+                instrument("cr1000x_charge"),
+                instrument("envirocams_ipatrol", dependencies),
+            ],
+            "test",
+        )
+
+    assert e.value.status_code == 400
+    assert message in e.value.detail
+
+
+def test_make_program_rejects_dependencies_of_instruments_without_any():
+    battery = {"_id": "cr1000x_charge", "variable": "batt_volt"}
+    with pytest.raises(HTTPException) as e:
+        make_program(
+            [
+                instrument("cr1000x_charge"),
+                instrument("cr1000x_charge", {"x": battery}),
+            ],
+            "test",
+        )
+
+    assert e.value.status_code == 400
+    assert "cr1000x_charge has no dependency x" in e.value.detail
@@ -0,0 +1,94 @@
+import re
+
+from app.instruments import (
+    Acclima_TDR310N,
+    Campbell_SnowVue10,
+    CR1000X_Battery,
+    EnviroCams_iPatrol,
+    OTT_Pluvio,
+    ProStar_EMC1,
+    Vaisala_HMP155,
+)
+from app.program import Program, elev_sdi12_rename, soil_slow_seq_match
+
+
+def test_rename_array_renames_aliases():
+    program = Program("test", [ProStar_EMC1()])
+    before = program.construct()
+    aliases = re.findall(r"^Alias ChgCntDat\((\d+)\) = (\w+)$", before, re.M)
+    assert aliases
+
+    program.rename("ChgCntDat(82)", "Chg(82)")
+    after = program.construct()
+
+    assert "Dim Chg(82) as Long" in after
+    assert "ChgCntDat" not in after
+    for index, name in aliases:
+        assert f"Alias Chg({index}) = {name}\n" in after
+
+
+def test_rename_array_renames_element_references():
+    program = Program("test", [OTT_Pluvio(sdi12_address="1")])
+    program.rename("Pluvio(9)", "Pl(9)")
+    code = program.construct()
+
+    assert "Public Pl(9)" in code
+    assert "SDI12Recorder(Pl()," in code
+    assert "Pluvio(" not in code
+
+
+def test_sections_are_built_once():
+    battery = CR1000X_Battery()
+    camera = EnviroCams_iPatrol()
+    program = Program("test", [battery, camera, OTT_Pluvio(sdi12_address="1")])
+    first = program.construct()
+    for instrument in program.instruments:
+        instrument.to_json()
+    program.rename("batt_volt", "battery_voltage")
+
+    assert program.construct() == first.replace("batt_volt", "battery_voltage")
+    for instrument in program.instruments:
+        assert max(instrument.section_builds.values()) == 1
+
+
+def test_dependencies_only_reorder_code():
+    program = Program("test", [EnviroCams_iPatrol(), CR1000X_Battery()])
+    code = program.construct()
+
+    assert [type(x) for x in program.instruments] == [
+        EnviroCams_iPatrol,
+        CR1000X_Battery,
+    ]
+    assert code.index("'IP Camera") < code.index("'Charge Data")
+    assert code.index("Public Camera_Power ") < code.index("Public batt_volt")
+    # The battery is measured before the camera decides on its power.
+    assert code.index("Battery(batt_volt)") < code.index("If Camera_Power_Manual")
+
+
+def test_dependencies_keep_table_columns():
+    program = Program("test", [Campbell_SnowVue10(sdi12_address="1"), Vaisala_HMP155()])
+    code = program.construct()
+
+    assert code.index('FieldNames("snow_depth")') < code.index('FieldNames("air_temp")')
+    assert code.index("reset_hmp155 = True") < code.index("If FileSize(")
+
+
+def test_soil_probes_share_a_slow_sequence():
+    probes = [
+        Acclima_TDR310N(
+            sdi12_address=address,
+            elevation=-10,
+            transform=lambda x: elev_sdi12_rename(x, "sdi12"),
+        )
+        for address in ("1", "2")
+    ]
+    program = Program("test", probes, transform=soil_slow_seq_match)
+    code = program.construct()
+
+    assert code.count("SlowSequence") == 1
+    assert code.count("If IfTime(") == 1
+    assert "SDI12Recorder(soil_1(5),C3,1," in code
+    assert "SDI12Recorder(soil_2(5),C3,2," in code
+
+    program.rename("soil_2(5)", "soil_b(5)")
+    assert "SDI12Recorder(soil_b(5),C3,2," in program.construct()
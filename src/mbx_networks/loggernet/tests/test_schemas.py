@@ -0,0 +1,26 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import ProgramInstruments
+
+
+def instrument(sdi12_address):
+    return ProgramInstruments(
+        name="acclima_tdr310n",
+        elevation=5,
+        sdi12_address=sdi12_address,
+        var_name_inclusion="both",
+        wiring={},
+        dependencies=None,
+    )
+
+
+@pytest.mark.parametrize("address, expected", [(1, "1"), ("a", "a"), (None, None)])
+def test_sdi12_address(address, expected):
+    assert instrument(address).sdi12_address == expected
+
+
+@pytest.mark.parametrize("address", ["", "10", "?", "ab", -1])
+def test_invalid_sdi12_address(address):
+    with pytest.raises(ValidationError):
+        instrument(address)